@@ -1,4 +1,17 @@
 import heapq
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import weighted_neighbors
+from graph_file import open_graph, parse_node
+from indexed_heap import IndexedHeap
+from landmarks import open_landmarks
+from search_stats import SearchStats
+from state_space import as_graph, as_heuristic
 
 # 🔹 Same built-in graph
 graph = {
@@ -21,46 +34,409 @@ h = {
     'F': 0
 }
 
-def a_star_search(start, goal):
+# 🔹 Weighted version of the same graph: {node: {neighbor: edge cost}}
+weighted_graph = {
+    'A': {'B': 1, 'C': 4},
+    'B': {'D': 2, 'E': 1},
+    'C': {'F': 1},
+    'D': {},
+    'E': {'F': 2},
+    'F': {}
+}
+
+def reconstruct_path(parent, goal):
+    """Follow parent pointers back from goal, then reverse -> start ... goal."""
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+def a_star_search(start, goal, graph=graph, h=h, weight=1, stats=None):
     """
     A* Search:
-    f(n) = g(n) + h(n)
-    g(n) = cost so far (here: number of steps)
+    f(n) = g(n) + weight * h(n)
+    g(n) = cost so far (sum of edge costs; 1 per edge if unweighted)
     h(n) = heuristic estimate to goal
+    weight = 1 -> normal A* (optimal if h is consistent; each node is
+                  expanded once, so an admissible but inconsistent h
+                  can return a longer path)
+    weight > 1 -> weighted A*: expands fewer nodes, and the cost found
+                  is at most `weight` times the optimal cost
+    stats : optional dict, filled with heap pushes / pops / stale pops
+            and the search counts of search_stats.py
+    graph / h may also be a StateSpace / successor function and a
+    heuristic function, for state spaces too big to write down
+    """
+    graph = as_graph(graph)
+    h = as_heuristic(h)
+    counter = SearchStats() if stats is not None else None
+
+    # priority queue entries: (f, g, push order, node, parent); the push
+    # order breaks ties so nodes themselves are never compared. A node can
+    # be queued several times; the first copy popped is the cheapest, and
+    # later copies are stale and skipped (lazy deletion: cheaper than
+    # decrease-key)
+    pq = [(weight * h[start], 0, 0, start, None)]
+
+    # expanded nodes only -> the node each was reached from. g(n) lives in
+    # the heap entries, so nothing else is stored per node
+    parent = {}
+    order = pushes = pops = stale = 0
+
+    try:
+        while pq:
+            f, g, _, node, came_from = heapq.heappop(pq)
+            pops += 1
+            if node in parent:
+                stale += 1                                 # already expanded
+                continue
+            parent[node] = came_from
+
+            if node == goal:
+                return reconstruct_path(parent, goal), g  # path and total cost
+
+            neighbors = weighted_neighbors(graph, node)
+            for neighbor, cost in neighbors:
+                if neighbor not in parent:
+                    new_g = g + cost
+                    order += 1
+                    pushes += 1
+                    heapq.heappush(pq, (new_g + weight * h[neighbor], new_g, order,
+                                        neighbor, node))
+            if counter:
+                counter.expand(node, len(neighbors))
+                counter.observe(len(pq), len(parent))
+
+        return None, float('inf')  # no path found
+    finally:
+        if counter:
+            stats.update(pushes=pushes + 1, pops=pops, stale_pops=stale)
+            counter.report(stats)
+
+
+class SMANode:
+    """One node of the SMA* search tree (kept in memory until forgotten)."""
+
+    __slots__ = ("state", "g", "f", "depth", "parent", "children", "forgotten",
+                 "open", "leaf")
+
+    def __init__(self, state, g, f, parent):
+        self.state = state
+        self.g = g
+        self.f = f
+        self.depth = parent.depth + 1 if parent else 0
+        self.parent = parent
+        self.children = None              # list once expanded
+        self.forgotten = {}               # state -> f of a forgotten child
+        self.open = 0                     # != 0 while queued in best_heap
+        self.leaf = 0                     # != 0 while queued in worst_heap
+
+    def path(self):
+        states = []
+        node = self
+        while node is not None:
+            states.append(node.state)
+            node = node.parent
+        states.reverse()
+        return states
+
+
+def sma_star_search(start, goal, graph=graph, h=h, max_nodes=1000, stats=None):
+    """
+    Simplified Memory-bounded A* (SMA*):
+    Same f = g + h and inputs as a_star_search, but at most about
+    `max_nodes` search nodes are kept in memory. When memory is full the
+    worst leaf (highest f, shallowest) is forgotten and its f is backed up
+    into its parent, so that subtree is only regenerated if it becomes the
+    most promising again. The search slows down instead of running out
+    of memory.
+
+    Returns (path, cost). Optimal if h is admissible and the optimal path
+    fits in memory; (None, inf) if no solution fits.
+    max_nodes : node budget (the path to the best leaf is always kept, so
+                a budget smaller than the solution depth can't succeed)
+    stats     : optional dict, filled with forgotten / peak_nodes and the
+                search counts of search_stats.py (regenerating forgotten
+                children counts as a re-expansion)
     """
+    graph = as_graph(graph)
+    h = as_heuristic(h)
+    counter = SearchStats() if stats is not None else None
+    INF = float('inf')
 
-    # priority queue stores: (f, g, node, path)
-    pq = []
-    heapq.heappush(pq, (h[start], 0, start, [start]))
+    # best_heap  (f, -depth): what to expand next - unexpanded leaves, and
+    #                         nodes with forgotten children (keyed by the
+    #                         best forgotten f), deepest first on ties
+    # worst_heap (-f, depth): leaves that may be forgotten, worst first
+    # A node's `open` / `leaf` token tells which heap entries are current.
+    best_heap = []
+    worst_heap = []
+    tokens = 0
+    in_memory = {}          # state -> cheapest node for it currently in memory
+    memory = forgotten = 0
+
+    def push_open(node):
+        nonlocal tokens
+        tokens += 1
+        node.open = tokens
+        key = node.f if node.children is None else min(node.forgotten.values())
+        heapq.heappush(best_heap, (key, -node.depth, tokens, node))
+
+    def push_leaf(node):
+        nonlocal tokens
+        tokens += 1
+        node.leaf = tokens
+        heapq.heappush(worst_heap, (-node.f, node.depth, tokens, node))
+
+    def pop_open():
+        while best_heap:
+            *_, token, node = heapq.heappop(best_heap)
+            if node.open == token:
+                node.open = 0
+                return node
+        return None
+
+    def pop_leaf():
+        while worst_heap:
+            *_, token, node = heapq.heappop(worst_heap)
+            if node.leaf == token:
+                node.leaf = 0
+                return node
+        return None
+
+    def add(node):
+        nonlocal memory
+        memory += 1
+        in_memory[node.state] = node
+        push_open(node)
+        push_leaf(node)
+
+    def forget(leaf):
+        """Drop a leaf; its parent remembers the leaf's f."""
+        nonlocal memory, forgotten
+        parent = leaf.parent
+        parent.children.remove(leaf)
+        leaf.open = leaf.leaf = 0
+        if in_memory.get(leaf.state) is leaf:
+            del in_memory[leaf.state]
+        memory -= 1
+        forgotten += 1
+        if leaf.f < INF:
+            parent.forgotten[leaf.state] = leaf.f
+        if parent.children:
+            if parent.forgotten:
+                push_open(parent)      # can regenerate the child later
+        elif parent.forgotten:
+            # nothing of it left in memory: a leaf again, as good as the
+            # best child it had
+            parent.f = max(parent.f, min(parent.forgotten.values()))
+            push_open(parent)
+            push_leaf(parent)
+        elif parent.parent is not None:
+            parent.f = INF             # every way on from here is a dead end
+            forget(parent)
+
+    add(SMANode(start, 0, h[start], None))
+    peak = memory
+
+    try:
+        while True:
+            node = pop_open()
+            if node is None or (node.children is None and node.f == INF):
+                return None, INF  # no path found (in this much memory)
+
+            if node.state == goal:
+                return node.path(), node.g
+
+            if in_memory.get(node.state) is not node:
+                # a cheaper path to this state is in memory: nothing below
+                # this node can beat it
+                node.forgotten = {}
+                if not node.children and node.parent is not None:
+                    node.f = INF
+                    forget(node)
+                continue
+
+            if node.children is None:
+                # first expansion: every successor (no cycles along one branch)
+                on_path = set(node.path())
+                successors = [(v, cost) for v, cost in weighted_neighbors(graph, node.state)
+                              if v not in on_path]
+                node.children = []
+            else:
+                # regenerate the children that were forgotten
+                successors = [(v, cost) for v, cost in weighted_neighbors(graph, node.state)
+                              if v in node.forgotten]
+            backed_up, node.forgotten = node.forgotten, {}
+            if counter:
+                counter.expand(node.state, len(successors))
+
+            new = []
+            for neighbor, cost in successors:
+                new_g = node.g + cost
+                same = in_memory.get(neighbor)
+                if same is not None and same.g <= new_g:
+                    continue               # reached as cheaply some other way
+                # pathmax: a child is never more promising than its parent,
+                # nor than it was before it was forgotten
+                f = max(node.f, new_g + h[neighbor], backed_up.get(neighbor, 0))
+                if node.depth + 2 >= max_nodes and neighbor != goal:
+                    continue               # a path through it can't fit in memory
+                child = SMANode(neighbor, new_g, f, node)
+                node.children.append(child)
+                new.append(child)
+                add(child)
+
+            if not node.children:
+                # dead end
+                if node.parent is None:
+                    return None, INF
+                node.f = INF
+                forget(node)
+                continue
+            node.leaf = 0                  # has children now, not a leaf
+
+            # over budget: forget the worst leaves, but keep the best new
+            # child (or the same children would be regenerated forever)
+            best_new = min(new, key=lambda child: child.f) if new else None
+            kept = []
+            while memory > max_nodes:
+                worst = pop_leaf()
+                if worst is None:
+                    break
+                if worst is best_new or worst.parent is None:
+                    kept.append(worst)
+                    continue
+                forget(worst)
+            for leaf in kept:
+                push_leaf(leaf)
+            peak = max(peak, memory)
+            if counter:
+                counter.observe(len(best_heap), memory)
+    finally:
+        if counter:
+            counter.report(stats)
+            stats.update(forgotten=forgotten, peak_nodes=peak)
+
+
+def ara_star_search(start, goal, graph=graph, h=h, weight=3.0, step=0.5,
+                    max_expansions=None, time_limit=None, stats=None):
+    """
+    Anytime Repairing A* (ARA*):
+    Weighted A* (f = g + weight * h) finds a first path quickly; then
+    `weight` is lowered by `step` and the search is REPAIRED rather than
+    restarted: only nodes whose g got better after they were expanded
+    (kept in `incons`) go back into the queue. Ends at weight = 1, which
+    gives the optimal cost for an admissible, consistent h.
+
+    A generator: yields after every search round that has a solution
+        {"path", "cost", "weight",
+         "bound": cost is at most bound x the optimal cost,
+         "expanded": expansions so far (all rounds)}
+    Costs never get worse from one yield to the next. Stops early when
+    max_expansions or time_limit (seconds) runs out; the last yielded
+    path is then the best answer. Nothing is yielded if there is no path.
+    stats : optional dict, filled with the search counts of
+            search_stats.py (nodes expanded again in a later round
+            count as re-expansions)
+    """
+    graph = as_graph(graph)
+    h = as_heuristic(h)
+    counter = SearchStats() if stats is not None else None
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    INF = float('inf')
 
-    # best known g(n) for each node
     g_score = {start: 0}
+    parent = {start: None}
 
-    while pq:
-        f, g, node, path = heapq.heappop(pq)
+    def key(node):
+        g = g_score[node]
+        return g + weight * h[node], g
 
-        if node == goal:
-            return path, g  # path and total cost
+    pq = IndexedHeap()
+    pq.push(start, key(start))
+    closed = set()     # expanded in this round
+    incons = set()     # closed, but g improved since: redo next round
+    expanded = 0
 
-        # If we already found a better path to this node, skip
-        if g > g_score.get(node, float('inf')):
-            continue
+    try:
+        while True:
+            # one round: expand until nothing in the queue can beat the goal
+            while pq and pq.peek()[1] < (key(goal) if goal in g_score else (INF, INF)):
+                if ((max_expansions is not None and expanded >= max_expansions)
+                        or (deadline is not None and time.perf_counter() >= deadline)):
+                    return
+                node, (f, g) = pq.pop()
+                closed.add(node)
 
-        for neighbor in graph.get(node, []):
-            new_g = g + 1  # cost of edge = 1
+                neighbors = weighted_neighbors(graph, node)
+                for neighbor, cost in neighbors:
+                    new_g = g + cost
+                    if new_g < g_score.get(neighbor, INF):
+                        g_score[neighbor] = new_g
+                        parent[neighbor] = node
+                        if neighbor in closed:
+                            incons.add(neighbor)
+                        else:
+                            pq.update(neighbor, key(neighbor))
+                expanded += 1
+                if counter:
+                    counter.expand(node, len(neighbors))
+                    counter.observe(len(pq) + len(incons), len(g_score))
 
-            # If this path to neighbor is better, record it
-            if new_g < g_score.get(neighbor, float('inf')):
-                g_score[neighbor] = new_g
-                new_f = new_g + h[neighbor]
-                new_path = path + [neighbor]
-                heapq.heappush(pq, (new_f, new_g, neighbor, new_path))
+            if goal not in g_score:
+                return   # no path at all
 
-    return None, float('inf')  # no path found
+            # every node that could still improve the path is in pq or incons
+            cost = g_score[goal]
+            lower = min((g_score[n] + h[n] for n in incons.union(pq.position)), default=cost)
+            bound = min(weight, cost / lower) if lower > 0 else weight
+            yield {"path": reconstruct_path(parent, goal), "cost": cost, "weight": weight,
+                   "bound": max(bound, 1.0), "expanded": expanded}
+            if weight <= 1 or bound <= 1:
+                return
+
+            # next round: smaller weight, re-key the queue, add the inconsistent nodes
+            weight = max(1.0, weight - step)
+            rekeyed = IndexedHeap()
+            for node in incons.union(pq.position):
+                rekeyed.push(node, key(node))
+            pq = rekeyed
+            incons = set()
+            closed = set()
+    finally:
+        if counter:
+            counter.report(stats)
 
 
 # ---- Example run ----
-start = 'A'
-goal = 'F'
-path, cost = a_star_search(start, goal)
-print("A* Search path from", start, "to", goal, "=>", path, "with cost", cost)
+if __name__ == "__main__":
+    start = 'A'
+    goal = 'F'
+    # python A_star.py graph.csrg START GOAL [landmarks.alt]  -> search a converted graph file
+    if len(sys.argv) > 3:
+        graph = open_graph(sys.argv[1])
+        start, goal = parse_node(graph, sys.argv[2]), parse_node(graph, sys.argv[3])
+        if len(sys.argv) > 4:
+            h = open_landmarks(sys.argv[4], graph).heuristic(goal)   # see landmarks.py
+        else:
+            h = defaultdict(int)   # no heuristic -> h(n) = 0
+    path, cost = a_star_search(start, goal, graph, h)
+    print("A* Search path from", start, "to", goal, "=>", path, "with cost", cost)
+
+    if len(sys.argv) <= 3:
+        path, cost = a_star_search(start, goal, weighted_graph, h)
+        print("Weighted A* path from", start, "to", goal, "=>", path, "with cost", cost)
+        stats = {}
+        path, cost = a_star_search(start, goal, weighted_graph, h, weight=2, stats=stats)
+        print("Weighted A* (w = 2) =>", path, "with cost", cost, stats)
+        stats = {}
+        path, cost = sma_star_search(start, goal, weighted_graph, h, max_nodes=4, stats=stats)
+        print("SMA* (4 nodes of memory) =>", path, "with cost", cost, stats)
+        for solution in ara_star_search(start, goal, weighted_graph, h, weight=3):
+            print(f"ARA* (weight {solution['weight']}) =>", solution["path"],
+                  "with cost", solution["cost"], "bound", solution["bound"])
@@ -0,0 +1,194 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import weighted_neighbors
+from indexed_heap import IndexedHeap
+from path_cache import VersionedGraph
+from search_stats import SearchStats
+from state_space import as_heuristic
+
+# 🔹 Incremental replanning: Lifelong Planning A* (LPA*)
+#
+# a_star_search() starts from nothing every time. When only a few edges
+# of the graph change, most of its previous work is still right. LPA*
+# keeps it: after an edge change it re-expands only the nodes whose
+# distance from start actually changed.
+
+# 🔹 Weighted graph and heuristic (same as A_star.py, goal = 'F')
+weighted_graph = {
+    'A': {'B': 1, 'C': 4},
+    'B': {'D': 2, 'E': 1},
+    'C': {'F': 1},
+    'D': {},
+    'E': {'F': 2},
+    'F': {}
+}
+
+h = {
+    'A': 3,
+    'B': 2,
+    'C': 1,
+    'D': 3,
+    'E': 2,
+    'F': 0
+}
+
+INF = float('inf')
+
+
+class LPAStar:
+    """
+    One start, one goal, a graph that keeps changing:
+
+        planner = LPAStar(weighted_graph, 'A', 'F', h)
+        path, cost = planner.plan()
+        planner.update_edge('B', 'E', 5)     # new cost (or a new edge)
+        planner.remove_edge('C', 'F')
+        path, cost = planner.plan()          # repairs instead of restarting
+
+    g[n]   = cost of the best path to n found so far
+    rhs[n] = one-step lookahead: min over predecessors p of g[p] + cost(p, n)
+    A node is "inconsistent" when g[n] != rhs[n]; only those are queued,
+    keyed by (min(g, rhs) + h, min(g, rhs)). An edge change only touches
+    the rhs of the edge's head, and plan() settles just the inconsistent
+    nodes that matter for the goal.
+
+    graph : dict of lists / dict of dicts / CSRGraph; it is copied, later
+            changes go through update_edge / remove_edge. `planner.graph`
+            is the current graph (a VersionedGraph of dicts, so cached
+            paths for it go stale when it changes).
+    h     : consistent heuristic towards goal (dict or function):
+            h(u) <= cost(u, v) + h(v) for every edge and h(goal) = 0;
+            admissible is not enough. It must stay consistent for the
+            changed costs too (lowering a cost can break that)
+    Edge costs must be positive (> 0), as in the LPA* paper: with zero-cost
+    edges a stale node can tie with the goal and be left unrepaired.
+    """
+
+    def __init__(self, graph, start, goal, h=h):
+        self.graph = VersionedGraph()   # u -> {v: cost}
+        self.pred = {}         # v -> {u: cost}
+        for u in graph:
+            self._node(u)
+            for v, cost in weighted_neighbors(graph, u):
+                self._node(v)
+                self.graph[u][v] = cost
+                self.pred[v][u] = cost
+
+        self.start = start
+        self.goal = goal
+        self.h = as_heuristic(h)
+        self.g = {}
+        self.rhs = {start: 0}
+        self.queue = IndexedHeap()
+        self.queue.push(start, self._key(start))
+
+    def _node(self, n):
+        if n not in self.graph:
+            self.graph[n] = {}
+            self.pred[n] = {}
+
+    def _key(self, n):
+        best = min(self.g.get(n, INF), self.rhs.get(n, INF))
+        return (best + self.h[n], best)
+
+    def _update_node(self, n):
+        """Recompute rhs[n] and (un)queue n to match."""
+        if n != self.start:
+            g = self.g
+            self.rhs[n] = min((g.get(p, INF) + cost for p, cost in self.pred[n].items()),
+                              default=INF)
+        if self.g.get(n, INF) != self.rhs.get(n, INF):
+            self.queue.change(n, self._key(n))
+        elif n in self.queue:
+            self.queue.remove(n)
+
+    # ---- changing the graph ----
+
+    def update_edge(self, u, v, cost):
+        """Add edge u -> v, or change its cost. Call plan() afterwards."""
+        if cost <= 0:
+            raise ValueError(f"edge cost must be positive, got {cost!r}")
+        self._node(u)
+        self._node(v)
+        self.graph.add_edge(u, v, cost)
+        self.pred[v][u] = cost
+        self._update_node(v)
+
+    def remove_edge(self, u, v):
+        """Delete edge u -> v (if it exists). Call plan() afterwards."""
+        if v in self.graph.get(u, {}):
+            self.graph.remove_edge(u, v)
+            del self.pred[v][u]
+            self._update_node(v)
+
+    # ---- searching ----
+
+    def plan(self, stats=None):
+        """
+        Bring the search up to date; returns (path, cost) like
+        a_star_search, or (None, inf) if the goal can't be reached.
+        stats : optional dict, filled with the search counts of this call
+                (see search_stats.py)
+        """
+        g, rhs, queue, goal = self.g, self.rhs, self.queue, self.goal
+        counter = SearchStats() if stats is not None else None
+        while queue and (queue.peek()[1] < self._key(goal)
+                         or rhs.get(goal, INF) != g.get(goal, INF)):
+            node, _ = queue.pop()
+            if counter:
+                counter.expand(node, len(self.graph[node]))
+                counter.observe(len(queue), len(g))
+            if g.get(node, INF) > rhs[node]:
+                # overconsistent: a cheaper path to node was found
+                g[node] = best = rhs[node]
+                for v, cost in self.graph[node].items():
+                    if best + cost < rhs.get(v, INF):
+                        rhs[v] = best + cost
+                        queue.change(v, self._key(v))
+            else:
+                # underconsistent: node's path got worse - forget it and
+                # let node and its successors find their best path again
+                g[node] = INF
+                self._update_node(node)
+                for v in self.graph[node]:
+                    self._update_node(v)
+
+        if counter:
+            counter.report(stats)
+        return self.path(), g.get(goal, INF)
+
+    def path(self):
+        """start ... goal along the current g values (None if unreachable)."""
+        g = self.g
+        if g.get(self.goal, INF) == INF:
+            return None
+        path = [self.goal]
+        node = self.goal
+        while node != self.start:
+            node = min(self.pred[node].items(), key=lambda pc: g.get(pc[0], INF) + pc[1])[0]
+            path.append(node)
+        path.reverse()
+        return path
+
+
+# ---- Example run ----
+if __name__ == "__main__":
+    planner = LPAStar(weighted_graph, 'A', 'F', h)
+    stats = {}
+    path, cost = planner.plan(stats)
+    print("LPA* path from A to F =>", path, "with cost", cost, stats)
+
+    planner.update_edge('E', 'F', 6)     # road A-B-E-F gets slow
+    path, cost = planner.plan(stats)
+    print("after E->F costs 6      =>", path, "with cost", cost, stats)
+
+    planner.remove_edge('C', 'F')        # ... and C-F is closed
+    path, cost = planner.plan(stats)
+    print("after C->F is removed   =>", path, "with cost", cost, stats)
+
+    planner.update_edge('D', 'F', 1)     # a new road opens
+    path, cost = planner.plan(stats)
+    print("after new edge D->F     =>", path, "with cost", cost, stats)
@@ -1,5 +1,13 @@
+import os
+import sys
 from collections import deque
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from graph_file import open_graph, parse_node
+from search_stats import SearchStats
+from state_space import as_graph
+
 # 🔹 Same built-in graph
 graph = {
     'A': ['B', 'C'],
@@ -10,28 +18,75 @@ graph = {
     'F': []
 }
 
-def bfs_shortest_path(start, goal):
-    queue = deque([[start]])  # queue of paths
-    visited = set([start])
+def reconstruct_path(parent, goal):
+    """Follow parent pointers back from goal, then reverse -> start ... goal."""
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
 
-    while queue:
-        path = queue.popleft()
-        node = path[-1]
 
-        if node == goal:
-            return path  # found shortest path
+def bfs_shortest_path(start, goal, graph=graph, stats=None):
+    # graph: dict, CSRGraph, StateSpace or a successor function
+    # stats: optional dict, filled with search counts (see search_stats.py)
+    graph = as_graph(graph)
+    counter = SearchStats() if stats is not None else None
 
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                visited.add(neighbor)
-                new_path = path + [neighbor]
-                queue.append(new_path)
+    # queue holds only nodes; parent[n] remembers how we reached n,
+    # so the path is built once at the goal instead of copied on every push
+    queue = deque([start])
+    parent = {start: None}   # also works as the visited set
+
+    try:
+        while queue:
+            node = queue.popleft()
+
+            if node == goal:
+                return reconstruct_path(parent, goal)  # found shortest path
 
-    return None  # no path found
+            neighbors = graph[node]
+            for neighbor in neighbors:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    queue.append(neighbor)
+            if counter:
+                counter.expand(node, len(neighbors))
+                counter.observe(len(queue), len(parent))
+
+        return None  # no path found
+    finally:
+        if counter:
+            counter.report(stats)
+
+
+def bfs_tree(start, graph=graph):
+    """
+    Run the BFS to the end: parent pointers of EVERY node reachable from
+    start. reconstruct_path(tree, goal) then gives the shortest path to
+    any goal without searching again (goal not in tree -> no path).
+    """
+    graph = as_graph(graph)
+    queue = deque([start])
+    parent = {start: None}
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph[node]:
+            if neighbor not in parent:
+                parent[neighbor] = node
+                queue.append(neighbor)
+    return parent
 
 
 # ---- Example run ----
-start = 'A'
-goal = 'F'
-path = bfs_shortest_path(start, goal)
-print("Shortest path from", start, "to", goal, "=>", path)
+if __name__ == "__main__":
+    start = 'A'
+    goal = 'F'
+    # python bfs.py graph.csrg START GOAL  -> search a converted graph file
+    if len(sys.argv) > 3:
+        graph = open_graph(sys.argv[1])
+        start, goal = parse_node(graph, sys.argv[2]), parse_node(graph, sys.argv[3])
+    path = bfs_shortest_path(start, goal, graph)
+    print("Shortest path from", start, "to", goal, "=>", path)
@@ -0,0 +1,205 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import CSRGraph
+from graph_file import open_graph, parse_node
+
+# 🔹 Batched BFS: hop distances from many sources at once
+#
+# bfs_shortest_path() answers one (start, goal) pair with a Python deque.
+# Here up to 64 * words sources run together: every node keeps a bitset
+# with one bit per source ("this source has reached me"), packed into
+# uint64 words. One BFS level for ALL sources of the batch is then
+#   next[v] = OR of frontier[u] over every edge u -> v
+# done one of two ways, whichever touches fewer edges:
+#   push  only the out-edges of the frontier nodes (small frontiers: the
+#         first and last levels, or a sparse part of the graph)
+#   pull  one pass over all E in-edges (big frontiers, where pushing
+#         would hit most edges anyway and pay for sorting them)
+
+# 🔹 Same built-in graph
+graph = {
+    'A': ['B', 'C'],
+    'B': ['D', 'E'],
+    'C': ['F'],
+    'D': [],
+    'E': ['F'],
+    'F': []
+}
+
+UNREACHED = -1
+
+
+def _in_edges(csr):
+    """
+    Edges grouped by target, as NumPy arrays:
+      in_sources   source of every edge, sorted by edge target
+      in_offsets   in_sources[in_offsets[v]:in_offsets[v+1]] = edges into v
+    """
+    n = csr.num_nodes()
+    offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+    targets = np.frombuffer(csr.targets, dtype=np.int32)
+    sources = np.repeat(np.arange(n, dtype=np.int32), np.diff(offsets))
+    order = np.argsort(targets, kind="stable")
+    in_offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(targets, minlength=n), out=in_offsets[1:])
+    return sources[order], in_offsets
+
+
+def _push(active, bits, offsets, targets):
+    """
+    (nodes, their bits) reached over the out-edges of the frontier nodes
+    `active` (bits[i] = frontier bits of active[i]); touches nothing else.
+    """
+    counts = offsets[active + 1] - offsets[active]
+    total = int(counts.sum())
+    if not total:
+        return active[:0], bits[:0]
+    # position of every out-edge of every active node in `targets`
+    first = np.repeat(offsets[active] - np.cumsum(counts) + counts, counts)
+    heads = targets[first + np.arange(total)]
+    order = np.argsort(heads, kind="stable")
+    heads = heads[order]
+    starts = np.flatnonzero(np.r_[True, heads[1:] != heads[:-1]])
+    reached = np.bitwise_or.reduceat(np.repeat(bits, counts, axis=0)[order], starts, axis=0)
+    return heads[starts].astype(np.int64), reached
+
+
+def _pull(active, bits, n, in_edges):
+    """Same as _push, as one pass over all in-edges (cheaper for big frontiers)."""
+    in_sources, has_in, starts = in_edges
+    frontier = np.zeros((n, bits.shape[1]), dtype=np.uint64)
+    frontier[active] = bits
+    reached = np.zeros_like(frontier)
+    if len(starts):
+        reached[has_in] = np.bitwise_or.reduceat(frontier[in_sources], starts, axis=0)
+    heads = np.flatnonzero(reached.any(axis=1))
+    return heads, reached[heads]
+
+
+def _set_bits(rows):
+    """
+    (row, bit) for every set bit of the uint64 rows, found word by word
+    (lowest bit first), so the cost follows the set bits, not 64 per word.
+    """
+    at, words = np.nonzero(rows)
+    values = rows[at, words]
+    base = words.astype(np.int64) * 64
+    found_rows, found_bits = [at[:0]], [base[:0]]
+    while len(values):
+        low = values & (~values + np.uint64(1))
+        found_rows.append(at)
+        found_bits.append(base + np.log2(low).astype(np.int64))   # exact: a power of two
+        values = values ^ low
+        more = values != 0
+        at, base, values = at[more], base[more], values[more]
+    return np.concatenate(found_rows), np.concatenate(found_bits)
+
+
+def multi_source_bfs(graph, sources, batch_size=256, push_factor=2, nodes=None):
+    """
+    Yield (source, distances) for every source, one row at a time.
+    distances[j] = number of edges from source to node id j
+                   (UNREACHED = -1 if there is no path)
+    graph       : dict of lists or CSRGraph; node id j is graph.label_of(j)
+    batch_size  : sources searched together (k of them, in words = ceil(k / 64)
+                  uint64 words per node)
+    push_factor : a level pushes when the frontier has fewer than
+                  E / push_factor out-edges, and pulls otherwise
+    nodes       : optional list, filled with the node of every distance
+                  column (node id j -> nodes[j]) before the first row;
+                  for a dict graph this is the only way to read the rows
+    Memory per batch, for n nodes and E edges:
+        dist                 n * k * 4 bytes (int32, node-major)
+        visited              n * words * 8 bytes
+        each level           up to E * words * 8 bytes for the gathered
+                             edge bits (the frontier's out-edges when
+                             pushing), plus 2 * n * words * 8 bytes of
+                             dense frontier when pulling
+    A pushing level costs O((frontier edges) * words), a pulling one a
+    full pass over the E edges. Rows are yielded batch by batch, so
+    memory depends on batch_size, not on how many sources there are;
+    lower batch_size if n * batch_size * 4 is too much.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
+    n = csr.num_nodes()
+    if nodes is not None:
+        nodes.extend(csr.label_of(j) for j in range(n))
+    offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+    targets = np.frombuffer(csr.targets, dtype=np.int32)
+    in_edges = None   # built the first time a level pulls
+
+    sources = list(sources)
+    for first in range(0, len(sources), batch_size):
+        batch = sources[first:first + batch_size]
+        k = len(batch)
+        words = (k + 63) // 64
+        ids = np.array([csr.id_of(s) for s in batch], dtype=np.int64)
+
+        # bit b of visited[v] = "source b has reached v"
+        visited = np.zeros((n, words), dtype=np.uint64)
+        bits = np.arange(k)
+        np.bitwise_or.at(visited, (ids, bits // 64),
+                         np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64)))
+        # node-major while searching (rows of visited line up with it)
+        dist = np.full((n, k), UNREACHED, dtype=np.int32)
+        dist[ids, bits] = 0
+
+        # the frontier, sparse: the nodes reached in the last level and their new bits
+        active = np.unique(ids)
+        frontier = visited[active]
+        level = 0
+        while len(active):
+            level += 1
+            if (offsets[active + 1] - offsets[active]).sum() * push_factor < len(targets):
+                heads, reached = _push(active, frontier, offsets, targets)
+            else:
+                if in_edges is None:
+                    in_sources, in_offsets = _in_edges(csr)
+                    has_in = in_offsets[1:] > in_offsets[:-1]
+                    in_edges = (in_sources, has_in, in_offsets[:-1][has_in])
+                heads, reached = _pull(active, frontier, n, in_edges)
+            reached &= ~visited[heads]
+            keep = reached.any(axis=1)
+            active, frontier = heads[keep], reached[keep]
+            visited[active] |= frontier
+
+            # record the level for every newly reached (source, node) bit
+            rows, cols = _set_bits(frontier)
+            dist[active[rows], cols] = level
+
+        for source, row in zip(batch, dist.T):
+            yield source, np.ascontiguousarray(row)
+
+
+def bfs_distance_matrix(graph, sources, batch_size=256, nodes=None):
+    """
+    All rows of multi_source_bfs stacked into one (len(sources) x nodes) matrix.
+    nodes : optional list, filled with the node of every column
+    """
+    rows = [row for _, row in multi_source_bfs(graph, sources, batch_size, nodes=nodes)]
+    if rows:
+        return np.vstack(rows)
+    return np.empty((0, len(graph) if nodes is None else len(nodes)), dtype=np.int32)
+
+
+# ---- Example run ----
+if __name__ == "__main__":
+    # python multi_source.py graph.csrg SOURCE [SOURCE ...]
+    if len(sys.argv) > 2:
+        graph = open_graph(sys.argv[1])
+        sources = [parse_node(graph, s) for s in sys.argv[2:]]
+    else:
+        sources = list(graph)
+
+    nodes = []
+    matrix = bfs_distance_matrix(graph, sources, nodes=nodes)
+    print("Hop distances (-1 = unreachable)")
+    if len(nodes) <= 20:
+        print("     " + " ".join(f"{node!s:>3}" for node in nodes))
+    for source, row in zip(sources, matrix):
+        print(f"{source!s:>4} " + " ".join(f"{d:>3}" for d in row[:20]))
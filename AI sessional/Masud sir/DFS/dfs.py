@@ -1,5 +1,12 @@
+import os
+import sys
 from collections import deque
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from graph_file import open_graph, parse_node
+from search_stats import SearchStats
+
 # 🔹 Same built-in graph
 graph = {
     'A': ['B', 'C'],
@@ -10,29 +17,54 @@ graph = {
     'F': []
 }
 
-def dfs_path(start, goal):
-    # stack will store paths (like BFS queue, but LIFO)
-    stack = [[start]]
-    visited = set([start])
-    
-    while stack:
-        path = stack.pop()      # take the LAST path (LIFO)
-        node = path[-1]
-        
-        if node == goal:
-            return path         # found a path (NOT guaranteed shortest)
-        
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                visited.add(neighbor)
-                new_path = path + [neighbor]
-                stack.append(new_path)
+def reconstruct_path(parent, goal):
+    """Follow parent pointers back from goal, then reverse -> start ... goal."""
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+def dfs_path(start, goal, graph=graph, stats=None):
+    # stack stores nodes (like BFS queue, but LIFO);
+    # parent[n] remembers how we reached n (also works as the visited set)
+    # stats: optional dict, filled with search counts (see search_stats.py)
+    counter = SearchStats() if stats is not None else None
+    stack = [start]
+    parent = {start: None}
     
-    return None  # no path found
+    try:
+        while stack:
+            node = stack.pop()      # take the LAST node (LIFO)
+
+            if node == goal:
+                return reconstruct_path(parent, goal)  # NOT guaranteed shortest
+
+            neighbors = graph[node]
+            for neighbor in neighbors:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    stack.append(neighbor)
+            if counter:
+                counter.expand(node, len(neighbors))
+                counter.observe(len(stack), len(parent))
+
+        return None  # no path found
+    finally:
+        if counter:
+            counter.report(stats)
 
 
 # ---- Example run ----
-start = 'A'
-goal = 'F'
-path = dfs_path(start, goal)
-print("DFS path from", start, "to", goal, "=>", path)
+if __name__ == "__main__":
+    start = 'A'
+    goal = 'F'
+    # python dfs.py graph.csrg START GOAL  -> search a converted graph file
+    if len(sys.argv) > 3:
+        graph = open_graph(sys.argv[1])
+        start, goal = parse_node(graph, sys.argv[2]), parse_node(graph, sys.argv[3])
+    path = dfs_path(start, goal, graph)
+    print("DFS path from", start, "to", goal, "=>", path)
@@ -9,23 +9,24 @@ def get_neighbor(x):
     step = random.uniform(-1, 1)
     return x + step
 
-def stochastic_hill_climbing(iterations=1000, neighbors_per_step=10):
-    # Start with a random solution in [0, 10]
-    current_solution = random.uniform(0, 10)
-    current_value = objective_function(current_solution)
+def stochastic_hill_climbing(iterations=1000, neighbors_per_step=10, objective=objective_function,
+                             start=None, neighbor_of=get_neighbor, rng=random):
+    # Start with a random solution in [0, 10] (or the given one)
+    current_solution = rng.uniform(0, 10) if start is None else start
+    current_value = objective(current_solution)
 
     for i in range(iterations):
         # Generate several random neighbors
-        neighbors = [get_neighbor(current_solution) for _ in range(neighbors_per_step)]
+        neighbors = [neighbor_of(current_solution) for _ in range(neighbors_per_step)]
 
-        # Keep only neighbors that are better (uphill moves)
-        better_neighbors = [n for n in neighbors if objective_function(n) > current_value]
+        # Keep only neighbors that are better (uphill moves);
+        # each neighbor is evaluated once and keeps its value
+        scored = [(n, objective(n)) for n in neighbors]
+        better_neighbors = [(n, value) for n, value in scored if value > current_value]
 
         if better_neighbors:
             # Choose ONE random better neighbor (stochastic choice)
-            new_solution = random.choice(better_neighbors)
-            current_solution = new_solution
-            current_value = objective_function(current_solution)
+            current_solution, current_value = rng.choice(better_neighbors)
             # If you want to see progress, uncomment:
             # print(f"Iter {i}: x = {current_solution:.4f}, f(x) = {current_value:.4f}")
         # else:
@@ -36,6 +37,7 @@ def stochastic_hill_climbing(iterations=1000, neighbors_per_step=10):
 
 
 # ---- Example run ----
-best_solution, best_value = stochastic_hill_climbing()
-print(f"Best solution found: x = {best_solution:.4f}")
-print(f"Best value: f(x) = {best_value:.4f}")
+if __name__ == "__main__":
+    best_solution, best_value = stochastic_hill_climbing()
+    print(f"Best solution found: x = {best_solution:.4f}")
+    print(f"Best value: f(x) = {best_value:.4f}")
@@ -0,0 +1,206 @@
+import os
+import sys
+import tempfile
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from csr_graph import CSRGraph
+from graph_file import open_graph, save_graph, save_reverse_graph
+from landmarks import open_landmarks
+from script_loader import load_script
+
+# 🔹 Batch queries on a process pool
+#
+# Thousands of independent (start, goal) queries: spread them over
+# `workers` processes. The graph is NOT pickled into every task: each
+# worker maps the same .csrg file once (graph_file.open_graph), so all
+# of them share one read-only, page-cached copy. Tasks only carry the
+# queries, a chunk of them at a time (one task per query would spend
+# more time on pickling and messaging than on searching). The searches
+# that also walk backwards (bidirectional, dijkstra) need the reverse
+# graph: it is written once next to the file (<name>.rev.csrg, see
+# graph_file.save_reverse_graph) and mapped by every worker, instead of
+# each worker building its own copy.
+#
+#     for i, path in batch_search(queries, "roads.csrg", search="bfs"):
+#         ...   # i = position of the query in `queries`
+#
+# Results come back in completion order, not query order.
+
+# search name -> (script, function, takes a heuristic, walks the reverse graph)
+SEARCHES = {
+    "bfs": ("Bfs/bfs.py", "bfs_shortest_path", False, False),
+    "dfs": ("DFS/dfs.py", "dfs_path", False, False),
+    "bidirectional": ("bidirectional/bidirectional.py", "bidirectional_search", False, True),
+    "dijkstra": ("bidirectional/bidirectional.py", "bidirectional_dijkstra", False, True),
+    "greedy": ("greedy best first search/greedy_best_first.py", "greedy_best_first_search",
+               True, False),
+    "a_star": ("A star/A_star.py", "a_star_search", True, False),
+}
+
+# ---- worker side ----
+
+_worker = {}   # set up once per worker process by _init_worker
+
+
+def _init_worker(graph_path, search, landmarks_path, reverse_path):
+    graph = open_graph(graph_path, reverse_path)
+    script, name, takes_h, _ = SEARCHES[search]
+    _worker["graph"] = graph
+    _worker["search"] = getattr(load_script(script), name)
+    _worker["takes_h"] = takes_h
+    _worker["landmarks"] = open_landmarks(landmarks_path, graph) if landmarks_path else None
+
+
+def _run_chunk(chunk, with_stats):
+    graph = _worker["graph"]
+    search = _worker["search"]
+    landmarks = _worker["landmarks"]
+    results = []
+    for i, start, goal in chunk:
+        args = ()
+        if _worker["takes_h"]:
+            # landmark bounds if we have them, else h(n) = 0
+            args = (landmarks.heuristic(goal) if landmarks else defaultdict(int),)
+        stats = {} if with_stats else None
+        result = search(start, goal, graph, *args, stats=stats)
+        results.append((i, result, stats) if with_stats else (i, result))
+    return results
+
+
+# ---- caller side ----
+
+def _relabel(result, labels):
+    """Map the text labels in a worker's result back to the caller's labels."""
+    if isinstance(result, tuple):   # (path, cost)
+        return (_relabel(result[0], labels),) + result[1:]
+    return None if result is None else [labels[node] for node in result]
+
+
+def _chunks(queries, size):
+    numbered = ((i, start, goal) for i, (start, goal) in enumerate(queries))
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def batch_search(queries, graph, search="bfs", workers=None, chunksize=None,
+                 landmarks=None, stats=False):
+    """
+    Run search(start, goal) for every (start, goal) in `queries` on a
+    process pool and yield (index, result) as the queries finish.
+
+    graph     : path of a .csrg file, or a graph (a CSRGraph from
+                open_graph is used as is; anything else is written to a
+                temporary .csrg file for the run. That file keeps labels
+                as text (see graph_file.py), so labels other than 0..n-1
+                and other than strings are sent to the workers as
+                str(label) and mapped back in the paths that come back)
+    search    : a name from SEARCHES; result is what that search returns
+                (a path, or (path, cost) for "a_star" and "dijkstra")
+    chunksize : queries per task (default: about 4 tasks per worker,
+                at most 256 queries each, so results keep streaming)
+    landmarks : .alt file for "greedy" / "a_star" (see landmarks.py);
+                without it they run with h(n) = 0
+    stats     : True -> yield (index, result, stats dict) instead
+                (see search_stats.py)
+
+    `queries` may be any iterable; it is read lazily, a few chunks ahead
+    of the workers.
+    """
+    if search not in SEARCHES:
+        raise ValueError(f"unknown search {search!r}, expected one of {sorted(SEARCHES)}")
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        try:
+            chunksize = max(1, min(256, len(queries) // (workers * 4)))
+        except TypeError:   # no len(): a generator
+            chunksize = 64
+
+    temp = None
+    labels = None   # text label -> caller's label, if the temporary file changes them
+    if isinstance(graph, (str, os.PathLike)):
+        graph_path = os.fspath(graph)
+    elif getattr(graph, "path", None):
+        graph_path = graph.path
+    else:
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
+        if csr.labels is not None and all(label == i for i, label in enumerate(csr.labels)):
+            # nodes 0..n-1: store no labels, so the workers see int nodes too
+            csr = CSRGraph(csr.offsets, csr.targets, None, csr.weights)
+        elif csr.labels is not None and not all(isinstance(label, str) for label in csr.labels):
+            labels = {str(label): label for label in csr.labels}
+            if len(labels) < csr.num_nodes():
+                raise ValueError("node labels must stay distinct as text (e.g. not both 1 and '1')")
+            queries = ((str(start), str(goal)) for start, goal in queries)
+        fd, temp = tempfile.mkstemp(suffix=".csrg")
+        os.close(fd)
+        save_graph(csr, temp)
+        graph_path = temp
+
+    reverse_path = None
+    if SEARCHES[search][3]:
+        try:
+            reverse_path = save_reverse_graph(graph_path)
+        except OSError:   # can't write next to the graph: every worker builds its own
+            pass
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(graph_path, search, landmarks, reverse_path)) as pool:
+            chunks = _chunks(queries, chunksize)
+            pending = set()
+            try:
+                while True:
+                    # keep every worker busy with a couple of chunks queued behind it
+                    for chunk in islice(chunks, 2 * workers - len(pending)):
+                        pending.add(pool.submit(_run_chunk, chunk, stats))
+                    if not pending:
+                        break
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if labels is None:
+                            yield from future.result()
+                        else:
+                            for i, result, *rest in future.result():
+                                yield (i, _relabel(result, labels), *rest)
+            finally:
+                for future in pending:   # caller stopped early: drop queued chunks
+                    future.cancel()
+    finally:
+        if temp:
+            os.remove(temp)
+            if reverse_path:
+                os.remove(reverse_path)
+
+
+# ---- Example run ----
+#   python batch_queries.py graph.csrg [num_queries] [search] [workers]
+if __name__ == "__main__":
+    import random
+    import time
+
+    if len(sys.argv) > 1:
+        graph = open_graph(sys.argv[1])
+    else:
+        rng = random.Random(0)
+        graph = CSRGraph.from_edges(5000, [(u, rng.randrange(5000))
+                                           for u in range(5000) for _ in range(3)])
+    num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    search = sys.argv[3] if len(sys.argv) > 3 else "bfs"
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else None
+
+    rng = random.Random(1)
+    nodes = list(graph)
+    queries = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(num_queries)]
+
+    t0 = time.perf_counter()
+    found = 0
+    for i, result in batch_search(queries, graph, search, workers):
+        path = result[0] if isinstance(result, tuple) else result
+        found += path is not None
+    print(f"{num_queries} {search} queries on {graph}: {found} paths found "
+          f"in {time.perf_counter() - t0:.2f} s")
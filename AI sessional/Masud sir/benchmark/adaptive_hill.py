@@ -0,0 +1,66 @@
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "hill climbing"))
+
+from hill import adaptive_hill_climbing, hill_climbing, random_restart_hill_climbing
+
+# 🔹 Benchmark: objective evaluations spent by hill climbing
+#    1. fixed 1000 moves of +-1 (hill_climbing)  vs  adaptive step with
+#       convergence detection, over many seeds of -x^2 + 10x
+#    2. random restarts on a 1-D Rastrigin function (local maxima at every
+#       integer, global maximum 20 at x = 0), with and without a target
+#
+# Run:  python adaptive_hill.py [seeds] [workers]
+
+
+class Counted:
+    """Objective that counts its calls."""
+
+    def __init__(self, f):
+        self.f = f
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.f(x)
+
+
+def parabola(x):
+    return -x**2 + 10*x
+
+
+def rastrigin(x):
+    return 20 - (x * x - 10 * math.cos(2 * math.pi * x) + 10)
+
+
+def main(seeds=50, workers=os.cpu_count() or 1):
+    print(f"-x^2 + 10x, {seeds} seeds")
+    print(f"{'climber':<22}{'evaluations':>13}{'mean error':>12}")
+    for name, climb in (("hill_climbing", lambda f, i: hill_climbing(objective=f)),
+                        ("adaptive", lambda f, i: adaptive_hill_climbing(
+                            objective=f, rng=random.Random(i)))):
+        objective = Counted(parabola)
+        errors = []
+        for i in range(seeds):
+            random.seed(i)
+            errors.append(25 - climb(objective, i)[1])
+        print(f"{name:<22}{objective.calls / seeds:>13.0f}{sum(errors) / seeds:>12.2e}")
+
+    print(f"Rastrigin 1-D on [-5, 5], 40 restarts, {workers} worker(s)")
+    print(f"{'restarts':<22}{'evaluations':>13}{'best f':>10}{'cancelled':>11}{'ms':>8}")
+    for label, target in (("all", None), ("until f >= 19.999", 19.999)):
+        stats = {}
+        t0 = time.perf_counter()
+        _, value = random_restart_hill_climbing(40, rastrigin, target=target, workers=workers,
+                                                low=-5, high=5, stats=stats)
+        ms = 1000 * (time.perf_counter() - t0)
+        print(f"{label:<22}{stats['evaluations']:>13}{value:>10.4f}{stats['cancelled']:>11}"
+              f"{ms:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
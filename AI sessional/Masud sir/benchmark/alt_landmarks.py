@@ -0,0 +1,63 @@
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import CSRGraph
+from landmarks import build_landmarks, open_landmarks, save_landmarks
+from script_loader import load_script
+
+# 🔹 Benchmark: A* with h = 0 vs A* with landmark (ALT) bounds
+#    on a weighted grid (a small "road map"), random start/goal pairs.
+#    The landmark tables are written to a file and mapped back, like the
+#    offline step would do for a real graph.
+#
+# Run:  python alt_landmarks.py [size] [num_queries] [k]
+
+
+def main(size=100, num_queries=50, k=8):
+    a_star = load_script("A star/A_star.py")
+    graph = CSRGraph.from_dict(load_script("benchmark/heap_ops.py").weighted_grid(size))
+    nodes = list(graph)
+    rng = random.Random(1)
+    queries = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(num_queries)]
+
+    t0 = time.perf_counter()
+    built = build_landmarks(graph, k)
+    build_s = time.perf_counter() - t0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grid.alt")
+        save_landmarks(built, path)
+        file_size = os.path.getsize(path)
+        landmarks = open_landmarks(path, graph)
+
+        print(f"Weighted grid {size}x{size}, {num_queries} queries")
+        print(f"{k} landmarks: {build_s:.2f} s to build, {file_size / 1e6:.2f} MB on disk")
+        print(f"{'heuristic':<22}{'expanded':>12}{'time s':>9}")
+
+        zero = defaultdict(int)
+        runs = [("h = 0 (Dijkstra)", lambda s, g: zero),
+                (f"ALT, {k} landmarks", lambda s, g: landmarks.heuristic(g)),
+                ("ALT, best 4 of them", lambda s, g: landmarks.heuristic(g, s, active=4))]
+        costs = None
+        for name, make_h in runs:
+            expanded = 0
+            t0 = time.perf_counter()
+            results = []
+            for s, g in queries:
+                stats = {}
+                results.append(a_star.a_star_search(s, g, graph, make_h(s, g), stats=stats)[1])
+                expanded += stats['expanded']
+            seconds = time.perf_counter() - t0
+            assert costs is None or results == costs   # ALT keeps A* optimal
+            costs = results
+            print(f"{name:<22}{expanded:>12}{seconds:>9.3f}")
+        del landmarks   # release the mapping before the file is removed
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:4]])
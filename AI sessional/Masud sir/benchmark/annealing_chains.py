@@ -0,0 +1,61 @@
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from script_loader import load_script
+
+# 🔹 Benchmark: simulated annealing, one scalar chain vs many NumPy chains
+#    1. time per step: simulated.py (one chain) vs simulated_numpy.py
+#       with 1 ... 10000 chains
+#    2. quality on Rastrigin 10-D (many local optima, best value 0):
+#       one chain, 200 chains, parallel tempering with 32 temperatures
+#
+# Run:  python annealing_chains.py [iterations]
+
+
+def rastrigin(x):
+    """Negated Rastrigin function (maximized): 0 at x = 0, below 0 elsewhere."""
+    return -(10 * x.shape[1] + np.sum(x**2 - 10 * np.cos(2 * np.pi * x), axis=1))
+
+
+def main(iterations=2000):
+    scalar = load_script("simulated anneling/simulated.py")
+    vectorized = load_script("simulated anneling/simulated_numpy.py")
+
+    print(f"{'run':<28}{'us/step':>10}{'chain-steps/s':>15}")
+    random.seed(0)
+    t0 = time.perf_counter()
+    # cooling_rate=1: never reaches the cut-off, so all iterations run
+    scalar.simulated_annealing(cooling_rate=1, iterations=iterations)
+    seconds = time.perf_counter() - t0
+    print(f"{'simulated.py, 1 chain':<28}{1e6 * seconds / iterations:>10.1f}"
+          f"{iterations / seconds:>15,.0f}")
+    for chains in (1, 100, 1000, 10000):
+        t0 = time.perf_counter()
+        vectorized.simulated_annealing_np(chains, iterations=iterations, cooling_rate=1, seed=0)
+        seconds = time.perf_counter() - t0
+        label = f"NumPy, {chains} chains"
+        print(f"{label:<28}{1e6 * seconds / iterations:>10.1f}"
+              f"{chains * iterations / seconds:>15,.0f}")
+
+    print(f"Rastrigin 10-D, {iterations} steps")
+    print(f"{'run':<28}{'best value':>12}{'acceptance':>12}")
+    box = {"dim": 10, "low": -5.12, "high": 5.12, "objective": rastrigin, "step": 0.3, "seed": 0}
+    cooling = 0.01 ** (1 / iterations)   # 10 -> 0.1 over the run
+    for label, report in (
+            ("SA, 1 chain", vectorized.simulated_annealing_np(
+                1, initial_temp=10, cooling_rate=cooling, iterations=iterations, **box)),
+            ("SA, 200 chains", vectorized.simulated_annealing_np(
+                200, initial_temp=10, cooling_rate=cooling, iterations=iterations, **box)),
+            ("parallel tempering, 32", vectorized.parallel_tempering(
+                vectorized.temperature_ladder(32, 0.05, 20), iterations=iterations, **box))):
+        print(f"{label:<28}{report['best_value']:>12.3f}{report['acceptance_rate'].mean():>12.2f}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
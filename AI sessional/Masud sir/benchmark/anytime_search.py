@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from script_loader import load_script
+
+# 🔹 Benchmark: anytime searches on a weighted grid
+#    ARA*: when does each (better) path arrive, compared with plain A*?
+#    greedy_best_first_steps: how close does it get within a small budget?
+#
+# Run:  python anytime_search.py [size] [start weight]
+
+
+def main(size=150, weight=3.0):
+    a_star = load_script("A star/A_star.py")
+    greedy = load_script("greedy best first search/greedy_best_first.py")
+    graph = load_script("benchmark/heap_ops.py").weighted_grid(size)
+    start, goal = (0, 0), (size - 1, size - 1)
+    h = {(r, c): abs(goal[0] - r) + abs(goal[1] - c) for r, c in graph}
+
+    print(f"Weighted grid {size}x{size}")
+    print(f"{'search':<22}{'ms':>9}{'expanded':>10}{'cost':>8}{'bound':>7}")
+    stats = {}
+    t0 = time.perf_counter()
+    _, cost = a_star.a_star_search(start, goal, graph, h, stats=stats)
+    ms = 1000 * (time.perf_counter() - t0)
+    print(f"{'A*':<22}{ms:>9.1f}{stats['expanded']:>10}{cost:>8}{1.0:>7.2f}")
+
+    t0 = time.perf_counter()
+    for solution in a_star.ara_star_search(start, goal, graph, h, weight=weight, step=0.5):
+        ms = 1000 * (time.perf_counter() - t0)
+        label = f"ARA* weight {solution['weight']}"
+        print(f"{label:<22}{ms:>9.1f}{solution['expanded']:>10}{solution['cost']:>8}"
+              f"{solution['bound']:>7.2f}")
+    assert solution["cost"] == cost
+
+    print(f"{'greedy budget':<22}{'ms':>9}{'best h':>10}{'path':>8}")
+    unweighted = {node: list(neighbors) for node, neighbors in graph.items()}
+    for budget in (10, 100, 1000):
+        t0 = time.perf_counter()
+        for event in greedy.greedy_best_first_steps(start, goal, unweighted, h,
+                                                    max_expansions=budget):
+            pass
+        ms = 1000 * (time.perf_counter() - t0)
+        label = f"{budget} expansions"
+        print(f"{label:<22}{ms:>9.1f}{event['best_h']:>10}{len(event['path']):>8}")
+
+
+if __name__ == "__main__":
+    main(*[float(a) if i else int(a) for i, a in enumerate(sys.argv[1:3])])
@@ -0,0 +1,41 @@
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from script_loader import load_script
+
+# 🔹 Benchmark: local beam search as the beam widens
+#    beam.py (lists, one random.uniform per neighbor, heap top-k)  vs
+#    beam_numpy.py (arrays, argpartition top-k), plus its stochastic mode.
+#
+# Run:  python beam_scaling.py [largest k] [iterations]
+
+
+def main(largest=10**5, iterations=50):
+    lists = load_script("local beam search/beam.py")
+    arrays = load_script("local beam search/beam_numpy.py")
+    print(f"{iterations} iterations, 5 neighbors per state")
+    print(f"{'k':>8}{'beam.py s':>11}{'NumPy s':>10}{'stochastic s':>14}{'best f':>9}")
+    k = 10
+    while k <= largest:
+        list_s = "-"
+        if k <= 10**3:   # the list version gets too slow beyond this
+            random.seed(0)
+            t0 = time.perf_counter()
+            lists.local_beam_search(k, iterations)
+            list_s = f"{time.perf_counter() - t0:.3f}"
+        t0 = time.perf_counter()
+        _, value = arrays.local_beam_search_np(k, iterations, seed=0)
+        numpy_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        arrays.local_beam_search_np(k, iterations, stochastic=True, seed=0)
+        stochastic_s = time.perf_counter() - t0
+        print(f"{k:>8}{list_s:>11}{numpy_s:>10.3f}{stochastic_s:>14.3f}{value:>9.4f}")
+        k *= 10
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
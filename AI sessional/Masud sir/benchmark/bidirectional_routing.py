@@ -0,0 +1,81 @@
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from script_loader import load_script
+
+# 🔹 Benchmark: many bidirectional queries on one graph
+#    old: reverse graph rebuilt per query, sides alternate level by level
+#    new: reverse graph cached, smaller frontier expanded first
+#    plus weighted queries: bidirectional Dijkstra vs plain A* (h = 0)
+#
+# Run:  python bidirectional_routing.py [num_nodes] [num_queries]
+
+
+def random_graph(num_nodes, seed=0):
+    """Sparse random graph plus a few hubs (like a road/airline mix)."""
+    rng = random.Random(seed)
+    graph = {i: {} for i in range(num_nodes)}
+    for u in range(num_nodes):
+        for _ in range(3):
+            graph[u][rng.randrange(num_nodes)] = rng.randint(1, 20)
+    for hub in range(0, num_nodes, num_nodes // 10):
+        for _ in range(200):
+            graph[hub][rng.randrange(num_nodes)] = rng.randint(1, 20)
+    return graph
+
+
+def old_bidirectional_search(start, goal, graph, bd):
+    """The original version, kept here only for comparison."""
+    if start == goal:
+        return [start]
+    front_parent, back_parent = {start: None}, {goal: None}
+    front_queue, back_queue = deque([start]), deque([goal])
+    rev_graph = bd.build_reverse_graph(graph)
+    while front_queue and back_queue:
+        for queue, adj, parent, other in ((front_queue, graph, front_parent, back_parent),
+                                          (back_queue, rev_graph, back_parent, front_parent)):
+            meet = bd.expand_level(queue, adj, parent, other)
+            if meet is not None:
+                return bd.reconstruct_path(meet, front_parent, back_parent)
+    return None
+
+
+def run(func, queries):
+    t0 = time.perf_counter()
+    results = [func(s, g) for s, g in queries]
+    return results, time.perf_counter() - t0
+
+
+def main(num_nodes=20000, num_queries=100):
+    bd = load_script("bidirectional/bidirectional.py")
+    a_star = load_script("A star/A_star.py")
+    graph = random_graph(num_nodes)
+    rng = random.Random(1)
+    queries = [(rng.randrange(num_nodes), rng.randrange(num_nodes)) for _ in range(num_queries)]
+    zero_h = {node: 0 for node in graph}
+
+    print(f"{num_nodes} nodes, {sum(map(len, graph.values()))} edges, {num_queries} queries")
+    print(f"{'search':<38}{'total s':>9}{'queries/s':>12}")
+
+    old, old_s = run(lambda s, g: old_bidirectional_search(s, g, graph, bd), queries)
+    new, new_s = run(lambda s, g: bd.bidirectional_search(s, g, graph), queries)
+    assert [len(p or []) for p in old] == [len(p or []) for p in new]
+
+    dijkstra, dijkstra_s = run(lambda s, g: bd.bidirectional_dijkstra(s, g, graph), queries)
+    astar, astar_s = run(lambda s, g: a_star.a_star_search(s, g, graph, zero_h), queries)
+    assert [c for _, c in dijkstra] == [c for _, c in astar]
+
+    for name, seconds in (("unit cost, old (rebuild, alternate)", old_s),
+                          ("unit cost, new (cached, balanced)", new_s),
+                          ("weighted, A* with h = 0", astar_s),
+                          ("weighted, bidirectional Dijkstra", dijkstra_s)):
+        print(f"{name:<38}{seconds:>9.3f}{num_queries / seconds:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
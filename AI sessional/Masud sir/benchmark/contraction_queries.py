@@ -0,0 +1,75 @@
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import CSRGraph
+from script_loader import load_script
+
+# 🔹 Benchmark: contraction hierarchy vs plain A* for many queries
+#    on one weighted grid. CH pays a one-off preprocessing cost (the
+#    hierarchy is also written to disk and mapped back), then each
+#    query settles only a few hundred nodes.
+#
+# Run:  python contraction_queries.py [size] [num_queries]
+
+
+def main(size=100, num_queries=200):
+    ch = load_script("contraction hierarchies/contraction.py")
+    a_star = load_script("A star/A_star.py")
+    grid = load_script("benchmark/heap_ops.py").weighted_grid(size)
+    graph = CSRGraph.from_dict(grid)
+    nodes = list(graph)
+    rng = random.Random(1)
+    queries = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(num_queries)]
+
+    t0 = time.perf_counter()
+    built = ch.build_hierarchy(graph)
+    build_s = time.perf_counter() - t0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grid.ch")
+        ch.save_hierarchy(built, path)
+        file_size = os.path.getsize(path)
+        hierarchy = ch.open_hierarchy(path, graph)
+
+        print(f"Weighted grid {size}x{size} ({graph.num_edges()} edges), {num_queries} queries")
+        print(f"CH preprocessing: {build_s:.2f} s, {hierarchy.num_shortcuts()} shortcuts, "
+              f"{file_size / 1e6:.2f} MB on disk")
+        print(f"{'search':<28}{'settled/query':>14}{'ms/query':>10}")
+
+        def manhattan(goal):
+            return lambda node: abs(goal[0] - node[0]) + abs(goal[1] - node[1])
+
+        zero = defaultdict(int)
+        runs = [("A*, h = 0", lambda s, g, st: a_star.a_star_search(s, g, graph, zero, stats=st)),
+                ("A*, Manhattan h", lambda s, g, st: a_star.a_star_search(
+                    s, g, graph, manhattan(g), stats=st)),
+                ("contraction hierarchy", lambda s, g, st: hierarchy.query(s, g, stats=st))]
+        costs = None
+        per_query = {}
+        for name, run in runs:
+            settled = 0
+            seconds = 0
+            results = []
+            for s, g in queries:
+                stats = {}
+                t0 = time.perf_counter()
+                results.append(run(s, g, stats)[1])
+                seconds += time.perf_counter() - t0
+                settled += stats.get('settled', stats.get('expanded'))
+            assert costs is None or results == costs
+            costs = results
+            per_query[name] = seconds / num_queries
+            print(f"{name:<28}{settled / num_queries:>14.0f}{1000 * per_query[name]:>10.2f}")
+        del hierarchy   # release the mapping before the file is removed
+
+    saved = per_query["A*, Manhattan h"] - per_query["contraction hierarchy"]
+    print(f"Preprocessing pays for itself after ~{build_s / saved:.0f} queries (vs A*, Manhattan h)")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,65 @@
+import math
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from script_loader import load_script
+
+# 🔹 Benchmark: cooling schedules for simulated annealing
+#    simulated_annealing (T *= 0.95 from 100, stops below 0.0001)  vs
+#    adaptive_simulated_annealing with each schedule, over many seeds,
+#    on -x^2 + 10x and on a bumpy function (local maxima at every
+#    integer, global maximum 20 at x = 0; starts are drawn from [0, 10]).
+#
+# Run:  python cooling_schedules.py [seeds] [iterations]
+
+
+class Counted:
+    """Objective that counts its calls."""
+
+    def __init__(self, f):
+        self.f = f
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.f(x)
+
+
+def parabola(x):
+    return -x**2 + 10*x
+
+
+def bumpy(x):
+    return 20 - (x * x - 10 * math.cos(2 * math.pi * x) + 10)
+
+
+def main(seeds=100, iterations=1000):
+    sa = load_script("simulated anneling/simulated.py")
+    runs = {
+        "fixed 0.95 (original)": lambda f: sa.simulated_annealing(iterations=iterations,
+                                                                  objective=f),
+        "geometric": lambda f: sa.adaptive_simulated_annealing(iterations, f, "geometric"),
+        "lundy_mees": lambda f: sa.adaptive_simulated_annealing(iterations, f, "lundy_mees"),
+        "target": lambda f: sa.adaptive_simulated_annealing(iterations, f, "target"),
+        "target, no reheating": lambda f: sa.adaptive_simulated_annealing(
+            iterations, f, "target", max_reheats=0),
+    }
+    for name, function, optimum in (("-x^2 + 10x", parabola, 25), ("bumpy", bumpy, 20)):
+        print(f"{name}, {seeds} seeds, budget {iterations} moves")
+        print(f"{'schedule':<24}{'evaluations':>13}{'mean gap':>11}{'hit optimum':>13}")
+        for label, run in runs.items():
+            objective = Counted(function)
+            gaps = []
+            for seed in range(seeds):
+                random.seed(seed)
+                gaps.append(optimum - run(objective)[1])
+            hits = sum(gap < 1e-3 for gap in gaps)
+            print(f"{label:<24}{objective.calls / seeds:>13.0f}{sum(gaps) / seeds:>11.4f}"
+                  f"{hits:>10}/{seeds}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,109 @@
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import CSRGraph
+from script_loader import load_script
+
+# 🔹 Benchmark: dict-of-lists graph vs CSRGraph
+#    - memory to hold the graph
+#    - expansions per second for a full BFS sweep
+#
+# Run:  python csr_vs_dict.py [num_nodes] [avg_degree]
+
+
+def random_edges(num_nodes, avg_degree, seed=0):
+    rng = random.Random(seed)
+    return [(u, rng.randrange(num_nodes))
+            for u in range(num_nodes) for _ in range(avg_degree)]
+
+
+def measure(build):
+    """Return (object, bytes allocated while building it)."""
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def bfs_sweep(graph, start):
+    """Visit every reachable node; return number of expansions."""
+    visited = {start}
+    queue = deque([start])
+    expanded = 0
+    while queue:
+        node = queue.popleft()
+        expanded += 1
+        for neighbor in graph.get(node, []):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+    return expanded
+
+
+def bfs_sweep_ids(csr, start):
+    """Same sweep on integer ids, using a bytearray instead of a set."""
+    visited = bytearray(csr.num_nodes())
+    visited[start] = 1
+    queue = deque([start])
+    expanded = 0
+    while queue:
+        node = queue.popleft()
+        expanded += 1
+        for neighbor in csr.neighbor_ids(node):
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                queue.append(neighbor)
+    return expanded
+
+
+def timed(func, *args):
+    t0 = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t0
+
+
+def main(num_nodes=200_000, avg_degree=4):
+    edges = random_edges(num_nodes, avg_degree)
+    labels = [f"n{i}" for i in range(num_nodes)]
+
+    def build_dict():
+        graph = {label: [] for label in labels}
+        for u, v in edges:
+            graph[labels[u]].append(labels[v])
+        return graph
+
+    dict_graph, dict_bytes = measure(build_dict)
+    csr_graph, csr_bytes = measure(lambda: CSRGraph.from_edges(num_nodes, edges, list(labels)))
+    int_graph, int_bytes = measure(lambda: CSRGraph.from_edges(num_nodes, edges))
+
+    print(f"Graph: {num_nodes} nodes, {len(edges)} edges")
+    print(f"{'form':<22}{'memory (MB)':>14}{'expansions/s':>16}")
+
+    bfs = load_script("Bfs/bfs.py")
+    rows = [
+        ("dict of lists", dict_bytes, bfs_sweep, dict_graph, labels[0]),
+        ("CSR + labels", csr_bytes, bfs_sweep, csr_graph, labels[0]),
+        ("CSR int ids", int_bytes, bfs_sweep_ids, int_graph, 0),
+    ]
+    for name, size, sweep, graph, start in rows:
+        expanded, seconds = timed(sweep, graph, start)
+        print(f"{name:<22}{size / 1e6:>14.1f}{expanded / seconds:>16,.0f}")
+
+    # the scripts' own search works on either form and gives the same path
+    goal = labels[num_nodes - 1]
+    path_dict, t_dict = timed(bfs.bfs_shortest_path, labels[0], goal, dict_graph)
+    path_csr, t_csr = timed(bfs.bfs_shortest_path, labels[0], goal, csr_graph)
+    assert path_dict == path_csr
+    print(f"bfs_shortest_path: dict {t_dict:.3f}s, CSR {t_csr:.3f}s, path length {len(path_csr or [])}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,69 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fitness_cache import FitnessCache
+from script_loader import load_script
+
+# 🔹 Benchmark: optimizers with and without FitnessCache
+#    The objective counts its calls and sleeps `cost_ms` per call, standing
+#    in for an expensive simulation. Each optimizer runs with the same seed
+#    uncached, with an exact cache and with a quantized one. Last, a
+#    cache saved to disk makes a second identical run almost free.
+#
+# Run:  python fitness_caching.py [cost_ms]
+
+
+class CountingObjective:
+    def __init__(self, cost_ms):
+        self.cost = cost_ms / 1000
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        if self.cost:
+            time.sleep(self.cost)
+        return -x**2 + 10*x
+
+
+def main(cost_ms=0.2):
+    hill = load_script("hill climbing/hill.py")
+    stochastic = load_script("Stochastic Hill Climbing/stochastic_hill.py")
+    beam = load_script("local beam search/beam.py")
+    genetic = load_script("genetic algorithom/genetic.py")
+    runs = {
+        "hill_climbing": lambda f: hill.hill_climbing(objective=f),
+        "stochastic_hill_climbing": lambda f: stochastic.stochastic_hill_climbing(200, objective=f),
+        "local_beam_search": lambda f: beam.local_beam_search(10, 100, objective=f),
+        "genetic_algorithm": lambda f: genetic.genetic_algorithm(100, 50, objective=f),
+    }
+
+    print(f"objective cost {cost_ms} ms per call")
+    print(f"{'optimizer':<26}{'cache':<14}{'calls':>8}{'hit rate':>10}{'seconds':>9}{'best f':>9}")
+    for name, run in runs.items():
+        for label, quantum in (("none", None), ("exact", None), ("quantum 1e-4", 1e-4)):
+            objective = CountingObjective(cost_ms)
+            cached = objective if label == "none" else FitnessCache(objective, quantum=quantum)
+            random.seed(0)
+            t0 = time.perf_counter()
+            _, value = run(cached)
+            seconds = time.perf_counter() - t0
+            rate = f"{cached.stats()['hit_rate']:.2f}" if label != "none" else "-"
+            print(f"{name:<26}{label:<14}{objective.calls:>8}{rate:>10}{seconds:>9.3f}{value:>9.4f}")
+
+    path = os.path.join(tempfile.mkdtemp(), "fitness.cache")
+    for attempt in ("first run", "second run"):
+        objective = CountingObjective(cost_ms)
+        with FitnessCache(objective, path=path) as cached:
+            random.seed(0)
+            runs["local_beam_search"](cached)
+        print(f"beam search with {path}, {attempt}: {objective.calls} real calls")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*[float(a) for a in sys.argv[1:2]])
@@ -0,0 +1,74 @@
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from script_loader import load_script
+
+# 🔹 Benchmark: genetic algorithm, list version vs NumPy version
+#    1. correctness against genetic.py: truncation selection keeps the
+#       same individuals, and seeded runs of both (same objective, same
+#       operators) end up equally close to the optimum
+#    2. individuals per second as the population grows
+#
+# Run:  python genetic_scaling.py [largest population] [generations]
+
+
+def log_gap(value):
+    """log10 of the distance to the optimum f(5) = 25 (always defined)."""
+    return np.log10(max(25 - value, 1e-12))
+
+
+def main(largest=10**6, generations=20):
+    reference = load_script("genetic algorithom/genetic.py")
+    vectorized = load_script("genetic algorithom/genetic_numpy.py")
+
+    rng = random.Random(0)
+    population = [rng.uniform(0, 10) for _ in range(1001)]
+    fitness = vectorized.objective_function(np.array(population)[:, None])
+    kept = {population[i] for i in vectorized.truncation_selection(fitness)}
+    assert kept == set(reference.selection(population, reference.objective_function))
+
+    # The two draw from different random generators, so single runs can't
+    # match; compare them over seeds 0..999 instead. Per generation count,
+    # the mean log10 gap to the optimum of the last population's best must
+    # agree within 4 standard errors. Changing one operator (retain 0.2 or
+    # mutation_rate 0.5 in one version) moves it by more than 10.
+    seeds = 1000
+    print(f"mean log10(25 - best f) of the last population over {seeds} seeds")
+    print(f"{'generations':>12}{'genetic.py':>12}{'NumPy':>10}{'diff / se':>11}")
+    for g in (0, 1, 3, 10, 50):
+        ref_gaps, np_gaps = [], []
+        for seed in range(seeds):
+            random.seed(seed)
+            ref_gaps.append(log_gap(reference.genetic_algorithm(g)[1]))
+            history = []
+            vectorized.genetic_algorithm_np(g, seed=seed, history=history)
+            np_gaps.append(log_gap(history[-1]))
+        se = np.sqrt((np.var(ref_gaps, ddof=1) + np.var(np_gaps, ddof=1)) / seeds)
+        z = (np.mean(np_gaps) - np.mean(ref_gaps)) / se
+        print(f"{g:>12}{np.mean(ref_gaps):>12.3f}{np.mean(np_gaps):>10.3f}{z:>11.2f}")
+        assert abs(z) < 4, f"genetic_numpy differs from genetic.py after {g} generations"
+
+    print(f"{'population':>12}{'list s':>10}{'NumPy s':>10}{'NumPy individuals/s':>22}")
+    size = 1000
+    while size <= largest:
+        list_s = "-"
+        if size <= 10**4:   # the list version gets too slow beyond this
+            random.seed(0)
+            t0 = time.perf_counter()
+            reference.genetic_algorithm(generations, size)
+            list_s = f"{time.perf_counter() - t0:.2f}"
+        t0 = time.perf_counter()
+        vectorized.genetic_algorithm_np(generations, size, seed=0)
+        seconds = time.perf_counter() - t0
+        print(f"{size:>12}{list_s:>10}{seconds:>10.2f}{size * generations / seconds:>22,.0f}")
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
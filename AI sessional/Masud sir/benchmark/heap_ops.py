@@ -0,0 +1,87 @@
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import weighted_neighbors
+from indexed_heap import IndexedHeap
+from script_loader import load_script
+
+# 🔹 Benchmark: a_star_search (heapq + lazy deletion, stale copies stay in
+#    the heap) vs A* with the indexed decrease-key heap, on a grid with random costs.
+#    Also shows how weighted A* (f = g + w*h) trades cost for expansions.
+#
+# Run:  python heap_ops.py [size]
+
+
+def weighted_grid(size, seed=0):
+    """size x size grid, edge costs 1..10, both directions."""
+    rng = random.Random(seed)
+    graph = {(r, c): {} for r in range(size) for c in range(size)}
+    for r in range(size):
+        for c in range(size):
+            for dr, dc in ((0, 1), (1, 0)):
+                if r + dr < size and c + dc < size:
+                    cost = rng.randint(1, 10)
+                    graph[(r, c)][(r + dr, c + dc)] = cost
+                    graph[(r + dr, c + dc)][(r, c)] = cost
+    return graph
+
+
+def a_star_indexed(start, goal, graph, h, stats):
+    """The decrease-key version: each node sits in the heap at most once."""
+    pq = IndexedHeap()
+    pq.push(start, (h[start], 0))
+    g_score = {start: 0}
+    while pq:
+        node, (f, g) = pq.pop()
+        if node == goal:
+            break
+        for neighbor, cost in weighted_neighbors(graph, node):
+            new_g = g + cost
+            if new_g < g_score.get(neighbor, float('inf')):
+                g_score[neighbor] = new_g
+                pq.update(neighbor, (new_g + h[neighbor], new_g))
+    stats.update(pq.stats(), stale_pops=0)
+    return g_score.get(goal, float('inf'))
+
+
+def timed(func, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+def main(size=150):
+    graph = weighted_grid(size)
+    start, goal = (0, 0), (size - 1, size - 1)
+    # Manhattan distance: admissible, since the cheapest edge costs 1
+    h = {(r, c): abs(goal[0] - r) + abs(goal[1] - c) for r, c in graph}
+
+    a_star = load_script("A star/A_star.py")
+
+    lazy_stats = {}
+    (_, lazy_cost), lazy_s = timed(a_star.a_star_search, start, goal, graph, h,
+                                   stats=lazy_stats)
+    indexed_stats = {}
+    indexed_cost, indexed_s = timed(a_star_indexed, start, goal, graph, h, indexed_stats)
+    assert lazy_cost == indexed_cost
+
+    print(f"Weighted grid {size}x{size}, optimal cost {lazy_cost}")
+    print(f"{'heap':<10}{'pushes':>10}{'pops':>10}{'stale pops':>12}{'decrease':>10}{'time s':>9}")
+    for name, st, s in (("heapq", lazy_stats, lazy_s), ("indexed", indexed_stats, indexed_s)):
+        print(f"{name:<10}{st['pushes']:>10}{st['pops']:>10}{st['stale_pops']:>12}"
+              f"{st.get('decrease_keys', 0):>10}{s:>9.3f}")
+
+    print()
+    print(f"{'weight':<10}{'expanded':>10}{'cost':>10}{'cost / opt':>12}{'time s':>9}")
+    for w in (1, 1.5, 2, 3, 5):
+        st = {}
+        (_, cost), s = timed(a_star.a_star_search, start, goal, graph, h, weight=w, stats=st)
+        print(f"{w:<10}{st['expanded']:>10}{cost:>10}{cost / lazy_cost:>12.3f}{s:>9.3f}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
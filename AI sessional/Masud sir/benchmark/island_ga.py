@@ -0,0 +1,40 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "genetic algorithom"))
+
+from islands import island_model
+
+# 🔹 Benchmark: island model on a multimodal function
+#    Rastrigin in 10-D (many local optima, best value 0 at x = 0):
+#    one big population  vs  the same individuals split into islands,
+#    in one process and in worker processes (evaluations per second).
+#
+# Run:  python island_ga.py [total population] [generations]
+
+
+def rastrigin(x):
+    """Negated Rastrigin function (the GA maximizes): 0 at x = 0, below 0 elsewhere."""
+    return -(10 * x.shape[1] + np.sum(x**2 - 10 * np.cos(2 * np.pi * x), axis=1))
+
+
+def main(total=8000, generations=200):
+    print(f"Rastrigin 10-D, {total} individuals, {generations} generations, "
+          f"{os.cpu_count()} cores")
+    print(f"{'run':<28}{'best value':>12}{'evaluations/s':>15}")
+    for islands in (1, 4, 8):
+        for processes in (False, True):
+            if islands == 1 and processes:
+                continue
+            report = island_model(islands, total // islands, generations, interval=20,
+                                  migrants=4, objective=rastrigin, dim=10, low=-5.12,
+                                  high=5.12, selection="tournament", processes=processes)
+            label = f"{islands} island(s), {'processes' if processes else 'one process'}"
+            print(f"{label:<28}{report['best_value']:>12.3f}"
+                  f"{report['evaluations_per_second']:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from script_loader import load_script
+
+# 🔹 Benchmark: iterative deepening with / without the transposition table
+#
+# Test graph: a "diamond chain" - layers of two nodes, each node linked to
+# both nodes of the next layer. Like C->F / E->F in the sample graph but
+# repeated, so there are 2^layers paths to the last layer.
+#
+# Run:  python iterative_deepening.py [layers]
+
+
+class CountingGraph(dict):
+    """dict graph that counts how often a node's neighbors are asked for."""
+
+    expansions = 0
+
+    def get(self, node, default=None):
+        self.expansions += 1
+        return super().get(node, default)
+
+
+def diamond_chain(layers):
+    graph = CountingGraph()
+    for i in range(layers):
+        nxt = [f"a{i + 1}", f"b{i + 1}"] if i + 1 < layers else []
+        graph[f"a{i}"] = list(nxt)
+        graph[f"b{i}"] = list(nxt)
+    return graph
+
+
+def main(layers=18):
+    iterative = load_script("iterative/iterative.py")
+    graph = diamond_chain(layers)
+    start, goal = "a0", f"b{layers - 1}"
+    # half the true distance: admissible but weak, so IDA* needs several rounds
+    h = {node: (layers - 1 - int(node[1:])) // 2 for node in graph}
+
+    print(f"Diamond chain: {layers} layers, {2 ** (layers - 1)} paths start -> goal")
+    print(f"{'search':<34}{'expansions':>12}{'time s':>10}")
+    runs = [
+        ("IDDFS, no transposition table", lambda: iterative.iterative_deepening_dfs(
+            start, goal, layers, graph, transposition=False)),
+        ("IDDFS, transposition table", lambda: iterative.iterative_deepening_dfs(
+            start, goal, layers, graph)),
+        ("IDA*, no transposition table", lambda: iterative.ida_star(
+            start, goal, graph, h, transposition=False)),
+        ("IDA*, transposition table", lambda: iterative.ida_star(
+            start, goal, graph, h, transposition=True)),
+    ]
+    for name, run in runs:
+        graph.expansions = 0
+        t0 = time.perf_counter()
+        result = run()
+        seconds = time.perf_counter() - t0
+        assert result is not None
+        print(f"{name:<34}{graph.expansions:>12}{seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,63 @@
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import CSRGraph
+from script_loader import load_script
+
+# 🔹 Benchmark: hop distances from many sources
+#    one Python BFS per source  vs  batched bitset BFS (Bfs/multi_source.py),
+#    on a random graph (few, wide levels) and on a long chain with a few
+#    shortcuts (thousands of levels with tiny frontiers, where pulling
+#    over every edge each level would dominate)
+#
+# Run:  python multi_source_bfs.py [num_nodes] [num_sources]
+
+
+def distances_one_source(csr, source):
+    dist = [-1] * csr.num_nodes()
+    dist[source] = 0
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for neighbor in csr.neighbor_ids(node):
+            if dist[neighbor] < 0:
+                dist[neighbor] = dist[node] + 1
+                queue.append(neighbor)
+    return dist
+
+
+def main(num_nodes=20000, num_sources=512):
+    rng = random.Random(0)
+    multi_source = load_script("Bfs/multi_source.py")
+    graphs = {
+        "random": [(u, rng.randrange(num_nodes)) for u in range(num_nodes) for _ in range(4)],
+        "chain": [(u, u + 1) for u in range(num_nodes - 1)]
+                 + [(rng.randrange(num_nodes), rng.randrange(num_nodes))
+                    for _ in range(num_nodes // 100)],
+    }
+    for name, edges in graphs.items():
+        csr = CSRGraph.from_edges(num_nodes, edges)
+        sources = rng.sample(range(num_nodes), num_sources)
+
+        t0 = time.perf_counter()
+        loop_rows = [distances_one_source(csr, s) for s in sources]
+        loop_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        matrix = multi_source.bfs_distance_matrix(csr, sources)
+        batch_s = time.perf_counter() - t0
+
+        assert all(list(row) == loop for row, loop in zip(matrix, loop_rows))
+        print(f"{name}: {num_nodes} nodes, {len(edges)} edges, {num_sources} sources, "
+              f"{matrix.max()} levels")
+        print(f"  per-source Python BFS : {loop_s:8.3f} s")
+        print(f"  batched bitset BFS    : {batch_s:8.3f} s  ({loop_s / batch_s:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
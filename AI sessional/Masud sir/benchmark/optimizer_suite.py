@@ -0,0 +1,77 @@
+import csv
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optimizers import OPTIMIZERS, TEST_FUNCTIONS, optimize, test_problem
+
+# 🔹 Benchmark suite: every optimizer on the standard test functions
+#    Sphere, Rastrigin, Rosenbrock and Ackley (all minimized, minimum 0)
+#    in several dimensions, a few seeds each, the same evaluation budget
+#    for everybody (see optimizers.py).
+#
+# One row per (function, dim, optimizer, seed) goes to <out>.csv and
+# <out>.json: best value, evaluations, wall time, evaluations per second.
+# The JSON rows also hold the curve [(evaluations, best value so far)].
+# Keep the report of a known-good version and compare new ones against it
+# to catch regressions.
+#
+# Run:  python optimizer_suite.py [budget] [seeds] [out]
+
+DIMS = (2, 10, 30)
+
+
+def run_suite(budget=20000, seeds=3, dims=DIMS):
+    """All rows of the report, as dicts."""
+    rows = []
+    for function in TEST_FUNCTIONS:
+        for dim in dims:
+            for name in OPTIMIZERS:
+                for seed in range(seeds):
+                    result = optimize(name, test_problem(function, dim, budget, seed))
+                    rows.append({"function": function, "dim": dim, "optimizer": name,
+                                 "seed": seed, "budget": budget,
+                                 "best_value": result["best_value"],
+                                 "evaluations": result["evaluations"],
+                                 "seconds": result["seconds"],
+                                 "evaluations_per_second": result["evaluations_per_second"],
+                                 "curve": result["curve"]})
+    return rows
+
+
+def write_report(rows, out):
+    with open(out + ".csv", "w", newline="") as f:
+        fields = [key for key in rows[0] if key != "curve"]
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(out + ".json", "w") as f:
+        json.dump(rows, f, indent=1)
+
+
+def main(budget=20000, seeds=3, out="optimizer_report"):
+    rows = run_suite(int(budget), int(seeds))
+    write_report(rows, out)
+
+    print(f"mean best value over {seeds} seeds, budget {budget} evaluations")
+    names = list(OPTIMIZERS)
+    print(f"{'function':<16}" + "".join(f"{name:>20}" for name in names))
+    for function in TEST_FUNCTIONS:
+        for dim in DIMS:
+            means = [np.mean([r["best_value"] for r in rows
+                              if (r["function"], r["dim"], r["optimizer"]) == (function, dim, name)])
+                     for name in names]
+            label = f"{function} {dim}-D"
+            print(f"{label:<16}" + "".join(f"{m:>20.4g}" for m in means))
+    speed = {name: np.mean([r["evaluations_per_second"] for r in rows if r["optimizer"] == name])
+             for name in names}
+    print(f"{'evaluations/s':<16}" + "".join(f"{speed[name]:>20,.0f}" for name in names))
+    print(f"{len(rows)} rows written to {out}.csv and {out}.json")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:4])
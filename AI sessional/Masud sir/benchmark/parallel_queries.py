@@ -0,0 +1,50 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from batch_queries import batch_search
+from csr_graph import CSRGraph
+from graph_file import open_graph, save_graph
+from script_loader import load_script
+
+# 🔹 Benchmark: many independent BFS queries
+#    one loop in this process  vs  batch_search on a process pool
+#    (workers map the same .csrg file), with one query per task and
+#    with the default chunking.
+#
+# Run:  python parallel_queries.py [num_nodes] [num_queries] [workers]
+
+
+def main(num_nodes=20000, num_queries=1000, workers=os.cpu_count() or 1):
+    rng = random.Random(0)
+    edges = [(u, rng.randrange(num_nodes)) for u in range(num_nodes) for _ in range(3)]
+    path = os.path.join(tempfile.mkdtemp(), "queries.csrg")
+    save_graph(CSRGraph.from_edges(num_nodes, edges), path)
+    graph = open_graph(path)
+    queries = [(rng.randrange(num_nodes), rng.randrange(num_nodes)) for _ in range(num_queries)]
+    bfs = load_script("Bfs/bfs.py")
+
+    print(f"{graph}, {num_queries} BFS queries, {workers} workers")
+    print(f"{'run':<34}{'seconds':>9}{'queries/s':>11}")
+
+    t0 = time.perf_counter()
+    expected = [bfs.bfs_shortest_path(s, g, graph) for s, g in queries]
+    seconds = time.perf_counter() - t0
+    print(f"{'one process':<34}{seconds:>9.2f}{num_queries / seconds:>11.0f}")
+
+    for label, chunksize in (("batch_search, 1 query per task", 1),
+                             ("batch_search, default chunks", None)):
+        t0 = time.perf_counter()
+        results = dict(batch_search(queries, graph, "bfs", workers, chunksize))
+        seconds = time.perf_counter() - t0
+        print(f"{label:<34}{seconds:>9.2f}{num_queries / seconds:>11.0f}")
+        assert [results[i] for i in range(num_queries)] == expected
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:4]])
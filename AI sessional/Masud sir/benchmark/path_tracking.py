@@ -0,0 +1,139 @@
+import heapq
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from script_loader import load_script
+
+# 🔹 Benchmark: copying `path + [neighbor]` on every push (the old way)
+#    vs parent pointers with one path rebuild at the goal (the new way).
+#
+# Test graph: a size x size grid, so the frontier is wide and every
+# path on it is deep (up to 2 * size steps).
+#
+# Run:  python path_tracking.py [size]
+
+
+def grid(size, moves=((0, 1), (1, 0), (0, -1), (-1, 0))):
+    graph = {}
+    for r in range(size):
+        for c in range(size):
+            graph[(r, c)] = [(r + dr, c + dc) for dr, dc in moves
+                             if 0 <= r + dr < size and 0 <= c + dc < size]
+    return graph
+
+
+def caterpillar(length):
+    """A chain 0 -> 1 -> ... with a dead-end leaf hanging off every node."""
+    graph = {}
+    for i in range(length):
+        graph[i] = [("leaf", i)] + ([i + 1] if i + 1 < length else [])
+        graph[("leaf", i)] = []
+    return graph
+
+
+# ---- the old path-copying versions, kept here only for comparison ----
+
+def bfs_copying(start, goal, graph):
+    queue = deque([[start]])
+    visited = set([start])
+    while queue:
+        path = queue.popleft()
+        node = path[-1]
+        if node == goal:
+            return path
+        for neighbor in graph[node]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(path + [neighbor])
+    return None
+
+
+def a_star_copying(start, goal, graph, h):
+    pq = [(h[start], 0, start, [start])]
+    g_score = {start: 0}
+    while pq:
+        f, g, node, path = heapq.heappop(pq)
+        if node == goal:
+            return path, g
+        if g > g_score.get(node, float('inf')):
+            continue
+        for neighbor in graph.get(node, []):
+            new_g = g + 1
+            if new_g < g_score.get(neighbor, float('inf')):
+                g_score[neighbor] = new_g
+                heapq.heappush(pq, (new_g + h[neighbor], new_g, neighbor, path + [neighbor]))
+    return None, float('inf')
+
+
+def dfs_limited_copying(start, goal, limit, graph):
+    stack = [(start, [start], 0)]
+    while stack:
+        node, path, depth = stack.pop()
+        if node == goal:
+            return path
+        if depth < limit:
+            for neighbor in graph.get(node, []):
+                stack.append((neighbor, path + [neighbor], depth + 1))
+    return None
+
+
+def peak(func, *args):
+    """Return (result, peak bytes, seconds) of one call."""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - t0
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak_bytes, seconds
+
+
+def cost(result):
+    """Path length, or the cost returned by A* (tie-breaking may differ)."""
+    if isinstance(result, tuple):
+        return result[1]
+    return len(result) if result else None
+
+
+def main(size=400):
+    graph = grid(size)
+    start, goal = (0, 0), (size - 1, size - 1)
+    zero_h = {node: 0 for node in graph}
+
+    bfs = load_script("Bfs/bfs.py")
+    a_star = load_script("A star/A_star.py")
+    dfs_limited = load_script("dfs_limited/dfs_limited.py")
+
+    # depth-limited DFS has no visited set; on a deep chain its stack
+    # holds one entry per level, each with a path as long as the level
+    deep = caterpillar(size * 5)
+    limit = len(deep)
+
+    cases = [
+        ("bfs_shortest_path",
+         (bfs_copying, start, goal, graph),
+         (bfs.bfs_shortest_path, start, goal, graph)),
+        ("a_star_search",
+         (a_star_copying, start, goal, graph, zero_h),
+         (a_star.a_star_search, start, goal, graph, zero_h)),
+        ("dfs_limited",
+         (dfs_limited_copying, 0, size * 5 - 1, limit, deep),
+         (dfs_limited.dfs_limited, 0, size * 5 - 1, limit, deep)),
+    ]
+
+    print(f"Grid with {len(graph)} nodes (dfs_limited: chain of depth {size * 5})")
+    print(f"{'function':<20}{'copying peak MB':>18}{'parent peak MB':>17}{'copying s':>12}{'parent s':>11}")
+    for name, (old, *old_args), (new, *new_args) in cases:
+        old_result, old_peak, old_s = peak(old, *old_args)
+        new_result, new_peak, new_s = peak(new, *new_args)
+        assert cost(old_result) == cost(new_result)
+        print(f"{name:<20}{old_peak / 1e6:>18.2f}{new_peak / 1e6:>17.2f}{old_s:>12.3f}{new_s:>11.3f}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
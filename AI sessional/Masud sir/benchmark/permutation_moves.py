@@ -0,0 +1,83 @@
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from permutation_search import (QueenBoard, Tour, candidate_lists, strip_tour, swap_annealing,
+                                swap_hill_climbing, tour_local_search)
+
+# 🔹 Benchmark: permutation local search with O(1) move deltas
+#    1. cost of evaluating one move: full recompute vs delta, by tour size
+#    2. 2-opt + or-opt with candidate lists on uniform random tours up to
+#       10^5 cities (the incremental length is checked against a recompute)
+#    3. n queens from a random permutation with swap moves, swaps drawn
+#       at random or from attacked rows
+#
+# Run:  python permutation_moves.py [max cities] [queens]
+
+
+def move_cost(n, moves=200):
+    """Microseconds per 2-opt evaluation: full recompute vs two_opt_delta."""
+    points = np.random.default_rng(0).random((n, 2))
+    tour = Tour(points, strip_tour(points))
+    rng = random.Random(0)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(moves)]
+    t0 = time.perf_counter()
+    for a, c in pairs[:20]:
+        tour.full_length()
+    full = (time.perf_counter() - t0) / 20
+    t0 = time.perf_counter()
+    for a, c in pairs:
+        tour.two_opt_delta(a, tour.next(a), c, tour.next(c))
+    delta = (time.perf_counter() - t0) / moves
+    return 1e6 * full, 1e6 * delta
+
+
+def main(max_cities=100000, queens=10000):
+    print("one move evaluated")
+    print(f"{'cities':>8}{'recompute us':>14}{'delta us':>10}")
+    for n in (1000, 10000, 100000):
+        full, delta = move_cost(n)
+        print(f"{n:>8}{full:>14.0f}{delta:>10.2f}")
+
+    print("2-opt + or-opt, 8 candidates per city, from a strip tour")
+    print(f"{'cities':>8}{'knn s':>8}{'search s':>10}{'moves':>9}{'start':>10}{'final':>10}"
+          f"{'gain':>7}{'check':>7}")
+    n = 1000
+    while n <= max_cities:
+        points = np.random.default_rng(n).random((n, 2))
+        tour = Tour(points, strip_tour(points))
+        start = tour.length
+        t0 = time.perf_counter()
+        neighbors = candidate_lists(points, 8)
+        t1 = time.perf_counter()
+        moves = tour_local_search(tour, neighbors)
+        t2 = time.perf_counter()
+        ok = abs(tour.length - tour.full_length()) < 1e-6 * tour.length
+        print(f"{n:>8}{t1 - t0:>8.2f}{t2 - t1:>10.2f}{moves:>9}{start:>10.1f}{tour.length:>10.1f}"
+              f"{1 - tour.length / start:>7.1%}{'ok' if ok else 'FAIL':>7}")
+        n *= 10
+
+    print(f"{queens} queens from a random permutation (attacking pairs)")
+    print(f"{'search':<12}{'swaps from':<16}{'swaps':>10}{'start':>8}{'final':>8}{'s':>7}")
+    for name, search in (("hill", swap_hill_climbing), ("annealing", swap_annealing)):
+        for label in ("random rows", "attacked rows"):
+            random.seed(0)
+            board = QueenBoard(random.sample(range(queens), queens))
+            start = board.cost()
+            pairs = board.attacked_pair if label == "attacked rows" else None
+            t0 = time.perf_counter()
+            if search is swap_annealing:
+                swaps = search(board, 50 * queens, 1.0, 0.05, pairs=pairs, target=0)
+            else:
+                swaps = search(board, 50 * queens, pairs=pairs, target=0)
+            assert board.cost() == QueenBoard(board.perm).cost()
+            print(f"{name:<12}{label:<16}{swaps:>10}{start:>8}{board.cost():>8}"
+                  f"{time.perf_counter() - t0:>7.2f}")
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,57 @@
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from path_cache import PathCache, VersionedGraph
+from script_loader import load_script
+
+# 🔹 Benchmark: repeated queries with and without PathCache
+#    Queries come from a few popular starts and goals (skewed, like real
+#    traffic); now and then an edge is added, which bumps the graph
+#    version, so every cached answer has to be computed again.
+#
+# Run:  python repeated_queries.py [num_nodes] [num_queries]
+
+
+def main(num_nodes=20000, num_queries=2000):
+    bfs = load_script("Bfs/bfs.py")
+    bd = load_script("bidirectional/bidirectional.py")
+    rng = random.Random(0)
+    graph = VersionedGraph({u: [rng.randrange(num_nodes) for _ in range(3)]
+                            for u in range(num_nodes)})
+    popular = [rng.randrange(num_nodes) for _ in range(50)]
+
+    def pick():
+        # 1/i-ish popularity: the first few nodes get most of the queries
+        return popular[min(int(rng.paretovariate(1.0)) - 1, len(popular) - 1)]
+
+    queries = [(pick(), pick()) for _ in range(num_queries)]
+    changes = set(rng.sample(range(num_queries), 5))
+
+    print(f"{num_nodes} nodes, {num_queries} queries, {len(changes)} graph changes")
+    print(f"{'search':<32}{'total s':>9}{'hit rate':>10}")
+    for name, uncached, cached in (
+            ("BFS", bfs.bfs_shortest_path, PathCache.bfs_shortest_path),
+            ("bidirectional", bd.bidirectional_search, PathCache.bidirectional_search)):
+        cache = PathCache(maxsize=500)
+        lengths = []
+        for label, run, used in ((f"{name}, no cache", uncached, None),
+                                 (f"{name}, PathCache", lambda s, g, G: cached(cache, s, g, G), cache)):
+            work = VersionedGraph({u: list(vs) for u, vs in graph.items()})
+            t0 = time.perf_counter()
+            results = []
+            for i, (s, g) in enumerate(queries):
+                if i in changes:
+                    work.add_edge(s, g)   # version + 1: old answers are stale
+                results.append(run(s, g, work))
+            seconds = time.perf_counter() - t0
+            rate = f"{used.stats()['hit_rate']:.2f}" if used else "-"
+            print(f"{label:<32}{seconds:>9.3f}{rate:>10}")
+            lengths.append([len(p or ()) for p in results])
+        assert lengths[0] == lengths[1]   # the cache never serves a stale path
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,66 @@
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from script_loader import load_script
+
+# 🔹 Benchmark: replanning after edge changes
+#    LPA* repairing its previous search  vs  a_star_search from scratch.
+#    Every round a few roads change cost: one on the current best path
+#    gets much slower (forces a detour), the others change at random.
+#
+# Run:  python replanning.py [size] [rounds] [changes per round]
+
+
+def main(size=80, rounds=50, changes=4):
+    a_star = load_script("A star/A_star.py")
+    lpa = load_script("A star/lpa_star.py")
+    graph = load_script("benchmark/heap_ops.py").weighted_grid(size)
+    start, goal = (0, 0), (size - 1, size - 1)
+    h = {(r, c): abs(goal[0] - r) + abs(goal[1] - c) for r, c in graph}
+    rng = random.Random(1)
+
+    planner = lpa.LPAStar(graph, start, goal, h)
+    stats = {}
+    t0 = time.perf_counter()
+    path, cost = planner.plan(stats)
+    first_s = time.perf_counter() - t0
+    print(f"Weighted grid {size}x{size}: first plan {stats['expanded']} expansions, "
+          f"{first_s:.3f} s")
+
+    totals = {"LPA* (repair)": [0, 0.0], "A* (from scratch)": [0, 0.0]}
+    for _ in range(rounds):
+        u = rng.randrange(len(path) - 1)
+        edited = [(path[u], path[u + 1], rng.randint(20, 40))]
+        nodes = list(planner.graph)
+        for _ in range(changes - 1):
+            a = rng.choice(nodes)
+            edited.append((a, rng.choice(list(planner.graph[a])), rng.randint(1, 10)))
+        for a, b, c in edited:     # roads go both ways
+            planner.update_edge(a, b, c)
+            planner.update_edge(b, a, c)
+
+        stats = {}
+        t0 = time.perf_counter()
+        path, cost = planner.plan(stats)
+        totals["LPA* (repair)"][0] += stats['expanded']
+        totals["LPA* (repair)"][1] += time.perf_counter() - t0
+
+        stats = {}
+        t0 = time.perf_counter()
+        _, full_cost = a_star.a_star_search(start, goal, planner.graph, h, stats=stats)
+        totals["A* (from scratch)"][0] += stats['expanded']
+        totals["A* (from scratch)"][1] += time.perf_counter() - t0
+        assert cost == full_cost
+
+    print(f"{rounds} rounds x {changes} changed edges")
+    print(f"{'replanner':<20}{'expanded/round':>16}{'ms/round':>10}")
+    for name, (expanded, seconds) in totals.items():
+        print(f"{name:<20}{expanded / rounds:>16.0f}{1000 * seconds / rounds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:4]])
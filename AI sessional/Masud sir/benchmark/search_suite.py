@@ -0,0 +1,138 @@
+import csv
+import json
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from landmarks import build_landmarks
+from script_loader import load_script
+from search_stats import STAT_KEYS
+
+# 🔹 Benchmark suite: every search on every kind of graph, growing sizes
+#
+# Graph families (all seeded, so runs are repeatable):
+#   random      every node links to 3 random nodes (directed)
+#   grid        square grid, 4 neighbors (long shortest paths)
+#   scale_free  preferential attachment: a few huge hubs (short paths)
+# For each family and size a few (start, goal) pairs are drawn and every
+# search runs with stats={} (see search_stats.py). Greedy and A* get a
+# landmark heuristic (landmarks.py), built before the timing starts.
+#
+# One row per (family, size, query, search) goes to <out>.csv / <out>.json;
+# plot seconds or expanded against nodes to spot where a search falls off
+# a cliff.
+#
+# Run:  python search_suite.py [largest] [queries] [out]
+
+
+def random_graph(n, seed=0, degree=3):
+    rng = random.Random(seed)
+    return {u: [rng.randrange(n) for _ in range(degree)] for u in range(n)}
+
+
+def grid_graph(n, seed=0):
+    """side x side grid with side = sqrt(n), both directions."""
+    side = max(2, int(n ** 0.5))
+    graph = {}
+    for r in range(side):
+        for c in range(side):
+            graph[r * side + c] = [nr * side + nc
+                                   for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1))
+                                   if 0 <= nr < side and 0 <= nc < side]
+    return graph
+
+
+def scale_free_graph(n, seed=0, links=2):
+    """Barabasi-Albert: each new node links to `links` nodes, picked by degree."""
+    rng = random.Random(seed)
+    graph = {u: [] for u in range(n)}
+    ends = list(range(links))   # every edge end once: picking from it favors hubs
+    for u in range(links, n):
+        for v in {rng.choice(ends) for _ in range(links)}:
+            graph[u].append(v)
+            graph[v].append(u)
+            ends += (u, v)
+    return graph
+
+
+FAMILIES = {"random": random_graph, "grid": grid_graph, "scale_free": scale_free_graph}
+
+
+def searches():
+    """name -> run(start, goal, graph, h, depth, stats) for every search."""
+    bfs = load_script("Bfs/bfs.py")
+    dfs = load_script("DFS/dfs.py")
+    dls = load_script("dfs_limited/dfs_limited.py")
+    iterative = load_script("iterative/iterative.py")
+    bd = load_script("bidirectional/bidirectional.py")
+    greedy = load_script("greedy best first search/greedy_best_first.py")
+    a_star = load_script("A star/A_star.py")
+    return {
+        "bfs": lambda s, g, G, h, d, st: bfs.bfs_shortest_path(s, g, G, stats=st),
+        "dfs": lambda s, g, G, h, d, st: dfs.dfs_path(s, g, G, stats=st),
+        "depth_limited": lambda s, g, G, h, d, st: dls.dfs_limited(s, g, d, G, stats=st),
+        "iddfs": lambda s, g, G, h, d, st: iterative.iterative_deepening_dfs(s, g, d, G, stats=st),
+        "bidirectional": lambda s, g, G, h, d, st: bd.bidirectional_search(s, g, G, stats=st),
+        "greedy": lambda s, g, G, h, d, st: greedy.greedy_best_first_search(s, g, G, h, stats=st),
+        "a_star": lambda s, g, G, h, d, st: a_star.a_star_search(s, g, G, h, stats=st)[0],
+    }
+
+
+def run_suite(sizes, queries=3, seed=0):
+    """All rows of the report, as dicts."""
+    bfs = load_script("Bfs/bfs.py")
+    runs = searches()
+    rows = []
+    for family, make in FAMILIES.items():
+        for n in sizes:
+            graph = make(n, seed)
+            num_edges = sum(map(len, graph.values()))
+            landmarks = build_landmarks(graph, k=4, seed=seed)
+            rng = random.Random(seed)
+            nodes = list(graph)
+            for q in range(queries):
+                # a goal the start can reach (the BFS depth is the DLS/IDDFS limit)
+                start = rng.choice(nodes)
+                tree = bfs.bfs_tree(start, graph)
+                goal = rng.choice(list(tree))
+                depth = len(bfs.reconstruct_path(tree, goal)) - 1
+                h = landmarks.heuristic(goal)
+                for name, run in runs.items():
+                    stats = {}
+                    path = run(start, goal, graph, h, depth, stats)
+                    row = {"family": family, "nodes": len(graph), "edges": num_edges,
+                           "query": q, "search": name, "depth": depth,
+                           "found": path is not None,
+                           "path_edges": len(path) - 1 if path else None}
+                    row.update((key, stats[key]) for key in STAT_KEYS)
+                    rows.append(row)
+                    print(f"{family:<11}{len(graph):>8}  q{q}  {name:<14}"
+                          f"{stats['expanded']:>10}{stats['seconds']:>10.4f} s")
+    return rows
+
+
+def write_report(rows, out):
+    with open(out + ".csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(out + ".json", "w") as f:
+        json.dump(rows, f, indent=1)
+
+
+def main(largest=10000, queries=3, out="search_report"):
+    largest = int(largest)
+    sizes = []
+    n = 100
+    while n <= largest:
+        sizes.append(n)
+        n *= 10
+    rows = run_suite(sizes, int(queries))
+    write_report(rows, out)
+    print(f"{len(rows)} rows written to {out}.csv and {out}.json")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:4])
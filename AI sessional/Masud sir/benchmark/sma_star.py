@@ -0,0 +1,43 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from script_loader import load_script
+
+# 🔹 Benchmark: A* vs SMA* with shrinking node budgets
+#    A* keeps every generated node (g_score + queue); SMA* keeps at most
+#    max_nodes and pays for it with re-expansions - gently at first, then
+#    steeply once the budget gets close to what the search really needs.
+#
+# Run:  python sma_star.py [size]
+
+
+def main(size=20):
+    a_star = load_script("A star/A_star.py")
+    graph = load_script("benchmark/heap_ops.py").weighted_grid(size)
+    start, goal = (0, 0), (size - 1, size - 1)
+    h = {(r, c): abs(goal[0] - r) + abs(goal[1] - c) for r, c in graph}
+
+    stats = {}
+    t0 = time.perf_counter()
+    _, best = a_star.a_star_search(start, goal, graph, h, stats=stats)
+    a_star_s = time.perf_counter() - t0
+
+    print(f"Weighted grid {size}x{size}, optimal cost {best}")
+    print(f"{'search':<22}{'nodes kept':>12}{'expanded':>10}{'cost':>8}{'time s':>9}")
+    print(f"{'A*':<22}{stats['pushes']:>12}{stats['expanded']:>10}{best:>8}{a_star_s:>9.3f}")
+
+    kept = stats['pushes']
+    for budget in (kept, kept * 3 // 4, kept // 2, kept // 4):
+        stats = {}
+        t0 = time.perf_counter()
+        _, cost = a_star.sma_star_search(start, goal, graph, h, max_nodes=budget, stats=stats)
+        seconds = time.perf_counter() - t0
+        name = f"SMA* max_nodes={budget}"
+        print(f"{name:<22}{stats['peak_nodes']:>12}{stats['expanded']:>10}{cost:>8}{seconds:>9.3f}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
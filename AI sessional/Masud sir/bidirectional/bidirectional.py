@@ -1,5 +1,15 @@
+import os
+import sys
 from collections import deque
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import weighted_neighbors
+from graph_file import open_graph, parse_node
+from indexed_heap import IndexedHeap
+from search_stats import SearchStats
+from state_space import as_heuristic
+
 # 🔹 Built-in graph (same style as before)
 graph = {
     'A': ['B', 'C'],
@@ -10,17 +20,62 @@ graph = {
     'F': []
 }
 
+# 🔹 Weighted version: {node: {neighbor: edge cost}}
+weighted_graph = {
+    'A': {'B': 1, 'C': 4},
+    'B': {'D': 2, 'E': 1},
+    'C': {'F': 1},
+    'D': {},
+    'E': {'F': 2},
+    'F': {}
+}
+
 def build_reverse_graph(graph):
     """Create reverse adjacency list for searching backwards from goal."""
-    rev = {node: [] for node in graph}
+    if hasattr(graph, "reverse"):
+        return graph.reverse()   # CSRGraph builds and caches its own
+    weighted = any(isinstance(graph[u], dict) for u in graph)
+    rev = {node: {} if weighted else [] for node in graph}
     for u in graph:
-        for v in graph[u]:
+        for v, cost in weighted_neighbors(graph, u):
             if v not in rev:
-                rev[v] = []
-            rev[v].append(u)
+                rev[v] = {} if weighted else []
+            if weighted:
+                rev[v][u] = cost
+            else:
+                rev[v].append(u)
+    return rev
+
+
+# reverse graphs already built: id(graph) -> (graph, version, reverse graph)
+# (the graph itself is kept so its id can't be reused by a new object)
+_reverse_cache = {}
+REVERSE_CACHE_SIZE = 8
+
+
+def get_reverse_graph(graph):
+    """
+    build_reverse_graph, but only once per graph: later queries on the
+    same graph reuse it. A graph with a `version` (path_cache.VersionedGraph)
+    gets a new one after every change; for a plain dict graph edited in
+    place, call forget_reverse_graph(graph).
+    """
+    version = getattr(graph, "version", 0)
+    hit = _reverse_cache.get(id(graph))
+    if hit is not None and hit[0] is graph and hit[1] == version:
+        return hit[2]
+    _reverse_cache.pop(id(graph), None)
+    if len(_reverse_cache) >= REVERSE_CACHE_SIZE:
+        del _reverse_cache[next(iter(_reverse_cache))]   # drop the oldest
+    rev = build_reverse_graph(graph)
+    _reverse_cache[id(graph)] = (graph, version, rev)
     return rev
 
 
+def forget_reverse_graph(graph):
+    _reverse_cache.pop(id(graph), None)
+
+
 def reconstruct_path(meet, front_parent, back_parent):
     """Rebuild full path from start -> meet -> goal."""
     # from start to meet
@@ -42,14 +97,45 @@ def reconstruct_path(meet, front_parent, back_parent):
     return path_front + path_back
 
 
-def bidirectional_search(start, goal):
+def expand_level(queue, adj, parent, other_parent, counter=None):
+    """
+    Expand one whole BFS level of one side.
+    parent doubles as this side's visited set.
+    Returns the meeting node if we touched the other side, else None.
+    counter : optional SearchStats to count the expansions in
+    """
+    for _ in range(len(queue)):
+        current = queue.popleft()
+
+        neighbors = adj.get(current, [])
+        if counter:
+            # keyed per side: each side may expand the same node once
+            counter.expand((id(parent), current), len(neighbors))
+        for neighbor in neighbors:
+            if neighbor not in parent:
+                parent[neighbor] = current
+                queue.append(neighbor)
+
+                # check if this node was reached from the other side
+                if neighbor in other_parent:
+                    return neighbor
+    return None
+
+
+def bidirectional_search(start, goal, graph=graph, stats=None):
+    # stats: optional dict, filled with search counts (see search_stats.py)
+    counter = SearchStats() if stats is not None else None
+    try:
+        return _bidirectional_search(start, goal, graph, counter)
+    finally:
+        if counter:
+            counter.report(stats)
+
+
+def _bidirectional_search(start, goal, graph, counter):
     if start == goal:
         return [start]
 
-    # forward and backward visited sets
-    front_visited = {start}
-    back_visited = {goal}
-
     front_parent = {start: None}
     back_parent = {goal: None}
 
@@ -57,44 +143,119 @@ def bidirectional_search(start, goal):
     front_queue = deque([start])
     back_queue = deque([goal])
 
-    # reverse graph for backward search
-    rev_graph = build_reverse_graph(graph)
+    # reverse graph for backward search (built once per graph)
+    rev_graph = get_reverse_graph(graph)
 
     while front_queue and back_queue:
-        # ---- expand one step from the front side ----
-        for _ in range(len(front_queue)):
-            current = front_queue.popleft()
-
-            for neighbor in graph.get(current, []):
-                if neighbor not in front_visited:
-                    front_visited.add(neighbor)
-                    front_parent[neighbor] = current
-                    front_queue.append(neighbor)
-
-                    # check if this node was reached from the other side
-                    if neighbor in back_visited:
-                        return reconstruct_path(neighbor, front_parent, back_parent)
-
-        # ---- expand one step from the back side ----
-        for _ in range(len(back_queue)):
-            current = back_queue.popleft()
-
-            for neighbor in rev_graph.get(current, []):
-                if neighbor not in back_visited:
-                    back_visited.add(neighbor)
-                    back_parent[neighbor] = current
-                    back_queue.append(neighbor)
-
-                    # check meeting
-                    if neighbor in front_visited:
-                        return reconstruct_path(neighbor, front_parent, back_parent)
+        # ---- expand the side with the smaller frontier ----
+        # (a hub near one end makes that side explode; growing the
+        #  other side instead keeps the total work small)
+        if len(front_queue) <= len(back_queue):
+            meet = expand_level(front_queue, graph, front_parent, back_parent, counter)
+        else:
+            meet = expand_level(back_queue, rev_graph, back_parent, front_parent, counter)
+        if counter:
+            counter.observe(len(front_queue) + len(back_queue),
+                            len(front_parent) + len(back_parent))
+
+        if meet is not None:
+            return reconstruct_path(meet, front_parent, back_parent)
 
     # no connection
     return None
 
 
+def bidirectional_dijkstra(start, goal, graph=graph, h=None, h_back=None, stats=None):
+    """
+    Bidirectional Dijkstra for weighted graphs (bidirectional A* if
+    heuristics are given). Returns (path, cost) like a_star_search.
+
+    h      : estimate of the cost from a node to goal  (forward search)
+    h_back : estimate of the cost from start to a node (backward search)
+             (h dicts, heuristic functions or landmarks.LandmarkHeuristic)
+
+    Meeting the other side is NOT enough to stop: a cheaper path may
+    still pass through nodes neither side has settled. We keep `best`,
+    the cheapest start -> goal path seen so far, and stop when
+      no heuristic : top key forward + top key backward >= best
+      heuristics   : either top key (g + h) >= best
+    since no path through the unexplored part can then be cheaper.
+    stats : optional dict, filled with search counts (see search_stats.py)
+    """
+    counter = SearchStats() if stats is not None else None
+    try:
+        return _bidirectional_dijkstra(start, goal, graph, h, h_back, counter)
+    finally:
+        if counter:
+            counter.report(stats)
+
+
+def _bidirectional_dijkstra(start, goal, graph, h, h_back, counter):
+    if start == goal:
+        return [start], 0
+
+    heuristic = h is not None or h_back is not None
+    # dicts, heuristic functions or LandmarkHeuristics: all read as h[node]
+    h = as_heuristic(h if h is not None else lambda node: 0)
+    h_back = as_heuristic(h_back if h_back is not None else lambda node: 0)
+    rev_graph = get_reverse_graph(graph)
+
+    # one record per side: (heap, g, parent, adjacency, heuristic)
+    front = (IndexedHeap(), {start: 0}, {start: None}, graph, h)
+    back = (IndexedHeap(), {goal: 0}, {goal: None}, rev_graph, h_back)
+    front[0].push(start, h[start])
+    back[0].push(goal, h_back[goal])
+
+    best = float('inf')
+    meet = None
+
+    while front[0] and back[0]:
+        top_front = front[0].peek()[1]
+        top_back = back[0].peek()[1]
+        if heuristic:
+            if max(top_front, top_back) >= best:
+                break
+        elif top_front + top_back >= best:
+            break
+
+        # expand the side with the smaller frontier
+        side, other = (front, back) if len(front[0]) <= len(back[0]) else (back, front)
+        heap, g, parent, adj, est = side
+        node, _ = heap.pop()
+
+        neighbors = weighted_neighbors(adj, node)
+        if counter:
+            counter.expand((side is back, node), len(neighbors))
+            counter.observe(len(front[0]) + len(back[0]), len(front[1]) + len(back[1]))
+        for neighbor, cost in neighbors:
+            new_g = g[node] + cost
+            if new_g < g.get(neighbor, float('inf')):
+                g[neighbor] = new_g
+                parent[neighbor] = node
+                heap.update(neighbor, new_g + est[neighbor])
+
+                # a start -> goal path through neighbor
+                if neighbor in other[1] and new_g + other[1][neighbor] < best:
+                    best = new_g + other[1][neighbor]
+                    meet = neighbor
+
+    if meet is None:
+        return None, float('inf')
+    return reconstruct_path(meet, front[2], back[2]), best
+
+
 # ---- Example run ----
-start = 'A'
-goal = 'F'
-path = bidirectional_search(start, goal)
-print("Bidirectional Search path from", start, "to", goal, "=>", path)
+if __name__ == "__main__":
+    start = 'A'
+    goal = 'F'
+    # python bidirectional.py graph.csrg START GOAL  -> search a converted graph file
+    if len(sys.argv) > 3:
+        graph = open_graph(sys.argv[1])
+        start, goal = parse_node(graph, sys.argv[2]), parse_node(graph, sys.argv[3])
+    path = bidirectional_search(start, goal, graph)
+    print("Bidirectional Search path from", start, "to", goal, "=>", path)
+
+    if len(sys.argv) <= 3:
+        graph = weighted_graph
+    path, cost = bidirectional_dijkstra(start, goal, graph)
+    print("Bidirectional Dijkstra path from", start, "to", goal, "=>", path, "with cost", cost)
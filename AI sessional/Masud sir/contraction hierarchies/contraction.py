@@ -0,0 +1,368 @@
+import heapq
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import CSRGraph
+from graph_file import open_graph, parse_node
+from search_stats import SearchStats
+
+# 🔹 Contraction hierarchies (CH): preprocess once, then answer many
+#    shortest-path queries on the same (static) graph very fast.
+#
+# Preprocessing contracts the nodes one by one, least important first.
+# Contracting v removes it from the graph; for every pair u -> v -> w
+# whose shortest u..w path went through v a SHORTCUT edge u -> w (with
+# cost u->v + v->w) is added, so distances between the remaining nodes
+# stay the same. The position of v in this order is its rank.
+#
+# A query is a bidirectional Dijkstra that only goes UP in rank: forward
+# from start along edges to higher-ranked nodes, backward from goal the
+# same way. Both searches meet at the highest node of the shortest path,
+# and each only sees a few hundred nodes even on big graphs. Shortcuts on
+# the found path are unpacked again into the original edges.
+
+# 🔹 Weighted graph (same style as the other scripts)
+weighted_graph = {
+    'A': {'B': 1, 'C': 4},
+    'B': {'D': 2, 'E': 1},
+    'C': {'F': 1},
+    'D': {},
+    'E': {'F': 2},
+    'F': {}
+}
+
+INF = float('inf')
+NO_MIDDLE = -1   # middle of an original (not shortcut) edge
+
+
+class ContractionHierarchy:
+    """
+    The preprocessed graph, on node ids.
+
+    graph : original graph (CSRGraph), used for label <-> id
+    rank  : rank[v] = when v was contracted
+    up    : CSRGraph of the edges u -> w with rank[w] > rank[u]
+    down  : CSRGraph of the edges u -> w with rank[u] > rank[w], stored
+            reversed (w -> u) so the backward search also goes up
+    up_middle / down_middle : per edge, the contracted node a shortcut
+            skips over (NO_MIDDLE for original edges)
+    """
+
+    def __init__(self, graph, rank, up, up_middle, down, down_middle):
+        self.graph = graph
+        self.rank = rank
+        self.up = up
+        self.up_middle = up_middle
+        self.down = down
+        self.down_middle = down_middle
+
+    def num_shortcuts(self):
+        return (sum(1 for m in self.up_middle if m != NO_MIDDLE)
+                + sum(1 for m in self.down_middle if m != NO_MIDDLE))
+
+    def query(self, start, goal, stats=None):
+        """
+        Shortest path start -> goal: returns (path, cost), or (None, inf).
+        stats : optional dict, filled with the number of settled nodes and
+                the search counts of search_stats.py
+        """
+        counter = SearchStats() if stats is not None else None
+        s, t = self.graph.id_of(start), self.graph.id_of(goal)
+        dist = ({s: 0}, {t: 0})
+        parent = ({s: None}, {t: None})
+        queues = ([(0, s)], [(0, t)])
+        adj = (self.up, self.down)
+        best, meet = INF, None
+        settled = 0
+
+        while queues[0] or queues[1]:
+            tops = [q[0][0] if q else INF for q in queues]
+            if min(tops) >= best:
+                break   # neither side can still find a shorter meeting
+            side = 0 if tops[0] <= tops[1] else 1
+            d, u = heapq.heappop(queues[side])
+            if d > dist[side][u]:
+                continue   # stale copy
+            settled += 1
+            if u in dist[1 - side] and d + dist[1 - side][u] < best:
+                best, meet = d + dist[1 - side][u], u
+            graph = adj[side]
+            if counter:
+                counter.expand((side, u), graph.offsets[u + 1] - graph.offsets[u])
+                counter.observe(len(queues[0]) + len(queues[1]), len(dist[0]) + len(dist[1]))
+            for v, w in zip(graph.neighbor_ids(u), graph.neighbor_weights(u)):
+                nd = d + w
+                if nd < dist[side].get(v, INF):
+                    dist[side][v] = nd
+                    parent[side][v] = u
+                    heapq.heappush(queues[side], (nd, v))
+
+        if counter:
+            counter.report(stats)
+            stats.update(settled=settled)
+        if meet is None:
+            return None, INF
+
+        # start .. meet .. goal in the hierarchy, then unpack the shortcuts
+        ids = []
+        node = meet
+        while node is not None:
+            ids.append(node)
+            node = parent[0][node]
+        ids.reverse()
+        node = parent[1][meet]
+        while node is not None:
+            ids.append(node)
+            node = parent[1][node]
+
+        path = [ids[0]]
+        for u, w in zip(ids, ids[1:]):
+            path.extend(self._unpack(u, w))
+        return [self.graph.label_of(v) for v in path], best
+
+    def _middle(self, u, w):
+        """Middle node of the hierarchy edge u -> w (cheapest copy)."""
+        if self.rank[u] < self.rank[w]:
+            graph, middle, a, b = self.up, self.up_middle, u, w
+        else:
+            graph, middle, a, b = self.down, self.down_middle, w, u
+        first = graph.offsets[a]
+        options = [(cost, middle[first + j])
+                   for j, (v, cost) in enumerate(zip(graph.neighbor_ids(a),
+                                                     graph.neighbor_weights(a)))
+                   if v == b]
+        return min(options)[1]
+
+    def _unpack(self, u, w):
+        """Original nodes after u on the edge u -> w (w included)."""
+        nodes = []
+        stack = [(u, w)]
+        while stack:
+            a, b = stack.pop()
+            m = self._middle(a, b)
+            if m == NO_MIDDLE:
+                nodes.append(b)
+            else:
+                stack.append((m, b))   # second half after the first
+                stack.append((a, m))
+        return nodes
+
+
+# ---- preprocessing ----
+
+def _witness_search(out, source, skip, limit, max_settled):
+    """
+    Dijkstra from source that never passes `skip`, up to cost `limit`.
+    Stopping after max_settled nodes keeps it cheap; a witness it misses
+    only costs an unneeded shortcut, never a wrong distance.
+    """
+    dist = {source: 0}
+    pq = [(0, source)]
+    settled = 0
+    while pq and settled < max_settled:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        if d > limit:
+            break
+        settled += 1
+        for v, w in out[u].items():
+            if v != skip:
+                nd = d + w
+                if nd < dist.get(v, INF):
+                    dist[v] = nd
+                    heapq.heappush(pq, (nd, v))
+    return dist
+
+
+def _shortcuts(out, inn, v, max_settled):
+    """Shortcuts (u, w, cost) needed if v is contracted now."""
+    needed = []
+    for u, cost_uv in inn[v].items():
+        through = {w: cost_uv + cost_vw for w, cost_vw in out[v].items() if w != u}
+        if not through:
+            continue
+        dist = _witness_search(out, u, v, max(through.values()), max_settled)
+        for w, cost in through.items():
+            if dist.get(w, INF) > cost:
+                needed.append((u, w, cost))
+    return needed
+
+
+def build_hierarchy(graph, max_settled=50):
+    """
+    Contract every node of `graph` (dict graph or CSRGraph).
+
+    Order: least important first, by "edge difference" (shortcuts added
+    minus edges removed) plus the number of already contracted neighbors
+    (spreads the contraction evenly over the graph). Priorities change
+    as neighbors get contracted, so they are recomputed lazily when a
+    node reaches the top of the queue.
+    max_settled : node limit for each witness search
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
+    n = csr.num_nodes()
+
+    # remaining graph as dicts (keeps the cheapest of parallel edges)
+    out = [{} for _ in range(n)]
+    inn = [{} for _ in range(n)]
+    for u in range(n):
+        for v, w in zip(csr.neighbor_ids(u), csr.neighbor_weights(u)):
+            if v != u and w < out[u].get(v, INF):
+                out[u][v] = w
+                inn[v][u] = w
+    middle = {}                       # (u, w) -> node a shortcut skips
+    contracted_neighbors = [0] * n
+
+    def priority(v):
+        """(priority, shortcuts contracting v would add right now)"""
+        needed = _shortcuts(out, inn, v, max_settled)
+        removed = len(out[v]) + len(inn[v])
+        return len(needed) - removed + contracted_neighbors[v], needed
+
+    pq = [(priority(v)[0], v) for v in range(n)]
+    heapq.heapify(pq)
+    rank = array('i', bytes(4 * n))
+    up_edges = [None] * n             # v -> [(w, cost, middle)], rank[w] > rank[v]
+    down_edges = [None] * n           # v -> [(u, cost, middle)] for edges u -> v
+    next_rank = 0
+
+    while pq:
+        _, v = heapq.heappop(pq)
+        p, needed = priority(v)
+        if pq and p > pq[0][0]:
+            heapq.heappush(pq, (p, v))   # got worse since it was queued
+            continue
+
+        for u, w, cost in needed:
+            if cost < out[u].get(w, INF):
+                out[u][w] = cost
+                inn[w][u] = cost
+                middle[(u, w)] = v
+
+        # every edge v still has leads to a node contracted later
+        up_edges[v] = [(w, cost, middle.get((v, w), NO_MIDDLE)) for w, cost in out[v].items()]
+        down_edges[v] = [(u, cost, middle.get((u, v), NO_MIDDLE)) for u, cost in inn[v].items()]
+        for w in out[v]:
+            del inn[w][v]
+            contracted_neighbors[w] += 1
+        for u in inn[v]:
+            del out[u][v]
+            contracted_neighbors[u] += 1
+        out[v] = inn[v] = None
+        rank[v] = next_rank
+        next_rank += 1
+
+    up, up_middle = _to_csr(up_edges)
+    down, down_middle = _to_csr(down_edges)
+    return ContractionHierarchy(csr, rank, up, up_middle, down, down_middle)
+
+
+def _to_csr(edge_lists):
+    offsets = array('q', [0])
+    targets = array('i')
+    costs = array('d')
+    middles = array('i')
+    for edges in edge_lists:
+        for target, cost, m in edges:
+            targets.append(target)
+            costs.append(cost)
+            middles.append(m)
+        offsets.append(len(targets))
+    return CSRGraph(offsets, targets, None, costs), middles
+
+
+# ---- hierarchy file (.ch) ----
+#
+# Layout (little endian, every section 8-byte aligned, like .csrg):
+#   header       magic, version, n, up edges, down edges
+#   rank         int32 x n
+#   up           offsets int64 x (n+1), targets int32, costs float64, middles int32
+#   down         (same)
+# Labels are not stored: open it together with the graph file.
+
+MAGIC = b"CHGR"
+VERSION = 1
+HEADER = struct.Struct("<4sIqqq")   # magic, version, n, up edges, down edges
+
+
+def save_hierarchy(hierarchy, path):
+    """Write a ContractionHierarchy to `path`."""
+    n = hierarchy.graph.num_nodes()
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, n, hierarchy.up.num_edges(),
+                            hierarchy.down.num_edges()))
+
+        def section(values, typecode):
+            f.write(bytes(((f.tell() + 7) & ~7) - f.tell()))
+            f.write(array(typecode, values).tobytes())
+
+        section(hierarchy.rank, 'i')
+        for graph, middles in ((hierarchy.up, hierarchy.up_middle),
+                               (hierarchy.down, hierarchy.down_middle)):
+            section(graph.offsets, 'q')
+            section(graph.targets, 'i')
+            section(graph.weights, 'd')
+            section(middles, 'i')
+
+
+def open_hierarchy(path, graph):
+    """Map a .ch file read-only; `graph` is the graph it was built from."""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mm)
+
+    magic, version, n, m_up, m_down = HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} contraction hierarchy")
+    if n != graph.num_nodes():
+        raise ValueError(f"{path} has {n} nodes, the graph has {graph.num_nodes()}")
+
+    pos = HEADER.size
+
+    def section(count, typecode, itemsize):
+        nonlocal pos
+        pos = (pos + 7) & ~7
+        part = view[pos:pos + count * itemsize].cast(typecode)
+        pos += count * itemsize
+        return part
+
+    rank = section(n, 'i', 4)
+    parts = []
+    for m in (m_up, m_down):
+        offsets = section(n + 1, 'q', 8)
+        targets = section(m, 'i', 4)
+        costs = section(m, 'd', 8)
+        parts.append(CSRGraph(offsets, targets, None, costs))
+        parts.append(section(m, 'i', 4))
+
+    hierarchy = ContractionHierarchy(graph, rank, *parts)
+    hierarchy.mapping = mm   # keep the mapping alive as long as the hierarchy
+    return hierarchy
+
+
+# ---- Example run ----
+if __name__ == "__main__":
+    # python contraction.py graph.csrg OUT.ch              -> preprocess a graph file
+    # python contraction.py graph.csrg graph.ch START GOAL -> query it
+    if len(sys.argv) == 3:
+        graph = open_graph(sys.argv[1])
+        hierarchy = build_hierarchy(graph)
+        save_hierarchy(hierarchy, sys.argv[2])
+        print(f"{graph!r}: {hierarchy.num_shortcuts()} shortcuts, written to {sys.argv[2]}")
+        sys.exit()
+
+    if len(sys.argv) > 4:
+        graph = open_graph(sys.argv[1])
+        hierarchy = open_hierarchy(sys.argv[2], graph)
+        start, goal = parse_node(graph, sys.argv[3]), parse_node(graph, sys.argv[4])
+    else:
+        hierarchy = build_hierarchy(weighted_graph)
+        start, goal = 'A', 'F'
+    path, cost = hierarchy.query(start, goal)
+    print("Contraction hierarchy path from", start, "to", goal, "=>", path, "with cost", cost)
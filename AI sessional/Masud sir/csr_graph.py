@@ -0,0 +1,220 @@
+from array import array
+
+# 🔹 Compact graph for the search scripts (BFS, DFS, A*, ...)
+#
+# The scripts use a dict of lists:  graph = {'A': ['B', 'C'], ...}
+# That is easy to read but every node costs a dict entry + a list object
+# + one pointer per edge, which is gigabytes for millions of nodes.
+#
+# CSR (compressed sparse row) keeps the whole graph in two flat arrays:
+#   offsets[i] .. offsets[i+1]  = slice of `targets` with node i's neighbors
+#   targets                     = all neighbor ids, one after the other
+# Node labels ('A', 'B', ...) are interned to integer ids 0..n-1.
+#
+# Weighted graphs in dict form are a dict of dicts:
+#   graph = {'A': {'B': 1, 'C': 4}, ...}      (neighbor -> edge cost)
+# Looping over graph['A'] still gives the neighbors, so the unweighted
+# searches work on it unchanged.
+
+
+def weighted_neighbors(graph, node):
+    """(neighbor, cost) pairs of node, for any graph form (cost 1 if unweighted)."""
+    if hasattr(graph, "weighted_neighbors"):   # CSRGraph, StateSpace
+        return graph.weighted_neighbors(node)
+    neighbors = graph.get(node, [])
+    if isinstance(neighbors, dict):
+        return neighbors.items()
+    return [(v, 1) for v in neighbors]
+
+
+class CSRGraph:
+    """
+    Read-only graph stored as CSR arrays.
+
+    It behaves like the dict form for the search functions:
+        graph[node], graph.get(node, []), node in graph, for node in graph
+    so it can be passed in place of the dict.
+
+    labels  : list of node labels (id -> label), or None when the nodes
+              are plain integers 0..n-1 (then no label lookups are needed)
+    weights : optional edge costs, same length and order as `targets`
+    """
+
+    def __init__(self, offsets, targets, labels=None, weights=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.labels = labels
+        self.weights = weights
+        self._index = None
+        self._reverse = None
+
+    @property
+    def index(self):
+        """
+        label -> id table, set up the first time a label is looked up: a
+        dict, or for a mapped .csrg file with a label order, a binary
+        search in the file (see graph_file.SortedLabels) instead of a dict
+        of every label.
+        """
+        if self._index is None and self.labels is not None:
+            sorted_index = getattr(self.labels, "sorted_index", None)
+            self._index = sorted_index() if sorted_index else None
+            if self._index is None:
+                self._index = {label: i for i, label in enumerate(self.labels)}
+        return self._index
+
+    # ---- building ----
+
+    @classmethod
+    def from_edges(cls, num_nodes, edges, labels=None, weights=None):
+        """Build from (u, v) pairs of integer ids using a counting sort."""
+        sources = array('i')
+        dests = array('i')
+        for u, v in edges:
+            sources.append(u)
+            dests.append(v)
+        return cls.from_arrays(num_nodes, sources, dests, labels, weights)
+
+    @classmethod
+    def from_arrays(cls, num_nodes, sources, dests, labels=None, weights=None):
+        """Build from parallel arrays of edge sources / destinations (/ costs)."""
+        # count out-degree of every node
+        offsets = array('q', bytes(8 * (num_nodes + 1)))
+        for u in sources:
+            offsets[u + 1] += 1
+        for i in range(num_nodes):
+            offsets[i + 1] += offsets[i]
+
+        # drop every edge into its slot
+        targets = array('i', bytes(4 * len(dests)))
+        fill = array('q', offsets[:num_nodes])
+        if weights is None:
+            for u, v in zip(sources, dests):
+                targets[fill[u]] = v
+                fill[u] += 1
+            return cls(offsets, targets, labels)
+
+        costs = array('d', bytes(8 * len(dests)))
+        for u, v, w in zip(sources, dests, weights):
+            targets[fill[u]] = v
+            costs[fill[u]] = w
+            fill[u] += 1
+        return cls(offsets, targets, labels, costs)
+
+    @classmethod
+    def from_dict(cls, graph):
+        """Build from the usual dict-of-lists (or dict-of-dicts) form."""
+        labels = list(graph)
+        index = {label: i for i, label in enumerate(labels)}
+        # neighbors that never appear as a key still need an id
+        for neighbors in graph.values():
+            for v in neighbors:
+                if v not in index:
+                    index[v] = len(labels)
+                    labels.append(v)
+
+        weighted = any(isinstance(neighbors, dict) for neighbors in graph.values())
+        offsets = array('q', [0])
+        targets = array('i')
+        costs = array('d') if weighted else None
+        for label in labels:
+            for v, w in weighted_neighbors(graph, label):
+                targets.append(index[v])
+                if weighted:
+                    costs.append(w)
+            offsets.append(len(targets))
+
+        csr = cls(offsets, targets, labels, costs)
+        csr._index = index
+        return csr
+
+    def reverse(self):
+        """Graph with every edge flipped (built once, then cached)."""
+        if self._reverse is None:
+            n = self.num_nodes()
+            sources = array('i')
+            for u in range(n):
+                sources.extend([u] * (self.offsets[u + 1] - self.offsets[u]))
+            self._reverse = CSRGraph.from_arrays(n, self.targets, sources,
+                                                 self.labels, self.weights)
+            self._reverse._index = self._index
+            self._reverse._reverse = self
+        return self._reverse
+
+    # ---- integer-id access (fast path) ----
+
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    def num_edges(self):
+        return len(self.targets)
+
+    def neighbor_ids(self, i):
+        """Neighbor ids of node id i (a slice of the targets array)."""
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def neighbor_weights(self, i):
+        """Edge costs matching neighbor_ids(i) (all 1 when unweighted)."""
+        if self.weights is None:
+            return [1] * (self.offsets[i + 1] - self.offsets[i])
+        return self.weights[self.offsets[i]:self.offsets[i + 1]]
+
+    def weighted_neighbors(self, label):
+        """(neighbor, cost) pairs, like graph[label] but with edge costs."""
+        i = self.id_of(label)
+        pairs = zip(self.neighbor_ids(i), self.neighbor_weights(i))
+        if self.labels is None:
+            return list(pairs)
+        labels = self.labels
+        return [(labels[v], w) for v, w in pairs]
+
+    def id_of(self, label):
+        if self.labels is None:
+            return label
+        return self.index[label]
+
+    def label_of(self, i):
+        if self.labels is None:
+            return i
+        return self.labels[i]
+
+    def nbytes(self):
+        """Bytes used by the adjacency arrays (not the label table)."""
+        size = (len(self.offsets) * self.offsets.itemsize
+                + len(self.targets) * self.targets.itemsize)
+        if self.weights is not None:
+            size += len(self.weights) * self.weights.itemsize
+        return size
+
+    # ---- dict-like access (same as graph[node] in the scripts) ----
+
+    def __getitem__(self, label):
+        if self.labels is None:
+            if not (isinstance(label, int) and 0 <= label < self.num_nodes()):
+                raise KeyError(label)
+            return self.neighbor_ids(label)
+        i = self.index[label]
+        labels = self.labels
+        return [labels[t] for t in self.neighbor_ids(i)]
+
+    def get(self, label, default=None):
+        try:
+            return self[label]
+        except KeyError:
+            return default
+
+    def __contains__(self, label):
+        if self.labels is None:
+            return isinstance(label, int) and 0 <= label < self.num_nodes()
+        return label in self.index
+
+    def __iter__(self):
+        if self.labels is None:
+            return iter(range(self.num_nodes()))
+        return iter(self.labels)
+
+    def __len__(self):
+        return self.num_nodes()
+
+    def __repr__(self):
+        return f"CSRGraph(nodes={self.num_nodes()}, edges={self.num_edges()})"
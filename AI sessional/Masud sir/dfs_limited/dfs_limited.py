@@ -1,5 +1,13 @@
+import os
+import sys
 from collections import deque
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from graph_file import open_graph, parse_node
+from search_stats import SearchStats
+from state_space import as_graph
+
 # 🔹 Same built-in graph
 graph = {
     'A': ['B', 'C'],
@@ -10,38 +18,83 @@ graph = {
     'F': []
 }
 
-def dfs_limited(start, goal, limit):
+def reconstruct_path(entry):
+    """Walk the (node, depth, parent_entry) chain back to the start."""
+    path = []
+    while entry is not None:
+        path.append(entry[0])
+        entry = entry[2]
+    path.reverse()
+    return path
+
+
+def dfs_limited(start, goal, limit, graph=graph, transposition=True, stats=None):
     """
     Depth-Limited DFS
     start : starting node
     goal  : goal node
     limit : maximum depth allowed (0 = only start node)
+    graph : dict of lists, CSRGraph, StateSpace or successor function
+            (defaults to the built-in graph)
+    transposition : remember the shallowest depth each node was expanded
+                    at, and skip it when it comes up again at that depth
+                    or deeper (its subtree was already searched with at
+                    least as much depth left). Without this, shared
+                    sub-paths like C->F / E->F are searched once per path.
+    stats : optional dict, filled with search counts (see search_stats.py)
     """
-    # stack stores: (current_node, path_so_far, current_depth)
-    stack = [(start, [start], 0)]
+    graph = as_graph(graph)
+    counter = SearchStats() if stats is not None else None
+    try:
+        return _dfs_limited(start, goal, limit, graph, transposition, counter)
+    finally:
+        if counter:
+            counter.report(stats)
+
+
+def _dfs_limited(start, goal, limit, graph, transposition, counter):
+    # stack stores: (current_node, depth, entry_we_came_from)
+    # the last field chains entries together, so a push is O(1) and
+    # the path is only rebuilt once, at the goal
+    stack = [(start, 0, None)]
+    shallowest = {}   # transposition table: node -> depth it was expanded at
 
     while stack:
-        node, path, depth = stack.pop()
+        entry = stack.pop()
+        node, depth, _ = entry
 
         # goal test
         if node == goal:
-            return path
+            return reconstruct_path(entry)
+
+        if transposition:
+            if shallowest.get(node, limit + 1) <= depth:
+                continue
+            shallowest[node] = depth
 
         # only expand if we are below depth limit
         if depth < limit:
-            for neighbor in graph.get(node, []):
-                new_path = path + [neighbor]
-                stack.append((neighbor, new_path, depth + 1))
+            neighbors = graph.get(node, [])
+            for neighbor in neighbors:
+                stack.append((neighbor, depth + 1, entry))
+            if counter:
+                counter.expand(node, len(neighbors))
+                counter.observe(len(stack), len(shallowest))
 
     # if goal not found within depth limit
     return None
 
 
 # ---- Example run ----
-start = 'A'
-goal = 'F'
+if __name__ == "__main__":
+    start = 'A'
+    goal = 'F'
+    # python dfs_limited.py graph.csrg START GOAL  -> search a converted graph file
+    if len(sys.argv) > 3:
+        graph = open_graph(sys.argv[1])
+        start, goal = parse_node(graph, sys.argv[2]), parse_node(graph, sys.argv[3])
 
-limit = 2   # try changing this to 1 or 3 and see the difference
+    limit = 2   # try changing this to 1 or 3 and see the difference
 
-path = dfs_limited(start, goal, limit)
-print(f"Depth-limited DFS (limit = {limit}) from {start} to {goal} => {path}")
+    path = dfs_limited(start, goal, limit, graph)
+    print(f"Depth-limited DFS (limit = {limit}) from {start} to {goal} => {path}")
@@ -0,0 +1,164 @@
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+
+# 🔹 Fitness (objective value) cache for the optimizers
+#
+# Hill climbing, beam search and the GA evaluate the same points again and
+# again (the current state every round, survivors every generation). For
+# a cheap -x**2 + 10*x that does not matter; for an objective that runs a
+# simulation for seconds it is most of the run time. FitnessCache wraps the
+# objective and remembers its values (LRU: the least recently used value is
+# dropped when it is full):
+#
+#     cached = FitnessCache(objective_function, maxsize=100000)
+#     hill_climbing(objective=cached)      # any optimizer with `objective=`
+#     print(cached.stats())
+#
+# quantum : points closer than this count as the same point (keys are
+#           rounded to multiples of it), so near-repeats hit too
+# path    : keep the cache on disk between runs: loaded here if the file
+#           exists, written by save() (or when a `with` block ends)
+# version : anything that changes when the objective's code does (a
+#           number, a git hash); a saved cache only loads for the same
+#           module, name, version and quantum, so bump it after an edit
+# vectorized=True wraps an objective that takes an array of rows (as in
+# genetic_numpy.py): only the rows not cached yet are evaluated, in one call.
+
+
+class FitnessCache:
+    """
+    objective(x) with an LRU cache of its values.
+    hits / misses / evictions count what happened; stats() reports them.
+    """
+
+    def __init__(self, objective, maxsize=100000, quantum=None, path=None, vectorized=False,
+                 version=None):
+        self.objective = objective
+        self.maxsize = maxsize
+        self.quantum = quantum
+        self.version = version
+        self.path = path
+        self.vectorized = vectorized
+        self.entries = OrderedDict()   # key -> objective value
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self.entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        self.entries.clear()
+
+    def key(self, x):
+        """Hashable key of a point: a number, a tuple (lists, arrays) or a state."""
+        if isinstance(x, (np.ndarray, list)):
+            x = tuple(np.asarray(x).ravel().tolist())
+        if self.quantum is None:
+            return x
+        if isinstance(x, tuple):
+            return tuple(round(v / self.quantum) for v in x)
+        return round(x / self.quantum)
+
+    def _lookup(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, self.entries[key]
+        self.misses += 1
+        return False, None
+
+    def _store(self, key, value):
+        self.entries[key] = value
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def __call__(self, x):
+        if self.vectorized:
+            return self._rows(x)
+        key = self.key(x)
+        found, value = self._lookup(key)
+        if not found:
+            value = self.objective(x)
+            self._store(key, value)
+        return value
+
+    def _rows(self, population):
+        values = np.empty(len(population))
+        missing = {}   # key -> rows that need it (duplicates evaluated once)
+        for i, row in enumerate(population):
+            key = self.key(row)
+            found, value = self._lookup(key)
+            if found:
+                values[i] = value
+            else:
+                missing.setdefault(key, []).append(i)
+        if missing:
+            first = [rows[0] for rows in missing.values()]
+            computed = self.objective(population[first])
+            for (key, rows), value in zip(missing.items(), computed):
+                values[rows] = value
+                self._store(key, float(value))
+            # repeats of a missing row inside this batch were not evaluated again
+            repeats = sum(len(rows) - 1 for rows in missing.values())
+            self.hits += repeats
+            self.misses -= repeats
+        return values
+
+    # ---- on disk ----
+
+    def _identity(self):
+        # a function by its module and name, a callable object by its class's
+        kind = self.objective if hasattr(self.objective, "__qualname__") else type(self.objective)
+        return kind.__module__, kind.__qualname__, self.version, self.quantum
+
+    def save(self, path=None):
+        """Write the cache to `path` (default: the path given at creation)."""
+        path = path or self.path
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump({"objective": self._identity(), "entries": list(self.entries.items())}, f)
+        os.replace(tmp, path)   # never leave a half-written cache behind
+
+    def load(self, path):
+        """Add the values saved in `path` (made for the same objective, version and quantum)."""
+        with open(path, "rb") as f:
+            saved = pickle.load(f)
+        if tuple(saved["objective"]) != self._identity():
+            raise ValueError(f"{path} was saved for (module, objective, version, quantum) "
+                             f"{saved['objective']}, not {self._identity()}")
+        for key, value in saved["entries"]:
+            self._store(key, value)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.path is not None:
+            self.save()
+
+
+# ---- Example run ----
+if __name__ == "__main__":
+    import time
+
+    def slow_objective(x):
+        time.sleep(0.001)   # stands in for a simulation run
+        return -x**2 + 10*x
+
+    cached = FitnessCache(slow_objective, quantum=0.01)
+    t0 = time.perf_counter()
+    values = [cached(x / 10) for x in range(100)] + [cached(x / 10 + 0.001) for x in range(100)]
+    print(f"200 evaluations in {time.perf_counter() - t0:.3f} s:", cached.stats())
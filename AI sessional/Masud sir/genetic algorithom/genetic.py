@@ -34,12 +34,12 @@ def mutate(individual, mutation_rate=0.1):
     return individual
 
 # Genetic Algorithm
-def genetic_algorithm(generations=50, population_size=10):
+def genetic_algorithm(generations=50, population_size=10, objective=objective_function):
     population = create_population(population_size)
 
     for generation in range(generations):
         # Selection
-        selected = selection(population, objective_function)
+        selected = selection(population, objective)
         
         # Create next generation
         next_generation = []
@@ -53,10 +53,11 @@ def genetic_algorithm(generations=50, population_size=10):
         population = next_generation
 
     # Return best solution
-    best = max(population, key=objective_function)
-    return best, objective_function(best)
+    best = max(population, key=objective)
+    return best, objective(best)
 
 # Run the algorithm
-best_solution, best_value = genetic_algorithm()
-print(f"Best solution found: x = {best_solution:.4f}")
-print(f"Best value: f(x) = {best_value:.4f}")
+if __name__ == "__main__":
+    best_solution, best_value = genetic_algorithm()
+    print(f"Best solution found: x = {best_solution:.4f}")
+    print(f"Best value: f(x) = {best_value:.4f}")
@@ -0,0 +1,116 @@
+import sys
+import time
+
+import numpy as np
+
+# 🔹 Vectorized genetic algorithm (NumPy)
+#
+# genetic.py keeps the population in a Python list, sorts (individual,
+# fitness) tuples and builds the children one at a time in a while loop,
+# which tops out at a few thousand individuals per second. Here the whole
+# population is ONE array of shape (size, dim) and every step works on all
+# of it at once:
+#   fitness    objective(population) -> one value per row, a single call
+#   selection  "truncation": the best `retain` fraction (np.argpartition,
+#              no full sort), as in genetic.py; or "tournament": each
+#              parent is the best of `tournament_size` random individuals
+#   crossover  child = average of two parents, as in genetic.py
+#   mutation   each gene moves by U(-step, step) with probability mutation_rate
+#              (step: one number, or one per gene)
+# genetic.py stays as the plain reference version of the same algorithm.
+
+
+def objective_function(x):
+    """-x^2 + 10x summed over the genes of every row (maximum at x = 5)."""
+    return np.sum(-x**2 + 10*x, axis=1)
+
+
+def create_population(rng, size=10, dim=1, low=0.0, high=10.0):
+    """size random individuals with dim genes each, uniform in [low, high)."""
+    return rng.uniform(low, high, size=(size, dim))
+
+
+def truncation_selection(fitness, retain=0.5):
+    """Indices of the best `retain` fraction of the population (any order)."""
+    size = len(fitness)
+    keep = max(1, int(size * retain))
+    if keep >= size:
+        return np.arange(size)
+    return np.argpartition(fitness, size - keep)[size - keep:]
+
+
+def tournament_selection(rng, fitness, count, tournament_size=3):
+    """Indices of the winners of `count` tournaments between random individuals."""
+    entrants = rng.integers(len(fitness), size=(count, tournament_size))
+    return entrants[np.arange(count), np.argmax(fitness[entrants], axis=1)]
+
+
+def next_generation(rng, population, fitness, retain=0.5, selection="truncation",
+                    tournament_size=3, mutation_rate=0.1, mutation_step=1.0):
+    """The children that replace `population` (same shape), all built at once."""
+    size = len(population)
+    if selection == "truncation":
+        selected = truncation_selection(fitness, retain)
+        parents1 = selected[rng.integers(len(selected), size=size)]
+        parents2 = selected[rng.integers(len(selected), size=size)]
+    elif selection == "tournament":
+        parents1 = tournament_selection(rng, fitness, size, tournament_size)
+        parents2 = tournament_selection(rng, fitness, size, tournament_size)
+    else:
+        raise ValueError(f"unknown selection {selection!r}, expected 'truncation' or 'tournament'")
+
+    children = population[parents1]
+    children += population[parents2]
+    children /= 2
+    mutated = rng.random(children.shape) < mutation_rate
+    step = np.broadcast_to(mutation_step, children.shape)[mutated]
+    children[mutated] += rng.uniform(-1.0, 1.0, len(step)) * step
+    return children
+
+
+def genetic_algorithm_np(generations=50, population_size=10, objective=objective_function,
+                         dim=1, low=0.0, high=10.0, retain=0.5, selection="truncation",
+                         tournament_size=3, mutation_rate=0.1, mutation_step=1.0,
+                         seed=None, history=None):
+    """
+    Same algorithm as genetic.genetic_algorithm, on a NumPy population.
+    objective : maps an array (size, dim) to `size` fitness values (higher is better)
+    seed      : seed of the NumPy random generator (None = fresh entropy)
+    history   : optional list; the best fitness of every generation is appended
+    Returns (best individual as an array of dim genes, its fitness): the
+    best one of ANY generation, not just the last.
+    """
+    rng = np.random.default_rng(seed)
+    population = create_population(rng, population_size, dim, low, high)
+    best, best_value = None, -np.inf
+
+    for generation in range(generations + 1):
+        fitness = objective(population)
+        i = int(np.argmax(fitness))
+        if fitness[i] > best_value:
+            best, best_value = population[i].copy(), float(fitness[i])
+        if history is not None:
+            history.append(float(fitness[i]))
+        if generation == generations:
+            break
+        population = next_generation(rng, population, fitness, retain, selection,
+                                     tournament_size, mutation_rate, mutation_step)
+
+    return best, best_value
+
+
+# ---- Example run ----
+#   python genetic_numpy.py [population_size] [generations]
+if __name__ == "__main__":
+    best, value = genetic_algorithm_np(seed=0)
+    print(f"Best solution found: x = {best[0]:.4f}")
+    print(f"Best value: f(x) = {value:.4f}")
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    generations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    t0 = time.perf_counter()
+    best, value = genetic_algorithm_np(generations, size, seed=0)
+    seconds = time.perf_counter() - t0
+    print(f"{size} individuals x {generations} generations in {seconds:.2f} s "
+          f"({size * generations / seconds:,.0f} individuals/s): "
+          f"x = {best[0]:.4f}, f(x) = {value:.4f}")
@@ -0,0 +1,233 @@
+import multiprocessing as mp
+import os
+import queue
+import sys
+import time
+import traceback
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from genetic_numpy import create_population, next_generation, objective_function
+
+# 🔹 Island model: several GA populations evolving in parallel
+#
+# One population converges too early: once its best individuals take over
+# there is nothing left to recombine. Here `islands` populations evolve on
+# their own, each in its own process with its own random stream
+# (SeedSequence(seed).spawn: independent, but repeatable). Every
+# `interval` generations each island sends copies of its `migrants` best
+# individuals to another island, where they replace the worst ones:
+#   "ring"    island i -> island i + 1
+#   "random"  a fresh random cycle through all islands every migration
+# (every island sends and receives exactly one batch per migration, so
+# the result only depends on the seed, not on process timing).
+#
+# processes=False runs the same islands one after the other in this
+# process, with the same result (handy for checking, or on one core).
+
+
+class Island:
+    """One population plus its random stream, fitness and best-so-far."""
+
+    def __init__(self, index, seed, size, dim, low, high, objective, options):
+        self.index = index
+        self.rng = np.random.default_rng(seed)
+        self.objective = objective
+        self.options = options      # keyword arguments of next_generation
+        self.population = create_population(self.rng, size, dim, low, high)
+        self.fitness = objective(self.population)
+        self.evaluations = size
+        self.generation = 0
+        self.best, self.best_value = None, -np.inf
+        self._keep_best()
+
+    def _keep_best(self):
+        i = int(np.argmax(self.fitness))
+        if self.fitness[i] > self.best_value:
+            self.best, self.best_value = self.population[i].copy(), float(self.fitness[i])
+
+    def evolve(self, generations):
+        for _ in range(generations):
+            self.population = next_generation(self.rng, self.population, self.fitness,
+                                              **self.options)
+            self.fitness = self.objective(self.population)
+            self.evaluations += len(self.population)
+            self.generation += 1
+            self._keep_best()
+
+    def emigrants(self, count):
+        """Copies of the `count` best individuals and their fitness."""
+        best = np.argpartition(self.fitness, len(self.fitness) - count)[len(self.fitness) - count:]
+        return self.population[best].copy(), self.fitness[best].copy()
+
+    def immigrate(self, rows, values):
+        """The newcomers replace the worst individuals."""
+        worst = np.argpartition(self.fitness, len(values) - 1)[:len(values)]
+        self.population[worst] = rows
+        self.fitness[worst] = values
+        self._keep_best()
+
+
+def destinations(topology, islands, migration, seed=0):
+    """destinations[i] = the island that island i sends to at this migration."""
+    if topology == "ring":
+        return [(i + 1) % islands for i in range(islands)]
+    if topology == "random":
+        # a random cycle: nobody sends to itself, everybody receives once
+        order = np.random.default_rng([seed, migration]).permutation(islands)
+        dest = [0] * islands
+        for k in range(islands):
+            dest[order[k]] = int(order[(k + 1) % islands])
+        return dest
+    raise ValueError(f"unknown topology {topology!r}, expected 'ring' or 'random'")
+
+
+def _epochs(generations, interval):
+    """Generations to run between migrations."""
+    return [min(interval, generations - g) for g in range(0, generations, interval)]
+
+
+def _run_island(index, seed, settings, inboxes, results):
+    """Worker process: evolve one island, migrate through the inbox queues."""
+    try:
+        _evolve_island(index, seed, settings, inboxes, results)
+    except Exception:
+        # without this the parent would wait for a "done" that never comes
+        results.put(("error", index, traceback.format_exc()))
+
+
+def _evolve_island(index, seed, settings, inboxes, results):
+    island = Island(index, seed, *settings["island"])
+    epochs = _epochs(settings["generations"], settings["interval"])
+    t0 = time.perf_counter()
+    arrived = {}   # migration -> batch (a fast sender may be a migration ahead)
+    for migration, generations in enumerate(epochs):
+        island.evolve(generations)
+        results.put(("progress", index, island.generation, island.best_value,
+                     island.evaluations, time.perf_counter() - t0))
+        if migration < len(epochs) - 1 and len(inboxes) > 1:
+            dest = destinations(settings["topology"], len(inboxes), migration, settings["seed"])
+            inboxes[dest[index]].put((migration, island.emigrants(settings["migrants"])))
+            while migration not in arrived:
+                m, batch = inboxes[index].get()
+                arrived[m] = batch
+            island.immigrate(*arrived.pop(migration))
+    results.put(("done", index, island.best, island.best_value, island.evaluations))
+
+
+def _stop(workers):
+    """Terminate the islands still running (they may be waiting for migrants)."""
+    for worker in workers:
+        if worker.is_alive():
+            worker.terminate()
+    for worker in workers:
+        worker.join()
+
+
+def island_model(islands=4, population_size=1000, generations=100, interval=10, migrants=5,
+                 topology="ring", objective=objective_function, dim=1, low=0.0, high=10.0,
+                 seed=0, processes=True, **options):
+    """
+    Run `islands` GA populations of `population_size` each for `generations`
+    generations, migrating every `interval` generations.
+    objective : array (size, dim) -> fitness per row (higher is better);
+                must be picklable (a module-level function) for processes=True
+    options   : passed to genetic_numpy.next_generation (retain, selection,
+                tournament_size, mutation_rate, mutation_step)
+    A failing island (bad objective, ...) stops all of them and its error is
+    raised here as a RuntimeError carrying the worker's traceback.
+    Returns a report dict:
+        best, best_value        best individual of all islands and its fitness
+        evaluations, seconds, evaluations_per_second
+        history                 [(generation, best value of all islands so far)]
+        islands                 per island: best, best_value, evaluations and
+                                history [(generation, best so far, seconds)]
+    """
+    seeds = np.random.SeedSequence(seed).spawn(islands)
+    settings = {"island": (population_size, dim, low, high, objective, options),
+                "generations": generations, "interval": interval, "migrants": migrants,
+                "topology": topology, "seed": seed}
+    destinations(topology, islands, 0, seed)   # fail early on a bad topology
+    if not 1 <= migrants <= population_size:
+        raise ValueError(f"migrants must be between 1 and population_size ({population_size}), "
+                         f"got {migrants}")
+    histories = [[] for _ in range(islands)]
+    finals = [None] * islands
+    t0 = time.perf_counter()
+
+    if processes:
+        inboxes = [mp.Queue() for _ in range(islands)]
+        results = mp.Queue()
+        workers = [mp.Process(target=_run_island, args=(i, seeds[i], settings, inboxes, results))
+                   for i in range(islands)]
+        for worker in workers:
+            worker.start()
+        remaining = islands
+        while remaining:   # drain before join, or full queues block the workers
+            try:
+                message = results.get(timeout=1.0)
+            except queue.Empty:
+                dead = [i for i, worker in enumerate(workers)
+                        if worker.exitcode not in (None, 0)]
+                if dead:
+                    _stop(workers)
+                    raise RuntimeError(f"island {dead[0]} exited with code "
+                                       f"{workers[dead[0]].exitcode}")
+                continue
+            if message[0] == "progress":
+                _, i, generation, value, _, seconds = message
+                histories[i].append((generation, value, seconds))
+            elif message[0] == "error":
+                _stop(workers)
+                raise RuntimeError(f"island {message[1]} failed:\n{message[2]}")
+            else:
+                _, i, best, value, evaluations = message
+                finals[i] = (best, value, evaluations)
+                remaining -= 1
+        for worker in workers:
+            worker.join()
+    else:
+        population = [Island(i, seeds[i], *settings["island"]) for i in range(islands)]
+        epochs = _epochs(generations, interval)
+        for migration, count in enumerate(epochs):
+            for island in population:
+                island.evolve(count)
+                histories[island.index].append((island.generation, island.best_value,
+                                                time.perf_counter() - t0))
+            if migration < len(epochs) - 1 and islands > 1:
+                dest = destinations(topology, islands, migration, seed)
+                batches = [island.emigrants(migrants) for island in population]
+                for i, batch in enumerate(batches):
+                    population[dest[i]].immigrate(*batch)
+        finals = [(island.best, island.best_value, island.evaluations) for island in population]
+
+    seconds = time.perf_counter() - t0
+    winner = max(range(islands), key=lambda i: finals[i][1])
+    evaluations = sum(final[2] for final in finals)
+    history = [(generation, max(h[k][1] for h in histories))
+               for k, (generation, _, _) in enumerate(histories[0])]
+    return {
+        "best": finals[winner][0], "best_value": finals[winner][1],
+        "evaluations": evaluations, "seconds": seconds,
+        "evaluations_per_second": evaluations / seconds,
+        "history": history,
+        "islands": [{"best": best, "best_value": value, "evaluations": evals,
+                     "history": histories[i]}
+                    for i, (best, value, evals) in enumerate(finals)],
+    }
+
+
+# ---- Example run ----
+#   python islands.py [islands] [population_size] [generations]
+if __name__ == "__main__":
+    islands = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    generations = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    report = island_model(islands, size, generations)
+    print(f"{islands} islands x {size} individuals x {generations} generations: "
+          f"x = {report['best'][0]:.4f}, f(x) = {report['best_value']:.4f}, "
+          f"{report['evaluations_per_second']:,.0f} evaluations/s")
+    for i, island in enumerate(report["islands"]):
+        print(f"  island {i}: best f(x) = {island['best_value']:.4f}")
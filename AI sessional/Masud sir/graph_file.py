@@ -0,0 +1,398 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from csr_graph import CSRGraph
+
+# 🔹 Binary graph file (.csrg) that can be opened with mmap
+#
+# Parsing a text edge list with tens of millions of lines takes minutes.
+# We do it ONCE with convert_edge_list(), write the CSR arrays to disk,
+# and later open_graph() just maps the file: no parsing, and every process
+# that opens the same file shares one page-cached copy.
+#
+# Layout (little endian, every section starts on an 8-byte boundary):
+#   header        magic, version, flags, num_nodes, num_edges
+#   offsets       int64  x (num_nodes + 1)
+#   targets       int32  x num_edges
+#   weights       float64 x num_edges               (if HAS_WEIGHTS)
+#   label offsets int64  x (num_nodes + 1)          (if HAS_LABELS)
+#   label bytes   utf-8 labels one after the other  (if HAS_LABELS)
+#   label order   int32  x num_nodes: ids sorted by label bytes
+#                                                   (if HAS_LABEL_ORDER)
+# The label order lets open_graph() find a label's id by binary search in
+# the mapping, so labelled graphs open without building a label dict.
+
+MAGIC = b"CSRG"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIqq")   # magic, version, flags, unused, n, m
+
+HAS_WEIGHTS = 1
+HAS_LABELS = 2
+HAS_LABEL_ORDER = 4
+
+
+def _align(pos):
+    return (pos + 7) & ~7
+
+
+class LabelTable:
+    """id -> label lookup that decodes labels straight out of the mapped file."""
+
+    def __init__(self, offsets, blob, order=None):
+        self.offsets = offsets
+        self.blob = blob
+        self.order = order   # ids sorted by label bytes, or None (older files)
+
+    def __getitem__(self, i):
+        return str(self.blob[self.offsets[i]:self.offsets[i + 1]], "utf-8")
+
+    def _bytes(self, i):
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+
+    def sorted_index(self):
+        """label -> id lookups by binary search over `order` (None without it)."""
+        return SortedLabels(self) if self.order is not None else None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class SortedLabels:
+    """
+    The label -> id part of a dict, answered from the mapped file: a binary
+    search over the label order, O(log n) per label. Labels found once are
+    remembered, so a search that keeps revisiting nodes pays for the
+    binary search only once per node.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.found = {}
+
+    def _find(self, label):
+        if not isinstance(label, str):
+            return None
+        key = label.encode("utf-8")
+        order, lo, hi = self.table.order, 0, len(self.table.order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.table._bytes(order[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(order) and self.table._bytes(order[lo]) == key:
+            return order[lo]
+        return None
+
+    def __getitem__(self, label):
+        i = self.found.get(label)
+        if i is None:
+            i = self._find(label)
+            if i is None:
+                raise KeyError(label)
+            self.found[label] = i
+        return i
+
+    def __contains__(self, label):
+        return label in self.found or self._find(label) is not None
+
+
+# ---- writing ----
+
+def save_graph(graph, path):
+    """Write a CSRGraph to `path` in the .csrg format."""
+    n = graph.num_nodes()
+    m = graph.num_edges()
+    flags = 0
+    if graph.weights is not None:
+        flags |= HAS_WEIGHTS
+    if graph.labels is not None:
+        flags |= HAS_LABELS | HAS_LABEL_ORDER
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, 0, n, m))
+
+        def section(values, typecode):
+            f.write(bytes(_align(f.tell()) - f.tell()))
+            f.write(array(typecode, values).tobytes())
+
+        section(graph.offsets, 'q')
+        section(graph.targets, 'i')
+        if flags & HAS_WEIGHTS:
+            section(graph.weights, 'd')
+        if flags & HAS_LABELS:
+            encoded = [str(label).encode("utf-8") for label in graph.labels]
+            label_offsets = array('q', [0])
+            for b in encoded:
+                label_offsets.append(label_offsets[-1] + len(b))
+            section(label_offsets, 'q')
+            f.write(b"".join(encoded))
+            section(sorted(range(n), key=encoded.__getitem__), 'i')
+
+
+def save_reverse_graph(path, dst=None):
+    """
+    Write the graph in `path` with every edge flipped (what backward
+    searches walk) to `dst`, by default <name>.rev.csrg next to it, and
+    return dst. A dst newer than `path` is kept as it is, so the reverse
+    graph is built once per graph file, not once per process.
+    """
+    if dst is None:
+        dst = os.path.splitext(path)[0] + ".rev.csrg"
+    if not os.path.exists(dst) or os.path.getmtime(dst) < os.path.getmtime(path):
+        tmp = f"{dst}.{os.getpid()}.tmp"
+        save_graph(open_graph(path).reverse(), tmp)
+        os.replace(tmp, dst)   # readers never see a half-written file
+    return dst
+
+
+# ---- reading ----
+
+def open_graph(path, reverse=None):
+    """
+    Map a .csrg file read-only and return a CSRGraph over it.
+    Nothing is parsed or copied: the arrays are views into the mapping.
+    reverse : optional path of the flipped graph (save_reverse_graph),
+              mapped as well and returned by graph.reverse()
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mm)
+
+    magic, version, flags, _, n, m = HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} .csrg graph file")
+
+    pos = HEADER.size
+
+    def section(count, typecode, itemsize):
+        nonlocal pos
+        pos = _align(pos)
+        part = view[pos:pos + count * itemsize].cast(typecode)
+        pos += count * itemsize
+        return part
+
+    offsets = section(n + 1, 'q', 8)
+    targets = section(m, 'i', 4)
+    weights = section(m, 'd', 8) if flags & HAS_WEIGHTS else None
+    labels = None
+    if flags & HAS_LABELS:
+        label_offsets = section(n + 1, 'q', 8)
+        blob = view[pos:pos + label_offsets[n]]
+        pos += label_offsets[n]
+        order = section(n, 'i', 4) if flags & HAS_LABEL_ORDER else None
+        labels = LabelTable(label_offsets, blob, order)
+
+    graph = CSRGraph(offsets, targets, labels, weights)
+    graph.mapping = mm   # keep the mapping alive as long as the graph
+    graph.path = path    # lets other processes map the same file
+    if reverse is not None:
+        graph._reverse = open_graph(reverse)
+        graph._reverse._reverse = graph
+    return graph
+
+
+def parse_node(graph, text):
+    """Command-line text -> node: int for numeric graphs, else the label."""
+    return int(text) if graph.labels is None else text
+
+
+# ---- converting text edge lists ----
+
+def _split(line):
+    # "u v", "u,v", "u v w" and "u,v,w" are all accepted
+    return line.replace(b",", b" ").split()
+
+
+def _chunk_bounds(path, workers, chunk_size):
+    size = os.path.getsize(path)
+    chunk_size = max(1, min(chunk_size, size // (workers * 4) + 1))
+    return [(start, min(start + chunk_size, size))
+            for start in range(0, size, chunk_size)]
+
+
+def _lines(path, start, end):
+    """Lines that START inside [start, end) of the file."""
+    with open(path, "rb") as f:
+        if start > 0:
+            f.seek(start - 1)
+            f.readline()   # finish the line owned by the previous chunk
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            line = line.strip()
+            if line and not line.startswith(b"#"):
+                yield _split(line)
+
+
+def _parse_chunk(job):
+    """
+    Worker: parse one byte range.
+    numeric=True  -> node ids are the integers in the file; returns None
+                     if the chunk has a node that is not an integer or is
+                     outside 0..max_id
+    numeric=False -> labels are interned locally; the parent maps the
+                     chunk-local ids to global ids afterwards
+    """
+    path, start, end, numeric, max_id = job
+    sources = array('i')
+    dests = array('i')
+    weights = array('d')
+    local = {}
+
+    for parts in _lines(path, start, end):
+        if numeric:
+            try:
+                u, v = int(parts[0]), int(parts[1])
+            except ValueError:
+                return None
+            if not (0 <= u <= max_id and 0 <= v <= max_id):
+                return None
+        else:
+            u = local.setdefault(parts[0], len(local))
+            v = local.setdefault(parts[1], len(local))
+        sources.append(u)
+        dests.append(v)
+        weights.append(float(parts[2]) if len(parts) > 2 else 1.0)
+
+    names = list(local) if not numeric else None
+    return sources, dests, weights, names
+
+
+def _is_numeric(path):
+    """First guess from the first line; every chunk checks its own lines."""
+    for parts in _lines(path, 0, os.path.getsize(path)):
+        try:
+            int(parts[0]), int(parts[1])
+            return True
+        except ValueError:
+            return False
+    return True
+
+
+def _parsed(pool, jobs, window):
+    """Results of _parse_chunk in file order, with at most `window` chunks in flight."""
+    jobs = iter(jobs)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < window:
+                job = next(jobs, None)
+                if job is None:
+                    break
+                pending.append(pool.submit(_parse_chunk, job))
+            if not pending:
+                return
+            yield pending.popleft().result()
+    finally:
+        for future in pending:   # stopped early: drop the chunks not started yet
+            future.cancel()
+
+
+def _merge(chunks, numeric):
+    """
+    Append the parsed chunks to one edge list as they arrive (so only a
+    few chunks are held at a time). Returns (sources, dests, weights,
+    labels), or None if a chunk turned out not to be numeric after all.
+    """
+    sources = array('i')
+    dests = array('i')
+    weights = array('d')
+    labels = None if numeric else []
+    index = {}
+    for chunk in chunks:
+        if chunk is None:
+            return None
+        s, d, w, names = chunk
+        if not numeric:
+            # chunk-local id -> global id
+            remap = array('i')
+            for name in names:
+                label = str(name, "utf-8")
+                if label not in index:
+                    index[label] = len(labels)
+                    labels.append(label)
+                remap.append(index[label])
+            s = map(remap.__getitem__, s)
+            d = map(remap.__getitem__, d)
+        sources.extend(s)
+        dests.extend(d)
+        weights.extend(w)
+    return sources, dests, weights, labels
+
+
+def convert_edge_list(src, dst, workers=None, chunk_size=64 * 1024 * 1024,
+                      undirected=False):
+    """
+    Parse a text/CSV edge list (one "u v [weight]" per line, '#' comments)
+    across `workers` processes and write it to `dst` as a .csrg file.
+    If every node is an integer and the integers are dense enough to be
+    array indices (none negative, no more ids than edge ends), they are
+    used as ids directly and no label table is stored; otherwise every
+    node, numbers included, is a text label. Returns the CSRGraph written.
+    """
+    workers = workers or os.cpu_count() or 1
+    numeric = _is_numeric(src)
+    # a line takes at least 4 bytes ("u v\n"): more distinct nodes than
+    # that allows means the ids have gaps
+    max_id = os.path.getsize(src) // 2
+    bounds = _chunk_bounds(src, workers, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        merged = None
+        if numeric:
+            jobs = [(src, start, end, True, max_id) for start, end in bounds]
+            merged = _merge(_parsed(pool, jobs, 2 * workers), True)
+            if merged is not None:
+                sources, dests = merged[0], merged[1]
+                num_nodes = max(max(sources, default=-1), max(dests, default=-1)) + 1
+                if num_nodes > 2 * len(sources):
+                    merged = None   # sparse ids: an offsets array mostly of gaps
+        if merged is None:
+            numeric = False
+            jobs = [(src, start, end, False, None) for start, end in bounds]
+            merged = _merge(_parsed(pool, jobs, 2 * workers), False)
+
+    sources, dests, weights, labels = merged
+    weighted = any(x != 1.0 for x in weights)
+    if not numeric:
+        num_nodes = len(labels)
+
+    if undirected:
+        sources, dests = sources + dests, dests + sources
+        weights = weights + weights
+
+    graph = CSRGraph.from_arrays(num_nodes, sources, dests, labels,
+                                 weights if weighted else None)
+    save_graph(graph, dst)
+    return graph
+
+
+# ---- command line ----
+#   python graph_file.py edges.txt graph.csrg [workers] [--undirected]
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) < 2:
+        print("usage: python graph_file.py EDGE_LIST OUT.csrg [workers] [--undirected]")
+        sys.exit(1)
+
+    import time
+    t0 = time.perf_counter()
+    g = convert_edge_list(args[0], args[1],
+                          workers=int(args[2]) if len(args) > 2 else None,
+                          undirected="--undirected" in sys.argv)
+    print(f"Converted {g} in {time.perf_counter() - t0:.2f}s -> {args[1]}")
+
+    t0 = time.perf_counter()
+    g = open_graph(args[1])
+    print(f"Opened {g} with mmap in {(time.perf_counter() - t0) * 1000:.2f} ms")
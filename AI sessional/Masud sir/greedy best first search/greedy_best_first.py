@@ -1,4 +1,15 @@
-import heapq
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from graph_file import open_graph, parse_node
+from indexed_heap import IndexedHeap
+from landmarks import open_landmarks
+from search_stats import SearchStats
+from state_space import as_graph, as_heuristic
 
 # 🔹 Same built-in graph
 graph = {
@@ -21,40 +32,160 @@ h = {
     'F': 0
 }
 
-def greedy_best_first_search(start, goal):
+def reconstruct_path(parent, goal):
+    """Follow parent pointers back from goal, then reverse -> start ... goal."""
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+def greedy_best_first_search(start, goal, graph=graph, h=h, stats=None):
     """
     Greedy Best-First Search:
     Chooses next node based ONLY on heuristic h(n)
     (does NOT guarantee shortest path)
+    stats : optional dict, filled with heap operation counts and the
+            search counts of search_stats.py
+    graph / h may also be a StateSpace / successor function and a
+    heuristic function
+    """
+    graph = as_graph(graph)
+    h = as_heuristic(h)
+    counter = SearchStats() if stats is not None else None
+
+    # priority queue keyed by h(node), each node queued at most once
+    # (ties: first queued comes out first)
+    pq = IndexedHeap()
+    pq.push(start, h[start])
+
+    # parent[n] is set when n is first reached (also works as the visited set);
+    # h(n) never changes, so the first way we reached n is the one used
+    parent = {start: None}
+
+    try:
+        while pq:
+            node, _ = pq.pop()
+
+            if node == goal:
+                return reconstruct_path(parent, goal)
+
+            neighbors = graph.get(node, [])
+            for neighbor in neighbors:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    pq.push(neighbor, h[neighbor])
+            if counter:
+                counter.expand(node, len(neighbors))
+                counter.observe(len(pq), len(parent))
+
+        return None  # no path found
+    finally:
+        if counter:
+            stats.update(pq.stats())
+            counter.report(stats)
+
+
+def greedy_best_first_steps(start, goal, graph=graph, h=h, max_expansions=None,
+                            time_limit=None, stats=None):
     """
+    Anytime greedy best-first search: the same search as
+    greedy_best_first_search, run as a generator of progress events, so
+    the caller has a usable answer at once and can stop whenever it likes.
 
-    # priority queue stores: (h(node), path)
-    pq = []
-    heapq.heappush(pq, (h[start], [start]))
+    Yields after every expansion:
+        {"node": the expanded node, "expanded": expansions so far,
+         "best": reached node with the lowest h so far, "best_h": its h,
+         "improved": True if `best` changed in this step,
+         "path": start -> best if improved, else None}
+    and at the end:
+        {"done": "goal" | "budget" | "exhausted", "best", "best_h",
+         "expanded", "path": start -> best}
+    "budget" means max_expansions or time_limit (seconds) ran out,
+    "exhausted" that the goal can't be reached; `best` is then the
+    closest node (by h) found. That path is also the return value.
+    """
+    graph = as_graph(graph)
+    h = as_heuristic(h)
+    counter = SearchStats() if stats is not None else None
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
 
-    visited = set()
+    pq = IndexedHeap()
+    pq.push(start, h[start])
+    parent = {start: None}
+    best, best_h = start, h[start]
+    expanded = 0
+    reason = "exhausted"
 
-    while pq:
-        _, path = heapq.heappop(pq)
-        node = path[-1]
+    try:
+        while pq:
+            if ((max_expansions is not None and expanded >= max_expansions)
+                    or (deadline is not None and time.perf_counter() >= deadline)):
+                reason = "budget"
+                break
+            node, _ = pq.pop()
 
-        if node == goal:
-            return path
+            if node == goal:
+                best, best_h = node, h[node]
+                reason = "goal"
+                break
 
-        if node in visited:
-            continue
-        visited.add(node)
+            improved = False
+            neighbors = graph.get(node, [])
+            for neighbor in neighbors:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    h_neighbor = h[neighbor]
+                    pq.push(neighbor, h_neighbor)
+                    if h_neighbor < best_h:
+                        best, best_h, improved = neighbor, h_neighbor, True
+            expanded += 1
+            if counter:
+                counter.expand(node, len(neighbors))
+                counter.observe(len(pq), len(parent))
+            yield {"node": node, "expanded": expanded, "best": best, "best_h": best_h,
+                   "improved": improved,
+                   "path": reconstruct_path(parent, best) if improved else None}
 
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                new_path = path + [neighbor]
-                heapq.heappush(pq, (h[neighbor], new_path))
+        path = reconstruct_path(parent, best)
+        yield {"done": reason, "best": best, "best_h": best_h, "expanded": expanded,
+               "path": path}
+        return path
+    finally:
+        if counter:
+            stats.update(pq.stats())
+            counter.report(stats)
 
-    return None  # no path found
+
+def greedy_best_first_anytime(start, goal, graph=graph, h=h, max_expansions=None,
+                              time_limit=None):
+    """
+    Run greedy_best_first_steps within the budget.
+    Returns (path, reached): a path to the goal and True, or the path
+    to the closest node found and False.
+    """
+    for event in greedy_best_first_steps(start, goal, graph, h, max_expansions, time_limit):
+        pass
+    return event["path"], event["best"] == goal
 
 
 # ---- Example run ----
-start = 'A'
-goal = 'F'
-path = greedy_best_first_search(start, goal)
-print("Greedy Best-First Search path from", start, "to", goal, "=>", path)
+if __name__ == "__main__":
+    start = 'A'
+    goal = 'F'
+    # python greedy_best_first.py graph.csrg START GOAL [landmarks.alt]  -> search a converted graph file
+    if len(sys.argv) > 3:
+        graph = open_graph(sys.argv[1])
+        start, goal = parse_node(graph, sys.argv[2]), parse_node(graph, sys.argv[3])
+        if len(sys.argv) > 4:
+            h = open_landmarks(sys.argv[4], graph).heuristic(goal)   # see landmarks.py
+        else:
+            h = defaultdict(int)   # no heuristic -> h(n) = 0
+    path = greedy_best_first_search(start, goal, graph, h)
+    print("Greedy Best-First Search path from", start, "to", goal, "=>", path)
+
+    path, reached = greedy_best_first_anytime(start, goal, graph, h, max_expansions=1)
+    print("After 1 expansion: best path so far =>", path, "(reaches the goal)" if reached else "")
@@ -1,4 +1,7 @@
+import multiprocessing as mp
+import os
 import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
 
 def objective_function(x):
@@ -8,14 +11,15 @@ def get_neighbor(x):
     step = random.uniform(-1, 1)  # Small random step
     return x + step
 
-def hill_climbing(iterations=1000):
-    # Start with a random solution
-    current_solution = random.uniform(0, 10)
-    current_value = objective_function(current_solution)
+def hill_climbing(iterations=1000, objective=objective_function, start=None,
+                  neighbor_of=get_neighbor):
+    # Start with a random solution (or the given one)
+    current_solution = random.uniform(0, 10) if start is None else start
+    current_value = objective(current_solution)
 
     for i in range(iterations):
-        neighbor = get_neighbor(current_solution)
-        neighbor_value = objective_function(neighbor)
+        neighbor = neighbor_of(current_solution)
+        neighbor_value = objective(neighbor)
 
     
         if neighbor_value > current_value:
@@ -25,6 +29,151 @@ def hill_climbing(iterations=1000):
     return current_solution, current_value
 
 
-best_solution, best_value = hill_climbing()
-print(f"Best solution found: x = {best_solution:.4f}")
-print(f"Best value: f(x) = {best_value:.4f}")
+# 🔹 Adaptive hill climbing: stops when it has converged
+#    hill_climbing always makes 1000 moves of up to +-1, long after it has
+#    reached the top. Here the step grows after a successful move and
+#    shrinks after a failed one (big steps far from the top, tiny ones
+#    near it), and the climb stops once `patience` moves in a row improved
+#    by less than `tol`, or the step has shrunk below `min_step`.
+
+def adaptive_hill_climbing(iterations=1000, objective=objective_function, start=None,
+                           step=1.0, grow=1.5, shrink=0.8, patience=30, tol=1e-9,
+                           min_step=1e-7, low=0, high=10, rng=random, should_stop=None,
+                           stats=None, neighbor_of=None):
+    """
+    Hill climbing with an adaptive step and convergence detection.
+    start       : first x (default: random in [low, high])
+    rng         : random.Random to draw from (default: the random module)
+    neighbor_of : optional function (x, step) -> a point at most `step`
+                  away, for x other than one float (default: x +- step)
+    should_stop : optional function, checked now and then; True aborts the climb
+    stats       : optional dict, filled with evaluations, the final step and
+                  stopped ("patience", "min_step", "iterations" or "aborted")
+    Returns (x, f(x)) like hill_climbing.
+    """
+    current_solution = rng.uniform(low, high) if start is None else start
+    current_value = objective(current_solution)
+    evaluations = 1
+    stale = 0
+    reason = "iterations"
+
+    for i in range(iterations):
+        if should_stop is not None and i % 64 == 0 and should_stop():
+            reason = "aborted"
+            break
+        if neighbor_of is None:
+            neighbor = current_solution + rng.uniform(-step, step)
+        else:
+            neighbor = neighbor_of(current_solution, step)
+        neighbor_value = objective(neighbor)
+        evaluations += 1
+
+        if neighbor_value > current_value:
+            stale = stale + 1 if neighbor_value - current_value < tol else 0
+            current_solution, current_value = neighbor, neighbor_value
+            step *= grow
+        else:
+            stale += 1
+            step *= shrink
+
+        if stale >= patience:
+            reason = "patience"
+            break
+        if step < min_step:
+            reason = "min_step"
+            break
+
+    if stats is not None:
+        stats.update(evaluations=evaluations, step=step, stopped=reason)
+    return current_solution, current_value
+
+
+# 🔹 Random restarts on a process pool
+#    Each restart is an adaptive climb from its own random start point
+#    (restart i draws from random.Random(f"{seed}-{i}"), so results are
+#    repeatable). Once one of them reaches `target`, the restarts that
+#    have not started are cancelled and the running ones are told to stop
+#    through a shared Event.
+
+_stop_event = None   # set in each worker process by _init_restart
+
+
+def _init_restart(event):
+    global _stop_event
+    _stop_event = event
+
+
+def _restart(i, seed, objective, options):
+    stats = {}
+    x, value = adaptive_hill_climbing(objective=objective, rng=random.Random(f"{seed}-{i}"),
+                                      should_stop=_stop_event.is_set, stats=stats, **options)
+    return i, x, value, stats
+
+
+def random_restart_hill_climbing(restarts=20, objective=objective_function, target=None,
+                                 workers=None, seed=0, stats=None, **options):
+    """
+    Best of `restarts` adaptive_hill_climbing runs, spread over `workers`
+    processes (workers=1: one after the other in this process).
+    target  : stop as soon as a restart reaches f(x) >= target
+    objective must be picklable (a module-level function).
+    options : passed to adaptive_hill_climbing (iterations, step, patience, ...)
+    stats   : optional dict, filled with evaluations, restarts (finished
+              climbs) and cancelled (restarts that never ran)
+    Returns (x, f(x)) of the best restart.
+    """
+    workers = workers or os.cpu_count() or 1
+    best = (None, float('-inf'))
+    evaluations = finished = 0
+
+    def reached(value):
+        return target is not None and value >= target
+
+    if workers == 1:
+        for i in range(restarts):
+            climb = {}
+            x, value = adaptive_hill_climbing(objective=objective, rng=random.Random(f"{seed}-{i}"),
+                                              stats=climb, **options)
+            evaluations += climb["evaluations"]
+            finished += 1
+            if value > best[1]:
+                best = (x, value)
+            if reached(value):
+                break
+    else:
+        event = mp.Event()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_restart,
+                                 initargs=(event,)) as pool:
+            pending = {pool.submit(_restart, i, seed, objective, options) for i in range(restarts)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    i, x, value, climb = future.result()
+                    evaluations += climb["evaluations"]
+                    finished += 1
+                    if value > best[1]:
+                        best = (x, value)
+                    if reached(value) and not event.is_set():
+                        event.set()                  # running climbs stop soon
+                        for other in pending:        # queued ones never start
+                            other.cancel()
+
+    if stats is not None:
+        stats.update(evaluations=evaluations, restarts=finished,
+                     cancelled=restarts - finished)
+    return best
+
+
+if __name__ == "__main__":
+    best_solution, best_value = hill_climbing()
+    print(f"Best solution found: x = {best_solution:.4f}")
+    print(f"Best value: f(x) = {best_value:.4f}")
+
+    stats = {}
+    best_solution, best_value = adaptive_hill_climbing(stats=stats)
+    print(f"Adaptive: x = {best_solution:.4f}, f(x) = {best_value:.4f}, {stats}")
+    stats = {}
+    best_solution, best_value = random_restart_hill_climbing(10, target=24.999999, stats=stats)
+    print(f"Random restarts: x = {best_solution:.4f}, f(x) = {best_value:.4f}, {stats}")
@@ -0,0 +1,152 @@
+# 🔹 Indexed binary heap (priority queue with decrease-key)
+#
+# heapq can't change the priority of an item that is already queued,
+# so A* pushes a second copy and skips the old one when it is popped
+# ("lazy deletion"). On weighted graphs the heap fills up with those
+# stale copies. Here every item sits in the heap at most once and
+# `position` remembers where, so its priority can be lowered in place.
+
+
+class IndexedHeap:
+    """
+    Min-heap of unique items.
+        push(item, priority)    add a new item
+        update(item, priority)  add it, or lower its priority if queued
+        pop()                   -> (item, priority) with the smallest priority
+    change(item, priority)  add it, or move it to any new priority
+    remove(item)            take it out wherever it is
+    Ties are broken by insertion order (first in, first out).
+    Counters `pushes`, `pops`, `decrease_keys` record the work done.
+    """
+
+    def __init__(self):
+        self.heap = []        # entries: [priority, order, item]
+        self.position = {}    # item -> index of its entry in self.heap
+        self.order = 0
+        self.pushes = 0
+        self.pops = 0
+        self.decrease_keys = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def priority(self, item):
+        return self.heap[self.position[item]][0]
+
+    def peek(self):
+        priority, _, item = self.heap[0]
+        return item, priority
+
+    def push(self, item, priority):
+        if item in self.position:
+            raise KeyError(f"{item!r} is already in the heap")
+        self.order += 1
+        self.pushes += 1
+        self.heap.append([priority, self.order, item])
+        self.position[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def update(self, item, priority):
+        """
+        Push `item`, or lower its priority if it is already queued.
+        Returns True if the heap changed.
+        """
+        i = self.position.get(item)
+        if i is None:
+            self.push(item, priority)
+            return True
+        entry = self.heap[i]
+        if priority >= entry[0]:
+            return False
+        entry[0] = priority
+        self.decrease_keys += 1
+        self._sift_up(i)
+        return True
+
+    def change(self, item, priority):
+        """Push `item`, or give it a new priority, higher or lower."""
+        i = self.position.get(item)
+        if i is None:
+            self.push(item, priority)
+            return
+        entry = self.heap[i]
+        old, entry[0] = entry[0], priority
+        if priority < old:
+            self.decrease_keys += 1
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, item):
+        """Take `item` out of the heap (KeyError if it isn't queued)."""
+        i = self.position.pop(item)
+        heap = self.heap
+        last = heap.pop()
+        if i < len(heap):
+            # the last entry fills the hole, then moves to its place
+            heap[i] = last
+            self.position[last[2]] = i
+            self._sift_up(i)
+            self._sift_down(self.position[last[2]])
+
+    def pop(self):
+        heap = self.heap
+        last = heap.pop()
+        self.pops += 1
+        if heap:
+            top = heap[0]
+            heap[0] = last
+            self.position[last[2]] = 0
+            self._sift_down(0)
+        else:
+            top = last
+        del self.position[top[2]]
+        return top[2], top[0]
+
+    def stats(self):
+        return {"pushes": self.pushes, "pops": self.pops,
+                "decrease_keys": self.decrease_keys}
+
+    # ---- keeping the heap order ----
+
+    def _sift_up(self, i):
+        heap, position = self.heap, self.position
+        entry = heap[i]
+        key = (entry[0], entry[1])
+        while i > 0:
+            parent = (i - 1) // 2
+            above = heap[parent]
+            if (above[0], above[1]) <= key:
+                break
+            heap[i] = above
+            position[above[2]] = i
+            i = parent
+        heap[i] = entry
+        position[entry[2]] = i
+
+    def _sift_down(self, i):
+        heap, position = self.heap, self.position
+        n = len(heap)
+        entry = heap[i]
+        key = (entry[0], entry[1])
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            right = child + 1
+            if right < n and (heap[right][0], heap[right][1]) < (heap[child][0], heap[child][1]):
+                child = right
+            below = heap[child]
+            if key <= (below[0], below[1]):
+                break
+            heap[i] = below
+            position[below[2]] = i
+            i = child
+        heap[i] = entry
+        position[entry[2]] = i
@@ -1,4 +1,13 @@
-from collections import deque
+import os
+import sys
+from collections import defaultdict
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from csr_graph import weighted_neighbors
+from graph_file import open_graph, parse_node
+from search_stats import SearchStats
+from state_space import as_graph, as_heuristic
 
 # 🔹 Same built-in graph
 graph = {
@@ -10,52 +19,183 @@ graph = {
     'F': []
 }
 
-def dfs_limited(start, goal, limit):
+# 🔹 Heuristic values h(n) for IDA* (same as A_star.py, goal = 'F')
+h = {
+    'A': 3,
+    'B': 2,
+    'C': 1,
+    'D': 3,
+    'E': 2,
+    'F': 0
+}
+
+def reconstruct_path(entry):
+    """Walk the (node, depth, parent_entry) chain back to the start."""
+    path = []
+    while entry is not None:
+        path.append(entry[0])
+        entry = entry[2]
+    path.reverse()
+    return path
+
+
+def dfs_limited(start, goal, limit, graph=graph, transposition=True, stats=None):
     """
     Depth-Limited DFS (used inside Iterative Deepening)
     start : starting node
     goal  : goal node
     limit : maximum depth allowed (0 = only start node)
+    graph : dict of lists, CSRGraph, StateSpace or successor function
+            (defaults to the built-in graph)
+    transposition : remember the shallowest depth each node was expanded
+                    at, and skip it when it comes up again at that depth
+                    or deeper (its subtree was already searched with at
+                    least as much depth left). Without this, shared
+                    sub-paths like C->F / E->F are searched once per path.
+    stats : optional dict, filled with search counts (see search_stats.py)
     """
-    # stack stores: (current_node, path_so_far, current_depth)
-    stack = [(start, [start], 0)]
+    graph = as_graph(graph)
+    counter = SearchStats() if stats is not None else None
+    try:
+        return _dfs_limited(start, goal, limit, graph, transposition, counter)
+    finally:
+        if counter:
+            counter.report(stats)
+
+
+def _dfs_limited(start, goal, limit, graph, transposition, counter):
+    """dfs_limited on a ready graph; `counter` may be shared by several rounds."""
+    # stack stores: (current_node, depth, entry_we_came_from)
+    # the last field chains entries together, so a push is O(1) and
+    # the path is only rebuilt once, at the goal
+    stack = [(start, 0, None)]
+    shallowest = {}   # transposition table: node -> depth it was expanded at
 
     while stack:
-        node, path, depth = stack.pop()
+        entry = stack.pop()
+        node, depth, _ = entry
 
         # goal test
         if node == goal:
-            return path
+            return reconstruct_path(entry)
+
+        if transposition:
+            if shallowest.get(node, limit + 1) <= depth:
+                continue
+            shallowest[node] = depth
 
         # only expand if we are below depth limit
         if depth < limit:
-            for neighbor in graph.get(node, []):
-                new_path = path + [neighbor]
-                stack.append((neighbor, new_path, depth + 1))
+            neighbors = graph.get(node, [])
+            for neighbor in neighbors:
+                stack.append((neighbor, depth + 1, entry))
+            if counter:
+                counter.expand(node, len(neighbors))
+                counter.observe(len(stack), len(shallowest))
 
     # goal not found within this depth
     return None
 
 
-def iterative_deepening_dfs(start, goal, max_depth):
+def iterative_deepening_dfs(start, goal, max_depth, graph=graph, transposition=True,
+                            stats=None):
     """
     Iterative Deepening DFS:
     Repeatedly calls dfs_limited with depth = 0, 1, 2, ..., max_depth
     Returns the first path found.
+    (each call gets a fresh transposition table: a node expanded at
+     depth d in the last round had one level less left below it)
+    stats : optional dict, counts summed over all rounds (re-expansions
+            include every node a later round searches again)
     """
-    for depth in range(max_depth + 1):
-        # print(f"Trying depth limit = {depth}")  # (optional debug)
-        path = dfs_limited(start, goal, depth)
-        if path is not None:
-            return path    # found a path at this depth
+    graph = as_graph(graph)
+    counter = SearchStats() if stats is not None else None
+    try:
+        for depth in range(max_depth + 1):
+            # print(f"Trying depth limit = {depth}")  # (optional debug)
+            path = _dfs_limited(start, goal, depth, graph, transposition, counter)
+            if path is not None:
+                return path    # found a path at this depth
 
-    return None  # no path found up to max_depth
+        return None  # no path found up to max_depth
+    finally:
+        if counter:
+            counter.report(stats)
+
+
+def ida_star(start, goal, graph=graph, h=h, transposition=False, stats=None):
+    """
+    IDA* (Iterative Deepening A*):
+    Same loop as iterative_deepening_dfs, but the cut-off is on
+    f(n) = g(n) + h(n) instead of depth. Each round is a DFS that skips
+    nodes with f > threshold; the next threshold is the smallest f that
+    was skipped. Memory is just the DFS stack, not A*'s whole priority
+    queue.
+    Returns (path, cost) like a_star_search; optimal if h is admissible.
+    transposition : skip a node already expanded this round with a
+                    g that is no larger. Off by default: the table holds
+                    every node expanded in the round, which gives up the
+                    small memory IDA* is chosen for. Turn it on for graphs
+                    where many paths lead to the same node (grids, DAGs),
+                    where plain IDA* re-expands them over and over.
+    stats : optional dict, counts summed over all rounds
+    """
+    graph = as_graph(graph)
+    h = as_heuristic(h)
+    counter = SearchStats() if stats is not None else None
+    threshold = h[start]
+
+    try:
+        while True:
+            next_threshold = float('inf')
+            best_g = {}   # transposition table: node -> g it was expanded with
+            stack = [(start, 0, None)]
+
+            while stack:
+                entry = stack.pop()
+                node, g, _ = entry
+
+                f = g + h[node]
+                if f > threshold:
+                    next_threshold = min(next_threshold, f)
+                    continue
+
+                if node == goal:
+                    return reconstruct_path(entry), g
+
+                if transposition:
+                    if best_g.get(node, float('inf')) <= g:
+                        continue
+                    best_g[node] = g
+
+                neighbors = weighted_neighbors(graph, node)
+                for neighbor, cost in neighbors:
+                    stack.append((neighbor, g + cost, entry))
+                if counter:
+                    counter.expand(node, len(neighbors))
+                    counter.observe(len(stack), len(best_g))
+
+            if next_threshold == float('inf'):
+                return None, float('inf')   # nothing was cut off: no path
+            threshold = next_threshold
+    finally:
+        if counter:
+            counter.report(stats)
 
 
 # ---- Example run ----
-start = 'A'
-goal = 'F'
-max_depth = 4   # you can change this
+if __name__ == "__main__":
+    start = 'A'
+    goal = 'F'
+    max_depth = 4   # you can change this
+    # python iterative.py graph.csrg START GOAL  -> search a converted graph file
+    if len(sys.argv) > 3:
+        graph = open_graph(sys.argv[1])
+        start, goal = parse_node(graph, sys.argv[2]), parse_node(graph, sys.argv[3])
+        h = defaultdict(int)   # no heuristic for file graphs -> h(n) = 0
+
+    path = iterative_deepening_dfs(start, goal, max_depth, graph)
+    print(f"Iterative Deepening DFS from {start} to {goal} => {path}")
 
-path = iterative_deepening_dfs(start, goal, max_depth)
-print(f"Iterative Deepening DFS from {start} to {goal} => {path}")
+    path, cost = ida_star(start, goal, graph, h)
+    print(f"IDA* from {start} to {goal} => {path} with cost {cost}")
@@ -0,0 +1,223 @@
+import heapq
+import mmap
+import random
+import struct
+import sys
+from array import array
+
+from csr_graph import CSRGraph
+from graph_file import open_graph
+
+# 🔹 Landmark (ALT) heuristic: A* + Landmarks + Triangle inequality
+#
+# The h dicts in A_star.py / greedy_best_first.py are written by hand for
+# ONE goal ('F'). Landmarks give a heuristic for ANY goal:
+#
+# Offline, pick a few landmark nodes L and store the exact distances
+#   from_L[v] = d(L, v)      and      to_L[v] = d(v, L)
+# for every node v. At query time the triangle inequality gives
+#   d(v, t) >= d(L, t) - d(L, v)      (L -> v -> t is no shorter than L -> t)
+#   d(v, t) >= d(v, L) - d(t, L)      (v -> t -> L is no shorter than v -> L)
+# and h(v) = the largest of these bounds over all landmarks. It never
+# overestimates, so A* stays optimal.
+#
+# The tables are k * n float64 values; save_landmarks() writes them to an
+# array file next to the .csrg graph and open_landmarks() maps it back.
+
+MAGIC = b"ALTL"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIq")   # magic, version, k, unused, n
+
+INF = float('inf')
+
+
+def dijkstra_ids(csr, source):
+    """Distances from node id `source` to every node id (inf if unreachable)."""
+    dist = array('d', [INF]) * csr.num_nodes()
+    dist[source] = 0
+    pq = [(0, source)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue   # stale copy
+        for v, w in zip(csr.neighbor_ids(u), csr.neighbor_weights(u)):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(pq, (nd, v))
+    return dist
+
+
+class Landmarks:
+    """
+    Distance tables for a set of landmarks of one graph.
+
+    graph     : the CSRGraph the tables belong to (labels <-> ids)
+    ids       : landmark node ids
+    dist_from : dist_from[i][v] = d(landmark i, v)
+    dist_to   : dist_to[i][v]   = d(v, landmark i)
+    """
+
+    def __init__(self, graph, ids, dist_from, dist_to):
+        self.graph = graph
+        self.ids = ids
+        self.dist_from = dist_from
+        self.dist_to = dist_to
+
+    def __len__(self):
+        return len(self.ids)
+
+    def bound(self, i, v, t):
+        """Lower bound on d(v, t) from landmark i (node ids)."""
+        best = 0
+        # inf - inf = nan is never > best, so missing distances are skipped
+        d = self.dist_from[i][t] - self.dist_from[i][v]
+        if d > best:
+            best = d
+        d = self.dist_to[i][v] - self.dist_to[i][t]
+        if d > best:
+            best = d
+        return best
+
+    def heuristic(self, goal, start=None, active=None):
+        """
+        h for A* / greedy search towards `goal`: use as h[node].
+        active : only use this many landmarks, the ones that give the
+                 largest bound for `start` (fewer landmarks = cheaper h)
+        """
+        t = self.graph.id_of(goal)
+        chosen = range(len(self))
+        if active is not None and start is not None:
+            s = self.graph.id_of(start)
+            chosen = sorted(chosen, key=lambda i: self.bound(i, s, t), reverse=True)[:active]
+        return LandmarkHeuristic(self, t, chosen)
+
+
+class LandmarkHeuristic:
+    """h[node] = best triangle-inequality bound on the distance node -> goal."""
+
+    def __init__(self, landmarks, goal_id, chosen):
+        self.id_of = landmarks.graph.id_of
+        # per landmark: (row from it, d(L, goal), row to it, d(goal, L))
+        self.rows = [(landmarks.dist_from[i], landmarks.dist_from[i][goal_id],
+                      landmarks.dist_to[i], landmarks.dist_to[i][goal_id])
+                     for i in chosen]
+
+    def __getitem__(self, node):
+        v = self.id_of(node)
+        best = 0
+        for dist_from, from_goal, dist_to, goal_to in self.rows:
+            d = from_goal - dist_from[v]
+            if d > best:
+                best = d
+            d = dist_to[v] - goal_to
+            if d > best:
+                best = d
+        return best
+
+
+# ---- offline step ----
+
+def build_landmarks(graph, k=8, seed=0):
+    """
+    Pick k landmarks and compute their distance tables.
+
+    Landmarks are chosen "farthest first": start from the node farthest
+    from a random node, then repeatedly add the node farthest from all
+    landmarks picked so far, so they end up spread around the edge of the
+    graph, where the bounds are tightest.
+    graph : CSRGraph or dict graph (a dict is converted to a CSRGraph)
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
+    n = csr.num_nodes()
+    reverse = csr.reverse()
+    k = min(k, n)
+
+    ids = []
+    dist_from = []
+    dist_to = []
+    # distance to the nearest landmark so far (a random node to begin with)
+    closest = dijkstra_ids(csr, random.Random(seed).randrange(n))
+    while len(ids) < k:
+        # unreachable nodes count as farthest: they need a landmark of their own
+        landmark = max(range(n), key=closest.__getitem__)
+        if landmark in ids:
+            break   # every node is at distance 0 from some landmark
+        ids.append(landmark)
+        dist_from.append(dijkstra_ids(csr, landmark))
+        dist_to.append(dijkstra_ids(reverse, landmark))
+        if len(ids) == 1:
+            closest = dist_from[0]
+        else:
+            closest = array('d', map(min, closest, dist_from[-1]))
+    return Landmarks(csr, ids, dist_from, dist_to)
+
+
+# ---- landmark file (.alt) ----
+#
+# Layout (little endian, 8-byte aligned like the .csrg file):
+#   header      magic, version, k, n
+#   ids         int64   x k
+#   dist_from   float64 x k x n      (row i = landmark i)
+#   dist_to     float64 x k x n
+
+def save_landmarks(landmarks, path):
+    """Write the landmark tables to `path`."""
+    k = len(landmarks)
+    n = landmarks.graph.num_nodes()
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, k, 0, n))
+        f.write(array('q', landmarks.ids).tobytes())
+        for rows in (landmarks.dist_from, landmarks.dist_to):
+            for row in rows:
+                f.write(array('d', row).tobytes())
+
+
+def open_landmarks(path, graph):
+    """Map a landmark file read-only; rows are views into the mapping."""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mm)
+
+    magic, version, k, _, n = HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} landmark file")
+    if n != graph.num_nodes():
+        raise ValueError(f"{path} has tables for {n} nodes, the graph has {graph.num_nodes()}")
+
+    pos = HEADER.size
+    ids = list(view[pos:pos + 8 * k].cast('q'))
+    pos += 8 * k
+    table = view[pos:pos + 16 * k * n].cast('d')
+    dist_from = [table[i * n:(i + 1) * n] for i in range(k)]
+    dist_to = [table[(k + i) * n:(k + i + 1) * n] for i in range(k)]
+
+    landmarks = Landmarks(graph, ids, dist_from, dist_to)
+    landmarks.mapping = mm   # keep the mapping alive as long as the tables
+    return landmarks
+
+
+# ---- Example run ----
+if __name__ == "__main__":
+    # python landmarks.py graph.csrg OUT.alt [k]   -> precompute for a graph file
+    if len(sys.argv) > 2:
+        graph = open_graph(sys.argv[1])
+        k = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+        landmarks = build_landmarks(graph, k)
+        save_landmarks(landmarks, sys.argv[2])
+        print(f"{len(landmarks)} landmarks for {graph!r} written to {sys.argv[2]}:",
+              [graph.label_of(i) for i in landmarks.ids])
+        sys.exit()
+
+    graph = {
+        'A': {'B': 1, 'C': 4},
+        'B': {'D': 2, 'E': 1},
+        'C': {'F': 1},
+        'D': {},
+        'E': {'F': 2},
+        'F': {}
+    }
+    landmarks = build_landmarks(graph, k=2)
+    print("Landmarks:", [landmarks.graph.label_of(i) for i in landmarks.ids])
+    h = landmarks.heuristic('F')
+    print("h towards F:", {node: h[node] for node in graph})
@@ -1,3 +1,4 @@
+import heapq
 import random
 
 # Objective function
@@ -13,7 +14,7 @@ def get_neighbors(x, step_size=1.0, count=5):
     return neighbors
 
 # Local Beam Search
-def local_beam_search(k, iterations):
+def local_beam_search(k, iterations, objective=objective_function):
     # Initialize k random solutions
     current_states = [random.uniform(0, 10) for _ in range(k)]
     
@@ -28,17 +29,16 @@ def local_beam_search(k, iterations):
         # Combine current states and neighbors
         combined = current_states + all_neighbors
         
-        # Sort by objective function (descending order)
-        combined.sort(key=objective_function, reverse=True)
-        
-        # Keep the top k states
-        current_states = combined[:k]
+        # Keep the top k states (by objective function, descending order);
+        # nlargest keeps a heap of k instead of sorting all of combined
+        current_states = heapq.nlargest(k, combined, key=objective)
 
     # Return the best solution
-    best_state = max(current_states, key=objective_function)
-    return best_state, objective_function(best_state)
+    best_state = max(current_states, key=objective)
+    return best_state, objective(best_state)
 
 # Run the algorithm
-best_solution, best_value = local_beam_search(k=3, iterations=100)
-print(f"Best solution found: x = {best_solution:.4f}")
-print(f"Best value: f(x) = {best_value:.4f}")
+if __name__ == "__main__":
+    best_solution, best_value = local_beam_search(k=3, iterations=100)
+    print(f"Best solution found: x = {best_solution:.4f}")
+    print(f"Best value: f(x) = {best_value:.4f}")
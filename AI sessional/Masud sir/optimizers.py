@@ -0,0 +1,250 @@
+import random
+import time
+
+import numpy as np
+
+from script_loader import load_script
+
+# 🔹 One interface for the optimizers
+#
+# hill.py, stochastic_hill.py, simulated.py, beam.py and genetic.py each
+# hard-code -x**2 + 10*x on one float. To pick an optimizer for a workload
+# we need them all to take the same problem:
+#
+#     problem = Problem(rastrigin, dim=10, low=-5.12, high=5.12, budget=20000, seed=1)
+#     result = optimize("annealing", problem)
+#     result["best_value"], result["evaluations"], result["curve"]
+#
+# A Problem wraps the objective: it counts evaluations, keeps the best
+# point and records the best value after every improvement (the curve of
+# best value against evaluations). The optimizers below are the NumPy
+# engines (genetic_numpy, simulated_numpy, beam_numpy) and the one-point
+# searches of hill.py / stochastic_hill.py / simulated.py, which get a
+# vector start and neighbor function in place of their float ones. Each one turns the
+# evaluation budget into its own number of generations / steps, so none
+# of them goes over it (a budget too small for the default population,
+# chain count or beam width shrinks it to fit). They only spend whole
+# generations / steps, so up to one step's worth of the budget may be
+# left unused; adaptive_hill stops early once it has converged, and
+# adaptive_annealing once it is frozen. All of
+# them maximize; for cost functions (minimize=True, like the test
+# functions) they are handed -f.
+
+
+class Problem:
+    """
+    objective : f(X) for an array X of shape (n, dim) -> n values
+    low, high : box the start points are drawn from (numbers or arrays)
+    budget    : objective evaluations an optimizer may spend
+    seed      : seed for the optimizer's random generator
+    minimize  : True if smaller f is better
+    """
+
+    def __init__(self, objective, dim, low, high, budget=10000, seed=0, minimize=True,
+                 name=None):
+        self.objective = objective
+        self.dim = dim
+        self.low = low
+        self.high = high
+        self.budget = budget
+        self.seed = seed
+        self.minimize = minimize
+        self.name = name or getattr(objective, "__name__", "objective")
+        self.reset()
+
+    def reset(self):
+        self.evaluations = 0
+        self.best = None
+        self.best_value = np.inf if self.minimize else -np.inf
+        self.curve = []      # (evaluations, best value so far), at every improvement
+
+    @property
+    def span(self):
+        """Width of the box (per dimension when low / high are arrays)."""
+        return np.asarray(self.high, dtype=float) - np.asarray(self.low, dtype=float)
+
+    def fitness(self, x):
+        """What the optimizers call: f(X), counted, negated when minimizing."""
+        values = np.asarray(self.objective(x), dtype=float)
+        self.evaluations += len(values)
+        i = int(np.argmin(values) if self.minimize else np.argmax(values))
+        if (values[i] < self.best_value) if self.minimize else (values[i] > self.best_value):
+            self.best, self.best_value = np.array(x[i], dtype=float), float(values[i])
+            self.curve.append((self.evaluations, self.best_value))
+        return -values if self.minimize else values
+
+
+# ---- the optimizers, all with the same signature: run(problem) ----
+
+_genetic = load_script("genetic algorithom/genetic_numpy.py")
+_annealing = load_script("simulated anneling/simulated_numpy.py")
+_beam = load_script("local beam search/beam_numpy.py")
+_hill = load_script("hill climbing/hill.py")
+_stochastic_hill = load_script("Stochastic Hill Climbing/stochastic_hill.py")
+_simulated = load_script("simulated anneling/simulated.py")
+
+
+def genetic(problem, population=100):
+    population = min(population, problem.budget)
+    generations = max(problem.budget // population - 1, 0)
+    _genetic.genetic_algorithm_np(generations, population, problem.fitness, problem.dim,
+                                  problem.low, problem.high, selection="tournament",
+                                  mutation_step=0.05 * problem.span, seed=problem.seed)
+
+
+def annealing(problem, chains=16, initial_temp=10.0, final_temp=1e-3):
+    chains = min(chains, problem.budget)
+    steps = max(problem.budget // chains - 1, 0)
+    _annealing.simulated_annealing_np(chains, problem.dim, initial_temp,
+                                      (final_temp / initial_temp) ** (1 / max(steps, 1)),
+                                      steps, None, 0.05 * problem.span, problem.low,
+                                      problem.high, problem.fitness, problem.seed)
+
+
+def tempering(problem, levels=16):
+    levels = min(levels, problem.budget)
+    steps = max(problem.budget // levels - 1, 0)
+    _annealing.parallel_tempering(_annealing.temperature_ladder(levels, 1e-3, 10.0),
+                                  problem.dim, steps, 1, 0.05 * problem.span, problem.low,
+                                  problem.high, problem.fitness, problem.seed)
+
+
+def beam(problem, k=20, count=5, stochastic=False):
+    # narrower beam if the budget would not even pay for one iteration of k
+    k = max(min(k, problem.budget // (count + 1)), 1)
+    iterations = max((problem.budget - k) // (k * count), 0)
+    _beam.local_beam_search_np(k, iterations, count, 0.05 * problem.span, problem.dim,
+                               problem.low, problem.high, problem.fitness,
+                               stochastic=stochastic, seed=problem.seed)
+
+
+def stochastic_beam(problem, k=20, count=5):
+    beam(problem, k, count, stochastic=True)
+
+
+def _one_point(problem):
+    """
+    For the searches that move one point x: f(x) for a single point,
+    sample() for a random point in the box, and neighbor(x, step): a
+    uniform move of up to step * span in each dimension.
+    """
+    rng = np.random.default_rng(problem.seed)
+
+    def value(x):
+        return float(problem.fitness(x[None, :])[0])
+
+    def sample():
+        return rng.uniform(problem.low, problem.high, problem.dim)
+
+    def neighbor(x, step):
+        return x + step * problem.span * rng.uniform(-1, 1, problem.dim)
+
+    return value, sample, neighbor
+
+
+def hill_climbing(problem, step=0.05):
+    value, sample, neighbor = _one_point(problem)
+    _hill.hill_climbing(problem.budget - 1, value, sample(), lambda x: neighbor(x, step))
+
+
+def stochastic_hill(problem, neighbors=10, step=0.05):
+    neighbors = max(min(neighbors, problem.budget - 1), 1)
+    value, sample, neighbor = _one_point(problem)
+    _stochastic_hill.stochastic_hill_climbing((problem.budget - 1) // neighbors, neighbors,
+                                              value, sample(), lambda x: neighbor(x, step),
+                                              random.Random(problem.seed))
+
+
+def adaptive_hill(problem, step=0.05, patience=30):
+    value, sample, neighbor = _one_point(problem)
+    _hill.adaptive_hill_climbing(problem.budget - 1, value, sample(), step=step,
+                                 patience=patience, rng=random.Random(problem.seed),
+                                 neighbor_of=neighbor)
+
+
+def adaptive_annealing(problem, schedule="target", samples=20, step=0.05):
+    value, sample, neighbor = _one_point(problem)
+    move = lambda x: neighbor(x, step)
+    # T0 is estimated from sampled moves (2 evaluations each), at most a quarter of the budget
+    samples = max(min(samples, (problem.budget - 1) // 8), 0)
+    initial_temp, used = _simulated.estimate_initial_temp(value, samples, sampler=sample,
+                                                          neighbor_of=move)
+    _simulated.adaptive_simulated_annealing(problem.budget - 1 - used, value, schedule,
+                                            initial_temp, start=sample(), neighbor_of=move,
+                                            rng=random.Random(problem.seed))
+
+
+OPTIMIZERS = {
+    "hill_climbing": hill_climbing,
+    "stochastic_hill": stochastic_hill,
+    "adaptive_hill": adaptive_hill,
+    "annealing": annealing,
+    "adaptive_annealing": adaptive_annealing,
+    "tempering": tempering,
+    "beam": beam,
+    "stochastic_beam": stochastic_beam,
+    "genetic": genetic,
+}
+
+
+def optimize(name, problem, **options):
+    """
+    Run the optimizer `name` on `problem` (from scratch) and return
+        best, best_value, evaluations, seconds, evaluations_per_second,
+        curve  [(evaluations, best value so far)]
+    options : keyword arguments of that optimizer (population, chains, k, ...)
+    """
+    if name not in OPTIMIZERS:
+        raise ValueError(f"unknown optimizer {name!r}, expected one of {sorted(OPTIMIZERS)}")
+    if problem.budget < 1:
+        raise ValueError(f"budget must be at least 1 evaluation, got {problem.budget}")
+    problem.reset()
+    t0 = time.perf_counter()
+    OPTIMIZERS[name](problem, **options)
+    seconds = time.perf_counter() - t0
+    return {"best": problem.best, "best_value": problem.best_value,
+            "evaluations": problem.evaluations, "seconds": seconds,
+            "evaluations_per_second": problem.evaluations / seconds if seconds else 0.0,
+            "curve": problem.curve + [(problem.evaluations, problem.best_value)]}
+
+
+# ---- standard test functions (to minimize; all have minimum 0) ----
+
+def sphere(x):
+    return np.sum(x**2, axis=1)
+
+
+def rastrigin(x):
+    return 10 * x.shape[1] + np.sum(x**2 - 10 * np.cos(2 * np.pi * x), axis=1)
+
+
+def rosenbrock(x):
+    return np.sum(100 * (x[:, 1:] - x[:, :-1]**2)**2 + (1 - x[:, :-1])**2, axis=1)
+
+
+def ackley(x):
+    return (-20 * np.exp(-0.2 * np.sqrt(np.mean(x**2, axis=1)))
+            - np.exp(np.mean(np.cos(2 * np.pi * x), axis=1)) + 20 + np.e)
+
+
+# name -> (function, low, high): the usual search boxes
+TEST_FUNCTIONS = {
+    "sphere": (sphere, -5.12, 5.12),
+    "rastrigin": (rastrigin, -5.12, 5.12),
+    "rosenbrock": (rosenbrock, -2.048, 2.048),
+    "ackley": (ackley, -32.768, 32.768),
+}
+
+
+def test_problem(name, dim, budget=10000, seed=0):
+    function, low, high = TEST_FUNCTIONS[name]
+    return Problem(function, dim, low, high, budget, seed, name=name)
+
+
+# ---- Example run ----
+if __name__ == "__main__":
+    problem = test_problem("rastrigin", dim=5, budget=20000)
+    for name in OPTIMIZERS:
+        result = optimize(name, problem)
+        print(f"{name:<20} best f = {result['best_value']:10.4f} after "
+              f"{result['evaluations']} evaluations ({result['seconds']:.3f} s)")
@@ -0,0 +1,264 @@
+from collections import OrderedDict
+
+from script_loader import load_script
+
+# 🔹 Shortest-path result cache
+#
+# The same (start, goal) queries come in again and again, and the graph
+# rarely changes in between. PathCache remembers the answers (LRU: the
+# least recently used answer is dropped when it is full).
+#
+# A cached path is only valid for the graph as it was. Every graph has a
+# version number (graph.version, 0 for graphs without one) and it is part
+# of the key, so after a change the old answers are simply never found
+# again. VersionedGraph is a dict graph whose changes bump the version:
+#
+#     graph = VersionedGraph({'A': ['B', 'C'], ...})
+#     cache = PathCache(maxsize=1000)
+#     cache.bfs_shortest_path('A', 'F', graph)   # miss: searches
+#     cache.bfs_shortest_path('A', 'F', graph)   # hit
+#     graph.add_edge('D', 'F')                   # version + 1
+#     cache.bfs_shortest_path('A', 'F', graph)   # miss again: searches
+
+
+class VersionedGraph(dict):
+    """
+    Dict graph (dict of lists or dict of dicts) with a change counter.
+    The searches use it like the plain dict. Change it through the methods
+    below or the usual dict ones (graph[node] = ..., del, update, pop,
+    popitem, setdefault, clear, |=), which all bump `version`; editing a
+    neighbor list in place would not be noticed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def _weighted(self, cost=None):
+        """Dict of dicts? (decided by the first node; by `cost` when empty)"""
+        for neighbors in self.values():
+            return isinstance(neighbors, dict)
+        return cost is not None
+
+    def add_node(self, node):
+        if node not in self:
+            self[node] = {} if self._weighted() else []
+
+    def add_edge(self, u, v, cost=None):
+        """Add u -> v (or set its cost, for a weighted graph)."""
+        weighted = self._weighted(cost)
+        for node in (u, v):
+            if node not in self:
+                self[node] = {} if weighted else []
+        if weighted:
+            self[u][v] = 1 if cost is None else cost
+        elif v not in self[u]:
+            self[u].append(v)
+        self.version += 1
+
+    def remove_edge(self, u, v):
+        neighbors = self.get(u, ())
+        if v in neighbors:
+            _discard(neighbors, v)
+            self.version += 1
+
+    def remove_node(self, node):
+        """Delete node and every edge into it."""
+        for neighbors in self.values():
+            if node in neighbors:
+                _discard(neighbors, node)
+        if node in self:
+            del self[node]   # bumps the version
+        else:
+            self.version += 1
+
+    def __setitem__(self, node, neighbors):
+        super().__setitem__(node, neighbors)
+        self.version += 1
+
+    def __delitem__(self, node):
+        super().__delitem__(node)
+        self.version += 1
+
+    # the C implementations of these don't go through __setitem__ / __delitem__
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, node, neighbors=None):
+        if node not in self:
+            self[node] = neighbors
+        return super().__getitem__(node)
+
+    def pop(self, node, *default):
+        found = node in self
+        value = super().pop(node, *default)
+        if found:
+            self.version += 1
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
+def _discard(neighbors, node):
+    if isinstance(neighbors, dict):
+        del neighbors[node]
+    else:
+        neighbors.remove(node)
+
+
+def graph_version(graph):
+    return getattr(graph, "version", 0)
+
+
+def _token(arg):
+    """Hashable stand-in for an argument (unhashable ones by identity)."""
+    try:
+        hash(arg)
+        return arg
+    except TypeError:
+        return ("id", id(arg))
+
+
+def _copy(result):
+    """Paths are lists: hand out copies so callers can't change the cache."""
+    if isinstance(result, list):
+        return list(result)
+    if isinstance(result, tuple):
+        return tuple(_copy(part) for part in result)
+    return result
+
+
+class PathCache:
+    """
+    LRU cache of search results, keyed by
+        (algorithm, start, goal, graph identity, graph version, other args).
+    hits / misses / evictions count what happened; stats() reports them.
+    maxsize bounds the number of search results; whole BFS trees (one per
+    start, each as big as the graph) have their own, smaller bound
+    max_trees.
+    """
+
+    def __init__(self, maxsize=1024, max_trees=8):
+        self.maxsize = maxsize
+        self.max_trees = max_trees
+        self.entries = OrderedDict()   # key -> (objects the key refers to, result)
+        self.trees = OrderedDict()     # same, for bfs_shortest_path's BFS trees
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bfs = None
+        self._a_star = None
+        self._bidirectional = None
+
+    def __len__(self):
+        return len(self.entries) + len(self.trees)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self.entries), "trees": len(self.trees),
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        self.entries.clear()
+        self.trees.clear()
+
+    def _lookup(self, key, refs, table=None):
+        table = self.entries if table is None else table
+        entry = table.get(key)
+        # refs guard against a dead graph's id() being reused by a new one
+        if entry is not None and all(a is b for a, b in zip(entry[0], refs)):
+            table.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+        self.misses += 1
+        return False, None
+
+    def _store(self, key, refs, result, table=None, limit=None):
+        if table is None:
+            table, limit = self.entries, self.maxsize
+        table[key] = (refs, result)
+        table.move_to_end(key)
+        while len(table) > limit:
+            table.popitem(last=False)
+            self.evictions += 1
+
+    def search(self, func, start, goal, graph, *args, **kwargs):
+        """
+        func(start, goal, graph, *args, **kwargs), answered from the cache
+        when the same query already ran on this version of the graph.
+        """
+        tokens = tuple(map(_token, args))
+        # objects that are only in the key by id(): must still be the same ones
+        refs = (graph,) + tuple(a for a, t in zip(args, tokens) if t is not a)
+        key = (func.__module__, func.__name__, start, goal, id(graph), graph_version(graph),
+               tokens, tuple(sorted((k, _token(v)) for k, v in kwargs.items())))
+        found, result = self._lookup(key, refs)
+        if not found:
+            result = func(start, goal, graph, *args, **kwargs)
+            self._store(key, refs, result)
+        return _copy(result)
+
+    # ---- the usual searches ----
+
+    def bfs_shortest_path(self, start, goal, graph):
+        """
+        Like bfs.bfs_shortest_path, but the whole BFS tree from `start` is
+        cached, so every other goal from the same start is a hit too.
+        A tree holds a parent for every reachable node, so only the last
+        max_trees starts are kept.
+        """
+        if self._bfs is None:
+            self._bfs = load_script("Bfs/bfs.py")
+        key = (start, id(graph), graph_version(graph))
+        found, tree = self._lookup(key, (graph,), self.trees)
+        if not found:
+            tree = self._bfs.bfs_tree(start, graph)
+            self._store(key, (graph,), tree, self.trees, self.max_trees)
+        if goal not in tree:
+            return None
+        return self._bfs.reconstruct_path(tree, goal)
+
+    def a_star_search(self, start, goal, graph, h, **kwargs):
+        if self._a_star is None:
+            self._a_star = load_script("A star/A_star.py")
+        return self.search(self._a_star.a_star_search, start, goal, graph, h, **kwargs)
+
+    def bidirectional_search(self, start, goal, graph):
+        if self._bidirectional is None:
+            self._bidirectional = load_script("bidirectional/bidirectional.py")
+        return self.search(self._bidirectional.bidirectional_search, start, goal, graph)
+
+
+# ---- Example run ----
+if __name__ == "__main__":
+    graph = VersionedGraph({
+        'A': ['B', 'C'],
+        'B': ['D', 'E'],
+        'C': ['F'],
+        'D': [],
+        'E': ['F'],
+        'F': []
+    })
+    cache = PathCache(maxsize=100)
+    for goal in 'FFEDF':
+        print("A ->", goal, cache.bfs_shortest_path('A', goal, graph))
+    print(cache.stats())
+
+    graph.remove_edge('C', 'F')     # version changes: old paths are not reused
+    print("after removing C->F: A -> F", cache.bfs_shortest_path('A', 'F', graph))
+    print(cache.bidirectional_search('A', 'F', graph), cache.bidirectional_search('A', 'F', graph))
+    print(cache.stats())
@@ -0,0 +1,517 @@
+import math
+import random
+from collections import deque
+
+import numpy as np
+
+# 🔹 Local search over permutations (tours, queen placements, assignments)
+#
+# hill.py, simulated.py and beam.py move one float and recompute the whole
+# objective for every neighbor. For a permutation of 10^5 elements a full
+# recompute is 10^5 steps per move. A move only changes a few terms, so
+# every problem here keeps its cost and computes the CHANGE of a move
+# (its delta) from those few terms in O(1):
+#
+#   Tour        closed tour through points, cost = its length
+#               swap(i, j)          exchange the cities at positions i, j
+#               2-opt(a, b, c, d)   replace edges a-b, c-d by a-c, b-d
+#               or-opt              move a run of 1-3 cities elsewhere
+#   QueenBoard  queen of row r in column perm[r], cost = attacking pairs
+#               (columns never clash; diagonals are counted) - swap(i, j)
+#   Assignment  worker i does job perm[i], cost = sum of C[i, perm[i]] - swap
+#
+# Picking moves: candidate_lists() gives every city its k nearest cities;
+# an improving 2-opt / or-opt move almost always connects a city to one of
+# those, so tour_local_search() only looks at O(k) moves per city instead
+# of O(n). Applying a 2-opt move reverses part of the tour; the shorter
+# side is reversed, so moves that are local in the tour stay cheap.
+#
+# swap_hill_climbing() / swap_annealing() are hill.py / simulated.py for
+# any problem with swap_delta / apply_swap (all costs are minimized).
+# They are separate loops, not entries of optimizers.py: those optimizers
+# evaluate a whole point per move (Problem is a box of floats), which is
+# exactly the O(n) work per move these deltas avoid.
+
+
+class Tour:
+    """A closed tour: tour[k] = city at position k, pos[city] = its position."""
+
+    def __init__(self, points, order=None):
+        points = np.asarray(points, dtype=float)
+        self.n = len(points)
+        self.xs = points[:, 0].tolist()   # plain floats: fast one-at-a-time access
+        self.ys = points[:, 1].tolist()
+        self.tour = list(range(self.n)) if order is None else [int(c) for c in order]
+        self.pos = [0] * self.n
+        for k, city in enumerate(self.tour):
+            self.pos[city] = k
+        self.length = self.full_length()
+
+    def dist(self, a, b):
+        return math.hypot(self.xs[a] - self.xs[b], self.ys[a] - self.ys[b])
+
+    def full_length(self):
+        """Length recomputed from scratch (O(n); the moves keep self.length up to date)."""
+        t = self.tour
+        return sum(self.dist(t[k - 1], t[k]) for k in range(self.n))
+
+    def cost(self):
+        return self.length
+
+    def next(self, city):
+        return self.tour[(self.pos[city] + 1) % self.n]
+
+    def prev(self, city):
+        return self.tour[self.pos[city] - 1]
+
+    # ---- swap ----
+
+    def swap_delta(self, i, j):
+        """Change of length if the cities at positions i and j trade places."""
+        n, t = self.n, self.tour
+        if i == j:
+            return 0.0
+
+        def at(k):
+            k %= n
+            return t[j] if k == i else t[i] if k == j else t[k]
+
+        # the (up to 4) edges that touch positions i or j, by their first position
+        starts = {(i - 1) % n, i, (j - 1) % n, j}
+        before = sum(self.dist(t[k], t[(k + 1) % n]) for k in starts)
+        after = sum(self.dist(at(k), at(k + 1)) for k in starts)
+        return after - before
+
+    def apply_swap(self, i, j, delta=None):
+        if delta is None:
+            delta = self.swap_delta(i, j)
+        t = self.tour
+        t[i], t[j] = t[j], t[i]
+        self.pos[t[i]], self.pos[t[j]] = i, j
+        self.length += delta
+
+    # ---- 2-opt ----
+
+    def two_opt_delta(self, a, b, c, d):
+        """Change of length for: remove edges a-b and c-d, add a-c and b-d."""
+        return self.dist(a, c) + self.dist(b, d) - self.dist(a, b) - self.dist(c, d)
+
+    def apply_two_opt(self, a, b, c, d, delta=None):
+        """
+        Remove tour edges a-b and c-d, add a-c and b-d. The edges must run
+        the same way round the tour: b = next(a) and d = next(c), or
+        b = prev(a) and d = prev(c).
+        """
+        if delta is None:
+            delta = self.two_opt_delta(a, b, c, d)
+        if self.next(a) == b:
+            self._reverse(self.pos[b], self.pos[c])
+        else:
+            self._reverse(self.pos[a], self.pos[d])
+        self.length += delta
+
+    def _reverse(self, i, j):
+        """Reverse the run of positions i, i+1, ..., j (going round the end if needed)."""
+        n, t, pos = self.n, self.tour, self.pos
+        size = (j - i) % n + 1
+        if 2 * size > n:
+            # reversing the rest of the tour gives the same cycle, read backwards
+            i, j = (j + 1) % n, (i - 1) % n
+            size = n - size
+        if i <= j:
+            t[i:j + 1] = t[i:j + 1][::-1]
+            for k in range(i, j + 1):
+                pos[t[k]] = k
+        else:
+            for step in range(size // 2):
+                p, q = (i + step) % n, (j - step) % n
+                t[p], t[q] = t[q], t[p]
+                pos[t[p]], pos[t[q]] = p, q
+
+    # ---- or-opt ----
+
+    def segment(self, first, size):
+        """(previous city, last city, next city) of the run of `size` cities from `first`."""
+        last = self.tour[(self.pos[first] + size - 1) % self.n]
+        return self.prev(first), last, self.next(last)
+
+    def or_opt_delta(self, first, size, x, y, reverse=False):
+        """
+        Change of length for moving the run of `size` cities starting at
+        `first` between x and y = next(x) (x, y outside the run), reversed
+        or not.
+        """
+        p, last, nx = self.segment(first, size)
+        removed = self.dist(p, first) + self.dist(last, nx) + self.dist(x, y)
+        if reverse:
+            added = self.dist(p, nx) + self.dist(x, last) + self.dist(first, y)
+        else:
+            added = self.dist(p, nx) + self.dist(x, first) + self.dist(last, y)
+        return added - removed
+
+    def apply_or_opt(self, first, size, x, y, reverse=False, delta=None):
+        if delta is None:
+            delta = self.or_opt_delta(first, size, x, y, reverse)
+        p, last, nx = self.segment(first, size)
+        # three 2-opt moves (their deltas add up to `delta`):
+        #   p first..last nx .. x y  ->  p x .. nx last..first y  ->
+        #   p nx .. x last..first y  ->  (not reversed) p nx .. x first..last y
+        self.apply_two_opt(p, first, x, y, 0.0)
+        if nx != x:
+            self.apply_two_opt(p, x, nx, last, 0.0)
+        if not reverse:
+            self.apply_two_opt(x, last, first, y, 0.0)
+        self.length += delta
+
+
+def strip_tour(points):
+    """
+    Quick starting tour: cut the plane into horizontal strips and go along
+    them left-right, right-left, ... (about 25% longer than the best tour on
+    uniform points, instead of ~n/4 times longer for a random order).
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    strips = max(1, int(math.sqrt(n / 2)))
+    y = points[:, 1]
+    band = np.minimum(((y - y.min()) / (np.ptp(y) or 1) * strips).astype(int), strips - 1)
+    x = np.where(band % 2 == 0, points[:, 0], -points[:, 0])
+    return np.lexsort((x, band))
+
+
+def _k_nearest(points, cities, candidates, k):
+    """
+    For every city: the k nearest of its row of `candidates` (itself left
+    out) -> (ids, squared distances), nearest first. Computed in slices so
+    the distance matrix stays small.
+    """
+    ids = np.empty((len(cities), k), dtype=int)
+    dist2 = np.empty((len(cities), k))
+    step = max(1, 2**20 // candidates.shape[1])
+    for s in range(0, len(cities), step):
+        rows, cand = cities[s:s + step], candidates[s:s + step]
+        d2 = ((points[rows][:, None, :] - points[cand])**2).sum(axis=2)
+        d2[cand == rows[:, None]] = np.inf
+        nearest = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        near_d2 = np.take_along_axis(d2, nearest, axis=1)
+        order = np.argsort(near_d2, axis=1)
+        ids[s:s + step] = np.take_along_axis(cand, np.take_along_axis(nearest, order, axis=1),
+                                             axis=1)
+        dist2[s:s + step] = np.take_along_axis(near_d2, order, axis=1)
+    return ids, dist2
+
+
+def candidate_lists(points, k=8):
+    """
+    neighbors[c] = the k cities nearest to city c, nearest first.
+    Points are bucketed into a grid of cells holding ~k points each; the
+    candidates of a city come from its own and the 8 surrounding cells
+    (the search widens, doubling, for the few cities where that is not
+    enough).
+    A crowded cell (clustered points) is first solved on its own, on a
+    finer grid.
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    k = min(k, n - 1)
+    if n <= 2000:
+        d2 = ((points[:, None, :] - points[None, :, :])**2).sum(axis=2)
+        np.fill_diagonal(d2, np.inf)
+        nearest = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(d2, nearest, axis=1), axis=1)
+        return np.take_along_axis(nearest, order, axis=1).tolist()
+
+    low = points.min(axis=0)
+    width, height = np.ptp(points, axis=0)
+    if width == height == 0:
+        # all points in one spot: any k others are nearest
+        return [[(c + s) % n for s in range(1, k + 1)] for c in range(n)]
+    # ~n/k cells: square cells over the box, but on a line or a strip thinner
+    # than that the cells are one row along the long side
+    cell = math.sqrt(width * height * k / n)
+    cell = max(cell, max(width, height) * k / n)
+    cx, cy = ((points - low) // cell).astype(int).T
+    last_x, last_y = int(cx.max()), int(cy.max())
+    by_cell = {}
+    for city, key in enumerate(zip(cx.tolist(), cy.tolist())):
+        by_cell.setdefault(key, []).append(city)
+
+    neighbors = np.empty((n, k), dtype=int)
+    for (gx, gy), members in by_cell.items():
+        members = np.array(members)
+        inner = None
+        if len(members) > 64 * k:
+            # nearest inside the cell; final for the cities whose k-th is
+            # nearer than the cell's border (no outside point can beat it)
+            inner = members[np.array(candidate_lists(points[members], k))]
+            inner_d2 = ((points[inner] - points[members][:, None, :])**2).sum(axis=2)
+            x, y = ((points[members] - low) / cell - (gx, gy)).T
+            border = np.full(len(members), np.inf)
+            for side, outside in ((x, gx > 0), (1 - x, gx < last_x),
+                                  (y, gy > 0), (1 - y, gy < last_y)):
+                if outside:
+                    border = np.minimum(border, side)
+            done = inner_d2[:, -1] <= (border * cell)**2
+            neighbors[members[done]] = inner[done]
+            members, inner = members[~done], inner[~done]
+            if not len(members):
+                continue
+
+        ring = 1
+        while True:
+            block = np.array([c for ix in range(max(gx - ring, 0), min(gx + ring, last_x) + 1)
+                              for iy in range(max(gy - ring, 0), min(gy + ring, last_y) + 1)
+                              if inner is None or (ix, iy) != (gx, gy)
+                              for c in by_cell.get((ix, iy), ())], dtype=int)
+            candidates = np.broadcast_to(block, (len(members), len(block)))
+            if inner is not None:
+                candidates = np.hstack((inner, candidates))
+            if candidates.shape[1] > k:
+                ids, d2 = _k_nearest(points, members, candidates, k)
+                # anything outside the block is at least ring * cell away
+                if d2[:, -1].max() <= (ring * cell)**2 or ring >= max(last_x, last_y):
+                    neighbors[members] = ids
+                    break
+            ring *= 2
+    return neighbors.tolist()
+
+
+def tour_local_search(tour, neighbors, or_opt=True, max_moves=None):
+    """
+    Improve `tour` in place with 2-opt and (or_opt=True) or-opt moves,
+    looking only at moves that connect a city to one of its candidate
+    `neighbors`. Cities whose surroundings did not change are skipped
+    ("don't-look bits"): a queue holds the cities worth looking at again.
+    Returns the number of improving moves made.
+    """
+    queue = deque(tour.tour)
+    queued = [True] * tour.n
+    moves = 0
+    dist = tour.dist
+
+    def wake(*cities):
+        for city in cities:
+            if not queued[city]:
+                queued[city] = True
+                queue.append(city)
+
+    while queue and (max_moves is None or moves < max_moves):
+        a = queue.popleft()
+        queued[a] = False
+        improved = False
+
+        # 2-opt: replace a-b by a-c, with b the next (or previous) city of a
+        for succ in (True, False):
+            b = tour.next(a) if succ else tour.prev(a)
+            d_ab = dist(a, b)
+            for c in neighbors[a]:
+                d_ac = dist(a, c)
+                if d_ac >= d_ab:
+                    break   # candidates are sorted: no later one can gain either
+                d = tour.next(c) if succ else tour.prev(c)
+                if c == b or d == a:
+                    continue
+                delta = d_ac + dist(b, d) - d_ab - dist(c, d)
+                if delta < -1e-10:
+                    if succ:
+                        tour.apply_two_opt(a, b, c, d, delta)
+                    else:
+                        tour.apply_two_opt(b, a, d, c, delta)
+                    wake(a, b, c, d)
+                    improved = True
+                    break
+            if improved:
+                break
+
+        # or-opt: move the run of 1-3 cities starting at a next to a candidate
+        if or_opt and not improved:
+            for size in (1, 2, 3):
+                if size + 3 > tour.n:
+                    break
+                p, last, nx = tour.segment(a, size)
+                gain = dist(p, a) + dist(last, nx) - dist(p, nx)
+                if gain <= 1e-10:
+                    continue
+                run = set(tour.tour[(tour.pos[a] + s) % tour.n] for s in range(size))
+                # one end of the run goes next to a candidate c of that end
+                for end, other in ((a, last), (last, a)):
+                    for c in neighbors[end]:
+                        d_end = dist(end, c)
+                        if d_end >= gain:
+                            break   # inserting costs more than taking the run out saves
+                        if c in run:
+                            continue
+                        for x, y in ((c, tour.next(c)), (tour.prev(c), c)):
+                            if x in run or y in run:
+                                continue
+                            far = y if c == x else x
+                            delta = d_end + dist(other, far) - dist(x, y) - gain
+                            if delta < -1e-10:
+                                # not reversed when x-a ... last-y
+                                reverse = (end == a) != (c == x)
+                                tour.apply_or_opt(a, size, x, y, reverse, delta)
+                                wake(p, nx, x, y, a, last)
+                                improved = True
+                                break
+                        if improved:
+                            break
+                    if improved:
+                        break
+                if improved:
+                    break
+
+        if improved:
+            moves += 1
+            wake(a)
+    return moves
+
+
+class QueenBoard:
+    """
+    n queens, one per row and column: the queen of row r is in column
+    perm[r], so only diagonals can clash. cost() = attacking pairs,
+    kept up to date from per-diagonal queen counts.
+    """
+
+    def __init__(self, perm):
+        self.perm = [int(c) for c in perm]
+        self.n = n = len(self.perm)
+        self.down = [0] * (2 * n - 1)    # r + c
+        self.up = [0] * (2 * n - 1)      # r - c + n - 1
+        for r, c in enumerate(self.perm):
+            self.down[r + c] += 1
+            self.up[r - c + n - 1] += 1
+        self.attacks = sum(k * (k - 1) // 2 for k in self.down + self.up)
+
+    def cost(self):
+        return self.attacks
+
+    def attacked(self, r):
+        """True if the queen of row r shares a diagonal with another queen."""
+        c = self.perm[r]
+        return self.down[r + c] > 1 or self.up[r - c + self.n - 1] > 1
+
+    def attacked_pair(self, rng, tries=100):
+        """
+        A swap for swap_hill_climbing / swap_annealing(pairs=...): an
+        attacked row (found by sampling rows; O(1) while many are attacked)
+        and a random row.
+        """
+        for _ in range(tries):
+            i = rng.randrange(self.n)
+            if self.attacked(i):
+                break
+        return i, rng.randrange(self.n)
+
+    def _move(self, r, c, sign):
+        """Take the queen at (r, c) off (sign -1) or put it on (+1); returns the change."""
+        d, u = r + c, r - c + self.n - 1
+        if sign < 0:
+            self.down[d] -= 1
+            self.up[u] -= 1
+            return -(self.down[d] + self.up[u])
+        self.down[d] += 1
+        self.up[u] += 1
+        return self.down[d] - 1 + self.up[u] - 1
+
+    def swap_delta(self, i, j):
+        """Change of attacking pairs if rows i and j exchange columns."""
+        ci, cj = self.perm[i], self.perm[j]
+        delta = self._move(i, ci, -1) + self._move(j, cj, -1)
+        delta += self._move(i, cj, +1) + self._move(j, ci, +1)
+        # put the board back
+        self._move(i, cj, -1), self._move(j, ci, -1)
+        self._move(i, ci, +1), self._move(j, cj, +1)
+        return delta
+
+    def apply_swap(self, i, j, delta=None):
+        ci, cj = self.perm[i], self.perm[j]
+        change = self._move(i, ci, -1) + self._move(j, cj, -1)
+        change += self._move(i, cj, +1) + self._move(j, ci, +1)
+        self.perm[i], self.perm[j] = cj, ci
+        self.attacks += change
+
+
+class Assignment:
+    """Worker i does job perm[i]; cost() = sum of C[i, perm[i]]."""
+
+    def __init__(self, costs, perm):
+        self.costs = np.asarray(costs, dtype=float).tolist()
+        self.perm = [int(j) for j in perm]
+        self.n = len(self.perm)
+        self.total = sum(self.costs[i][j] for i, j in enumerate(self.perm))
+
+    def cost(self):
+        return self.total
+
+    def swap_delta(self, i, j):
+        C, p = self.costs, self.perm
+        return C[i][p[j]] + C[j][p[i]] - C[i][p[i]] - C[j][p[j]]
+
+    def apply_swap(self, i, j, delta=None):
+        if delta is None:
+            delta = self.swap_delta(i, j)
+        self.perm[i], self.perm[j] = self.perm[j], self.perm[i]
+        self.total += delta
+
+
+def swap_hill_climbing(problem, iterations=10000, rng=random, pairs=None, target=None):
+    """
+    hill.py on a permutation: try a random swap, keep it if the cost drops.
+    pairs  : optional function rng -> (i, j) to choose swaps (e.g. from
+             candidate lists); default: two random positions
+    target : stop once cost() <= target
+    Returns the number of swaps tried.
+    """
+    n = problem.n
+    for step in range(1, iterations + 1):
+        i, j = pairs(rng) if pairs else (rng.randrange(n), rng.randrange(n))
+        delta = problem.swap_delta(i, j)
+        if delta < 0:
+            problem.apply_swap(i, j, delta)
+            if target is not None and problem.cost() <= target:
+                return step
+    return iterations
+
+
+def swap_annealing(problem, iterations=100000, initial_temp=1.0, final_temp=0.001,
+                   rng=random, pairs=None, target=None):
+    """
+    simulated.py on a permutation: random swaps, worse ones accepted with
+    probability exp(-delta / T), T cooled geometrically from initial_temp
+    to final_temp over the iterations. The best permutation is NOT copied
+    (that would be O(n) per improvement): the final state is returned as is.
+    Returns the number of swaps tried.
+    """
+    n = problem.n
+    temperature = initial_temp
+    rate = (final_temp / initial_temp) ** (1 / max(iterations, 1))
+    for step in range(1, iterations + 1):
+        i, j = pairs(rng) if pairs else (rng.randrange(n), rng.randrange(n))
+        delta = problem.swap_delta(i, j)
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            problem.apply_swap(i, j, delta)
+            if target is not None and problem.cost() <= target:
+                return step
+        temperature *= rate
+    return iterations
+
+
+# ---- Example run ----
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    points = rng.random((2000, 2))
+    tour = Tour(points, strip_tour(points))
+    start = tour.length
+    t0 = time.perf_counter()
+    neighbors = candidate_lists(points, k=8)
+    moves = tour_local_search(tour, neighbors)
+    print(f"2000-city tour: {start:.3f} -> {tour.length:.3f} with {moves} moves "
+          f"in {time.perf_counter() - t0:.2f} s (recomputed: {tour.full_length():.3f})")
+
+    random.seed(1)
+    board = QueenBoard(random.sample(range(8), 8))
+    tried = swap_annealing(board, 20000, initial_temp=2.0, target=0)
+    print(f"8 queens: {board.cost()} attacking pairs after {tried} swaps, columns {board.perm}")
@@ -0,0 +1,24 @@
+import importlib.util
+import os
+
+# 🔹 The algorithm scripts live in folders with spaces in their names
+#    ("A star", "greedy best first search", ...), so they cannot be
+#    imported with a normal `import`. This loads one straight from its path.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_script(relative_path):
+    """
+    Load a script from this folder as a module, e.g.
+        bfs = load_script("Bfs/bfs.py")
+        bfs.bfs_shortest_path('A', 'F')
+    The example run at the bottom of each script is skipped
+    (it sits under `if __name__ == "__main__":`).
+    """
+    path = os.path.join(HERE, relative_path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,57 @@
+import time
+
+# 🔹 Opt-in search instrumentation
+#
+# Every search takes `stats=None`. Pass a dict instead and, when the
+# search returns, it holds (on top of any search-specific counts):
+#   generated      successors produced while expanding nodes
+#   expanded       nodes whose successors were generated
+#   peak_frontier  largest size of the queue / stack / heap
+#   peak_visited   largest size of the visited set / parent map / g table
+#   reexpansions   expansions of a node that was already expanded before
+#                  in the same call (0 for BFS; IDDFS repeats whole levels)
+#   seconds        wall time of the call
+#
+#     stats = {}
+#     path = bfs_shortest_path('A', 'F', graph, stats=stats)
+#     print(stats['expanded'], stats['peak_frontier'], stats['seconds'])
+#
+# With stats=None (the default) nothing is counted.
+
+STAT_KEYS = ("generated", "expanded", "peak_frontier", "peak_visited",
+             "reexpansions", "seconds")
+
+
+class SearchStats:
+    """The counters of one search call; report() copies them into the caller's dict."""
+
+    def __init__(self):
+        self.generated = 0
+        self.expanded = 0
+        self.peak_frontier = 0
+        self.peak_visited = 0
+        self.reexpansions = 0
+        self.expanded_nodes = set()
+        self.start = time.perf_counter()
+
+    def expand(self, node, generated):
+        """node was expanded and `generated` successors came out of it."""
+        self.expanded += 1
+        self.generated += generated
+        if node in self.expanded_nodes:
+            self.reexpansions += 1
+        else:
+            self.expanded_nodes.add(node)
+
+    def observe(self, frontier, visited):
+        """Current frontier / visited sizes (keeps the peaks)."""
+        if frontier > self.peak_frontier:
+            self.peak_frontier = frontier
+        if visited > self.peak_visited:
+            self.peak_visited = visited
+
+    def report(self, stats):
+        stats.update(generated=self.generated, expanded=self.expanded,
+                     peak_frontier=self.peak_frontier, peak_visited=self.peak_visited,
+                     reexpansions=self.reexpansions,
+                     seconds=time.perf_counter() - self.start)
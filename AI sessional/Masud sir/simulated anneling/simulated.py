@@ -7,9 +7,10 @@ def objective_function(x):
 def get_neighbor(x):
     return x + random.uniform(-1, 1)
 
-def simulated_annealing(initial_temp=100, cooling_rate=0.95, iterations=1000):
+def simulated_annealing(initial_temp=100, cooling_rate=0.95, iterations=1000,
+                        objective=objective_function):
     current_solution = random.uniform(0, 10)
-    current_value = objective_function(current_solution)
+    current_value = objective(current_solution)
     temperature = initial_temp
     
     best_solution = current_solution
@@ -17,7 +18,7 @@ def simulated_annealing(initial_temp=100, cooling_rate=0.95, iterations=1000):
 
     for i in range(iterations):
         neighbor = get_neighbor(current_solution)
-        neighbor_value = objective_function(neighbor)
+        neighbor_value = objective(neighbor)
         
         delta = neighbor_value - current_value
         
@@ -40,7 +41,134 @@ def simulated_annealing(initial_temp=100, cooling_rate=0.95, iterations=1000):
 
     return best_solution, best_value
 
+
+# 🔹 Adaptive cooling
+#    The fixed schedule above (T *= 0.95 from 100) drops below 0.0001 after
+#    ~270 of the 1000 iterations and stops, whatever the objective looks
+#    like. Here the schedule is fitted to the budget and to what the
+#    search actually sees:
+#      initial_temp=None  estimated from sampled moves: the T at which a
+#                         typical downhill move is accepted with chance 0.8
+#      "geometric"        T *= rate, rate chosen to reach final_temp at the end
+#      "lundy_mees"       T = T / (1 + beta * T), same end point
+#      "target"           every `window` moves the acceptance rate is
+#                         measured and T nudged towards a target rate that
+#                         falls from target_start to target_end
+#    Reheating: after `patience` moves without a new best, go back to the
+#    best solution and multiply T by `reheat`; after `max_reheats` of those
+#    the search is frozen and stops (the rest of the budget is not spent).
+#    sampler / start / neighbor_of replace the random x in [0, 10] and the
+#    +-1 move, for other search spaces.
+
+def estimate_initial_temp(objective=objective_function, samples=20, accept=0.8,
+                          sampler=None, neighbor_of=get_neighbor):
+    """
+    (T0, evaluations used): downhill moves are accepted with chance `accept` at T0.
+    sampler : function () -> a random point to sample moves from
+              (default: uniform in [0, 10])
+    """
+    drops = []
+    for _ in range(samples):
+        x = sampler() if sampler is not None else random.uniform(0, 10)
+        delta = objective(neighbor_of(x)) - objective(x)
+        if delta < 0:
+            drops.append(-delta)
+    if not drops:
+        return 1.0, 2 * samples
+    return sum(drops) / len(drops) / -math.log(accept), 2 * samples
+
+
+def adaptive_simulated_annealing(iterations=1000, objective=objective_function,
+                                 schedule="target", initial_temp=None, final_temp=0.001,
+                                 target_start=0.5, target_end=0.02, window=50,
+                                 patience=150, reheat=5.0, max_reheats=2, stats=None,
+                                 start=None, sampler=None, neighbor_of=get_neighbor,
+                                 rng=random):
+    """
+    Simulated annealing with the schedules above. Returns (best x, best f(x)).
+    iterations=0 evaluates the start point only.
+    start   : first x (default: sampler(), or random in [0, 10])
+    sampler : random points for estimate_initial_temp and the default start
+    rng     : random.Random for the acceptance test (default: the random module)
+    stats : optional dict, filled with evaluations, initial_temp, reheats,
+            stopped ("iterations" or "frozen") and telemetry: one entry per
+            window {step, temperature, acceptance, value, best, reheats}
+    """
+    if schedule not in ("geometric", "lundy_mees", "target"):
+        raise ValueError(f"unknown schedule {schedule!r}")
+    if iterations < 0:
+        raise ValueError(f"iterations must be >= 0, got {iterations}")
+    evaluations = 0
+    if initial_temp is None:
+        initial_temp, evaluations = estimate_initial_temp(objective, sampler=sampler,
+                                                          neighbor_of=neighbor_of)
+    final_temp = min(final_temp, initial_temp)
+    # both reach final_temp after `iterations` moves (none to make: any value)
+    rate = (final_temp / initial_temp) ** (1 / max(iterations, 1))
+    beta = (initial_temp - final_temp) / (max(iterations, 1) * initial_temp * final_temp)
+
+    if start is not None:
+        current_solution = start
+    else:
+        current_solution = sampler() if sampler is not None else rng.uniform(0, 10)
+    current_value = objective(current_solution)
+    evaluations += 1
+    best_solution, best_value = current_solution, current_value
+    temperature = initial_temp
+    accepted = stale = reheats = 0
+    telemetry = []
+    stopped = "iterations"
+
+    for i in range(1, iterations + 1):
+        neighbor = neighbor_of(current_solution)
+        neighbor_value = objective(neighbor)
+        evaluations += 1
+        delta = neighbor_value - current_value
+        if delta > 0 or rng.random() < math.exp(delta / temperature):
+            current_solution, current_value = neighbor, neighbor_value
+            accepted += 1
+
+        if current_value > best_value:
+            best_solution, best_value = current_solution, current_value
+            stale = 0
+        else:
+            stale += 1
+
+        if schedule == "geometric":
+            temperature *= rate
+        elif schedule == "lundy_mees":
+            temperature /= 1 + beta * temperature
+
+        if i % window == 0:
+            acceptance = accepted / window
+            if schedule == "target":
+                target = target_start * (target_end / target_start) ** (i / iterations)
+                temperature *= math.exp(2 * (target - acceptance))
+            telemetry.append({"step": i, "temperature": temperature, "acceptance": acceptance,
+                              "value": current_value, "best": best_value, "reheats": reheats})
+            accepted = 0
+
+        if stale >= patience:
+            if reheats == max_reheats:
+                stopped = "frozen"
+                break
+            reheats += 1
+            stale = 0
+            current_solution, current_value = best_solution, best_value
+            temperature = min(initial_temp, temperature * reheat)
+
+    if stats is not None:
+        stats.update(evaluations=evaluations, initial_temp=initial_temp, reheats=reheats,
+                     stopped=stopped, telemetry=telemetry)
+    return best_solution, best_value
+
 # Run SA
-best_x_sa, best_fx_sa = simulated_annealing()
-print("Simulated Annealing Result:")
-print(f"x = {best_x_sa:.4f}, f(x) = {best_fx_sa:.4f}")
+if __name__ == "__main__":
+    best_x_sa, best_fx_sa = simulated_annealing()
+    print("Simulated Annealing Result:")
+    print(f"x = {best_x_sa:.4f}, f(x) = {best_fx_sa:.4f}")
+    stats = {}
+    best_x_sa, best_fx_sa = adaptive_simulated_annealing(stats=stats)
+    print(f"Adaptive (target acceptance): x = {best_x_sa:.4f}, f(x) = {best_fx_sa:.4f}, "
+          f"{stats['evaluations']} evaluations, T0 = {stats['initial_temp']:.3f}, "
+          f"stopped: {stats['stopped']}")
@@ -0,0 +1,151 @@
+import sys
+import time
+
+import numpy as np
+
+# 🔹 Many simulated-annealing chains at once (NumPy)
+#
+# simulated.py runs ONE chain on one float. For global optimization we
+# want hundreds of independent chains: here chain c is row c of an array
+# of shape (chains, dim), and each step moves, evaluates, accepts and
+# cools ALL chains with a few array operations, so 100 chains cost about
+# as much per step as one.
+#
+# parallel_tempering() keeps one chain per temperature of a fixed ladder
+# (cold ... hot) instead of cooling, and now and then swaps the states of
+# neighboring temperatures: good states found by the hot, freely moving
+# chains sink down to the cold chains, which refine them.
+
+
+def objective_function(x):
+    """-x^2 + 10x summed over the genes of every row (maximum at x = 5)."""
+    return np.sum(-x**2 + 10*x, axis=1)
+
+
+def _metropolis(rng, x, fx, temperature, objective, step):
+    """One move for every chain; returns (x, fx, accepted) with x, fx updated in place."""
+    proposal = x + rng.uniform(-step, step, x.shape)
+    value = objective(proposal)
+    delta = value - fx
+    # uphill always; downhill with probability exp(delta / T), as in simulated.py
+    accepted = (delta > 0) | (rng.random(len(x)) < np.exp(np.minimum(delta, 0) / temperature))
+    x[accepted] = proposal[accepted]
+    fx[accepted] = value[accepted]
+    return x, fx, accepted
+
+
+def simulated_annealing_np(chains=100, dim=1, initial_temp=100, cooling_rate=0.95,
+                           iterations=1000, min_temp=0.0001, step=1.0, low=0.0, high=10.0,
+                           objective=objective_function, seed=None):
+    """
+    `chains` independent simulated.simulated_annealing runs, vectorized.
+    initial_temp : one temperature, or one per chain
+    min_temp     : stop once every chain is colder than this (as in
+                   simulated.py); None = always run all iterations
+    objective    : maps an array (chains, dim) to one value per row (maximized)
+    Returns a report dict:
+        best, best_value              best state of all chains
+        chain_best, chain_best_value  best state / value of every chain
+        acceptance_rate               accepted moves / steps, per chain
+        steps, evaluations
+    """
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(low, high, (chains, dim))
+    fx = objective(x)
+    best, best_value = x.copy(), fx.copy()
+    temperature = np.full(chains, initial_temp, dtype=float)
+    accepted = np.zeros(chains)
+    steps = 0
+
+    for _ in range(iterations):
+        x, fx, moved = _metropolis(rng, x, fx, temperature, objective, step)
+        accepted += moved
+        steps += 1
+        improved = fx > best_value
+        best[improved] = x[improved]
+        best_value[improved] = fx[improved]
+
+        temperature *= cooling_rate
+        if min_temp is not None and temperature.max() < min_temp:
+            break
+
+    winner = int(np.argmax(best_value))
+    return {"best": best[winner].copy(), "best_value": float(best_value[winner]),
+            "chain_best": best, "chain_best_value": best_value,
+            "acceptance_rate": accepted / steps if steps else accepted,
+            "steps": steps, "evaluations": chains * (steps + 1)}
+
+
+def temperature_ladder(levels=16, t_min=0.01, t_max=100.0):
+    """Geometric temperatures from t_min (cold) to t_max (hot)."""
+    return np.geomspace(t_min, t_max, levels)
+
+
+def parallel_tempering(temperatures=None, dim=1, iterations=1000, swap_interval=1, step=1.0,
+                       low=0.0, high=10.0, objective=objective_function, seed=None):
+    """
+    Replica exchange: one chain per temperature (default temperature_ladder()),
+    each doing Metropolis moves at its fixed temperature. Every
+    `swap_interval` steps neighbors i, i+1 (even pairs, then odd pairs
+    next time) swap states with probability
+        min(1, exp((1/T_i - 1/T_{i+1}) * (f_{i+1} - f_i)))
+    Returns the report of simulated_annealing_np (chain = temperature
+    level) plus `temperatures` and `swap_rate` (accepted / tried swaps
+    for each neighboring pair).
+    """
+    temperatures = np.asarray(temperature_ladder() if temperatures is None else temperatures,
+                              dtype=float)
+    levels = len(temperatures)
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(low, high, (levels, dim))
+    fx = objective(x)
+    best, best_value = x.copy(), fx.copy()
+    accepted = np.zeros(levels)
+    swaps_tried = np.zeros(max(levels - 1, 0))
+    swaps_done = np.zeros(max(levels - 1, 0))
+    parity = 0
+
+    for steps in range(1, iterations + 1):
+        x, fx, moved = _metropolis(rng, x, fx, temperatures, objective, step)
+        accepted += moved
+
+        if levels > 1 and steps % swap_interval == 0:
+            i = np.arange(parity, levels - 1, 2)   # pairs (i, i + 1) that don't overlap
+            j = i + 1
+            log_p = (1 / temperatures[i] - 1 / temperatures[j]) * (fx[j] - fx[i])
+            swap = np.log(rng.random(len(i))) < log_p
+            a, b = i[swap], j[swap]
+            x[a], x[b] = x[b], x[a]   # fancy indexing copies: a real swap
+            fx[a], fx[b] = fx[b], fx[a]
+            swaps_tried[i] += 1
+            swaps_done[i] += swap
+            parity = 1 - parity
+
+        improved = fx > best_value
+        best[improved] = x[improved]
+        best_value[improved] = fx[improved]
+
+    winner = int(np.argmax(best_value))
+    return {"best": best[winner].copy(), "best_value": float(best_value[winner]),
+            "chain_best": best, "chain_best_value": best_value,
+            "acceptance_rate": accepted / max(iterations, 1),
+            "steps": iterations, "evaluations": levels * (iterations + 1),
+            "temperatures": temperatures,
+            "swap_rate": np.divide(swaps_done, swaps_tried, out=np.zeros_like(swaps_done),
+                                   where=swaps_tried > 0)}
+
+
+# ---- Example run ----
+#   python simulated_numpy.py [chains]
+if __name__ == "__main__":
+    chains = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    t0 = time.perf_counter()
+    report = simulated_annealing_np(chains, seed=0)
+    print(f"{chains} SA chains, {report['steps']} steps in {time.perf_counter() - t0:.3f} s: "
+          f"x = {report['best'][0]:.4f}, f(x) = {report['best_value']:.4f}, "
+          f"mean acceptance {report['acceptance_rate'].mean():.2f}")
+
+    report = parallel_tempering(seed=0)
+    print(f"Parallel tempering, {len(report['temperatures'])} temperatures: "
+          f"x = {report['best'][0]:.4f}, f(x) = {report['best_value']:.4f}")
+    print("  swap rates:", np.round(report["swap_rate"], 2))
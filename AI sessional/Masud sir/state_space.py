@@ -0,0 +1,161 @@
+# 🔹 Implicit state spaces (8-puzzle, planning, ...)
+#
+# The searches expect a `graph` they can ask: graph[node] / graph.get(node).
+# For puzzles the graph is far too big to write down, so StateSpace
+# produces the neighbors on demand from a successor function.
+#
+# States can also be packed (e.g. a board tuple -> one int, or bytes), so
+# the visited sets / parent maps inside the searches only hold the small
+# packed codes instead of full state objects.
+
+
+class StateSpace:
+    """
+    Graph-like wrapper around a successor function.
+
+    successors(state) -> iterable of next states
+                         (or (next_state, cost) pairs if costs=True)
+    encode / decode   -> optional packing: state -> compact code and back.
+                         When given, the searches see only codes:
+                             start = space.encode(board)
+                             path  = space.decode_path(bfs_shortest_path(start, goal, space))
+    heuristic(state)  -> optional estimate to the goal; use `space.h` as
+                         the `h` argument of a_star_search / greedy search
+    """
+
+    def __init__(self, successors, encode=None, decode=None, heuristic=None, costs=False):
+        self.successors = successors
+        self.encode = encode or (lambda state: state)
+        self.decode = decode or (lambda code: code)
+        self.costs = costs
+        self.h = Heuristic(heuristic, self.decode) if heuristic else None
+
+    def weighted_neighbors(self, code):
+        """(neighbor code, cost) pairs, generated on demand."""
+        encode = self.encode
+        nexts = self.successors(self.decode(code))
+        if self.costs:
+            return [(encode(s), cost) for s, cost in nexts]
+        return [(encode(s), 1) for s in nexts]
+
+    def __getitem__(self, code):
+        return [v for v, _ in self.weighted_neighbors(code)]
+
+    def get(self, code, default=None):
+        return self[code]
+
+    def __contains__(self, code):
+        return True   # every state exists; we just haven't generated it yet
+
+    def decode_path(self, path):
+        if path is None:
+            return None
+        return [self.decode(code) for code in path]
+
+
+class Heuristic:
+    """Lets a heuristic function be used as h[node], like the h dicts."""
+
+    def __init__(self, func, decode=lambda code: code):
+        self.func = func
+        self.decode = decode
+
+    def __getitem__(self, code):
+        return self.func(self.decode(code))
+
+
+def as_graph(graph):
+    """A plain successor function can be passed wherever a graph is expected."""
+    return StateSpace(graph) if callable(graph) else graph
+
+
+def as_heuristic(h):
+    """A plain heuristic function can be passed wherever an h dict is expected."""
+    return Heuristic(h) if callable(h) else h
+
+
+# ---- packing helpers ----
+
+class TuplePacker:
+    """
+    Pack a tuple of small non-negative ints into ONE Python int,
+    `bits` bits per slot, e.g. an 8-puzzle board (9 slots x 4 bits).
+    """
+
+    def __init__(self, length, bits):
+        self.length = length
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+
+    def encode(self, state):
+        code = 0
+        for value in state:
+            code = (code << self.bits) | value
+        return code
+
+    def decode(self, code):
+        values = []
+        for _ in range(self.length):
+            values.append(code & self.mask)
+            code >>= self.bits
+        values.reverse()
+        return tuple(values)
+
+
+# (for tuples of values < 256, encode=bytes, decode=tuple also works)
+
+
+# ---- Example: 8-puzzle ----
+
+def puzzle_successors(board, width=3):
+    """Boards reachable by sliding one tile into the blank (0)."""
+    blank = board.index(0)
+    row, col = divmod(blank, width)
+    result = []
+    for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        r, c = row + dr, col + dc
+        if 0 <= r < width and 0 <= c < width:
+            other = r * width + c
+            cells = list(board)
+            cells[blank], cells[other] = cells[other], cells[blank]
+            result.append(tuple(cells))
+    return result
+
+
+def manhattan(board, goal, width=3):
+    """Sum of tile distances from their goal squares (blank not counted)."""
+    where = {tile: divmod(i, width) for i, tile in enumerate(goal)}
+    total = 0
+    for i, tile in enumerate(board):
+        if tile:
+            r, c = divmod(i, width)
+            gr, gc = where[tile]
+            total += abs(r - gr) + abs(c - gc)
+    return total
+
+
+if __name__ == "__main__":
+    from script_loader import load_script
+
+    bfs = load_script("Bfs/bfs.py")
+    a_star = load_script("A star/A_star.py")
+
+    start = (7, 2, 4,
+             5, 0, 6,
+             8, 3, 1)
+    goal = (1, 2, 3,
+            4, 5, 6,
+            7, 8, 0)
+
+    # plain successor function, states used as they are
+    path = bfs.bfs_shortest_path(start, goal, puzzle_successors)
+    print("BFS (successor function):", len(path) - 1, "moves")
+
+    # packed: every board is one int inside the search
+    packer = TuplePacker(9, 4)
+    space = StateSpace(puzzle_successors, packer.encode, packer.decode,
+                       heuristic=lambda board: manhattan(board, goal))
+    codes, cost = a_star.a_star_search(packer.encode(start), packer.encode(goal), space, space.h)
+    for board in space.decode_path(codes):
+        print(board)
+    print("A* (packed states, Manhattan h):", cost, "moves")